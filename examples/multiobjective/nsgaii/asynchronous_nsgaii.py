@@ -0,0 +1,38 @@
+from jmetal.algorithm.multiobjective.nsgaii import NSGAII
+from jmetal.algorithm.multiobjective.asynchronous_genetic_algorithm import AsynchronousGeneticAlgorithm
+from jmetal.operator import SBXCrossover, PolynomialMutation
+from jmetal.problem.multiobjective.zdt import ZDT1Modified
+from jmetal.util.solution import print_function_values_to_file, print_variables_to_file
+from jmetal.util.termination_criterion import StoppingByEvaluations
+
+"""
+Asynchronous (steady-state) version of NSGA-II using a process pool. Each offspring is integrated into the population
+as soon as its evaluation finishes and a new one is submitted immediately.
+"""
+if __name__ == '__main__':
+    problem = ZDT1Modified()
+
+    max_evaluations = 5000
+
+    algorithm = AsynchronousGeneticAlgorithm(
+        NSGAII(
+            problem=problem,
+            population_size=100,
+            offspring_population_size=1,
+            mutation=PolynomialMutation(probability=1.0 / problem.number_of_variables, distribution_index=20),
+            crossover=SBXCrossover(probability=1.0, distribution_index=20),
+            termination_criterion=StoppingByEvaluations(max_evaluations=max_evaluations)
+        ),
+        number_of_workers=8
+    )
+
+    algorithm.run()
+    front = algorithm.get_result()
+
+    # Save results to file
+    print_function_values_to_file(front, 'FUN.' + algorithm.label)
+    print_variables_to_file(front, 'VAR.' + algorithm.label)
+
+    print(f'Algorithm: {algorithm.get_name()}')
+    print(f'Problem: {problem.get_name()}')
+    print(f'Computing time: {algorithm.total_computing_time}')
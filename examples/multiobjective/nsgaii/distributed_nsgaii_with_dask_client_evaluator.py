@@ -0,0 +1,44 @@
+from dask.distributed import Client
+from distributed import LocalCluster
+
+from jmetal.algorithm.multiobjective.nsgaii import NSGAII
+from jmetal.operator import SBXCrossover, PolynomialMutation
+from jmetal.problem.multiobjective.zdt import ZDT1Modified
+from jmetal.util.evaluator import DaskEvaluator
+from jmetal.util.solution import print_function_values_to_file, print_variables_to_file
+from jmetal.util.termination_criterion import StoppingByEvaluations
+
+""" 
+Distributed (synchronous) version of NSGA-II using the futures interface of a Dask client. The problem is sent to the
+workers only once.
+"""
+if __name__ == '__main__':
+    problem = ZDT1Modified()
+
+    # setup Dask client
+    client = Client(LocalCluster(n_workers=8))
+
+    max_evaluations = 10000
+
+    algorithm = NSGAII(
+        problem=problem,
+        population_size=500,
+        offspring_population_size=500,
+        mutation=PolynomialMutation(probability=1.0 / problem.number_of_variables, distribution_index=20),
+        crossover=SBXCrossover(probability=1.0, distribution_index=20),
+        population_evaluator=DaskEvaluator(client=client),
+        termination_criterion=StoppingByEvaluations(max_evaluations=max_evaluations)
+    )
+
+    algorithm.run()
+    front = algorithm.get_result()
+
+    # Save results to file
+    print_function_values_to_file(front, 'FUN.' + algorithm.label)
+    print_variables_to_file(front, 'VAR.'+ algorithm.label)
+
+    print(f'Algorithm: ${algorithm.get_name()}')
+    print(f'Problem: ${problem.get_name()}')
+    print(f'Computing time: ${algorithm.total_computing_time}')
+
+    client.close()
@@ -1,3 +1,4 @@
+from .asynchronous_genetic_algorithm import AsynchronousGeneticAlgorithm
 from .gde3 import GDE3, DynamicGDE3
 from .hype import HYPE
 from .ibea import IBEA
@@ -0,0 +1,132 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import TypeVar, List
+
+from jmetal.algorithm.singleobjective.genetic_algorithm import GeneticAlgorithm
+from jmetal.core.algorithm import Algorithm
+from jmetal.util.ckecking import Check
+from jmetal.util.evaluator import install_problem, evaluate_with_installed_problem
+
+S = TypeVar('S')
+R = TypeVar('R')
+
+"""
+.. module:: asynchronous_genetic_algorithm
+   :platform: Unix, Windows
+   :synopsis: Asynchronous master-worker engine for steady-state multi-objective genetic algorithms.
+"""
+
+
+class AsynchronousGeneticAlgorithm(Algorithm[S, R]):
+
+    def __init__(self, algorithm: GeneticAlgorithm[S, R], number_of_workers: int = None, max_in_flight: int = None):
+        """ Asynchronous master-worker version of a steady-state genetic algorithm (e.g., NSGAII, SPEA2, IBEA or
+        MOCell with an offspring population size of 1).
+
+        The evaluations run on a :class:`concurrent.futures.ProcessPoolExecutor` whose workers receive the problem only
+        once. Up to `max_in_flight` offspring are being evaluated at any time; each of them is integrated into the
+        population with the replacement of the wrapped algorithm as soon as its evaluation finishes, and a new
+        offspring is created and submitted immediately, so there are no generation barriers and all the workers are
+        kept busy even if the evaluation times are heterogeneous.
+
+        The observers and the termination criterion of the wrapped algorithm are notified after every integrated
+        offspring, as in the synchronous version.
+
+        :param algorithm: Genetic algorithm with an offspring population size of 1.
+        :param number_of_workers: Number of worker processes.
+        :param max_in_flight: Maximum number of evaluations in flight (by default, the number of workers).
+        """
+        super(AsynchronousGeneticAlgorithm, self).__init__()
+        Check.that(algorithm.offspring_population_size == 1,
+                   'The asynchronous version requires an offspring population size of 1')
+
+        self.algorithm = algorithm
+        self.problem = algorithm.problem
+        self.number_of_workers = number_of_workers or os.cpu_count()
+        self.max_in_flight = max_in_flight or self.number_of_workers
+
+        self.observable = algorithm.observable
+
+    def create_initial_solutions(self) -> List[S]:
+        return self.algorithm.create_initial_solutions()
+
+    def evaluate(self, solution_list: List[S]) -> List[S]:
+        return self.algorithm.evaluate(solution_list)
+
+    def init_progress(self) -> None:
+        self.algorithm.init_progress()
+
+    def stopping_condition_is_met(self) -> bool:
+        return self.algorithm.stopping_condition_is_met()
+
+    def step(self) -> None:
+        pass
+
+    def update_progress(self) -> None:
+        self.algorithm.update_progress()
+
+    def get_observable_data(self) -> dict:
+        return self.algorithm.get_observable_data()
+
+    def run(self):
+        """ Execute the algorithm. """
+        self.start_computing_time = time.time()
+        self.algorithm.start_computing_time = self.start_computing_time
+
+        executor = ProcessPoolExecutor(self.number_of_workers, initializer=install_problem, initargs=(self.problem,))
+        in_flight = {}
+        try:
+            population = self.create_initial_solutions()
+            futures = {executor.submit(evaluate_with_installed_problem, solution): solution
+                       for solution in population}
+            self._receive(futures, wait(futures).done)
+
+            self.algorithm.solutions = population
+            self.init_progress()
+
+            while not self.stopping_condition_is_met():
+                while len(in_flight) < self.max_in_flight:
+                    offspring = self._create_offspring()
+                    in_flight[executor.submit(evaluate_with_installed_problem, offspring)] = offspring
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for offspring in self._receive(in_flight, done):
+                    self.algorithm.solutions = self.algorithm.replacement(self.algorithm.solutions, [offspring])
+                    self.update_progress()
+
+                    if self.stopping_condition_is_met():
+                        break
+        finally:
+            # The evaluations still in flight are not needed anymore (those already running are left to finish)
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        self.solutions = self.algorithm.solutions
+        self.total_computing_time = time.time() - self.start_computing_time
+        self.algorithm.total_computing_time = self.total_computing_time
+
+    def get_result(self) -> R:
+        return self.algorithm.get_result()
+
+    def get_name(self) -> str:
+        return 'Asynchronous ' + self.algorithm.get_name()
+
+    @property
+    def label(self) -> str:
+        return f'{self.get_name()}.{self.problem.get_name()}'
+
+    def _create_offspring(self) -> S:
+        mating_population = self.algorithm.selection(self.algorithm.solutions)
+        return self.algorithm.reproduction(mating_population)[0]
+
+    @staticmethod
+    def _receive(futures: dict, done: set) -> List[S]:
+        received = []
+        for future in done:
+            solution = futures.pop(future)
+            solution.objectives, solution.constraints = future.result()
+            received.append(solution)
+
+        return received
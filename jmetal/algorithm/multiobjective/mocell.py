@@ -1,5 +1,4 @@
 import copy
-from functools import cmp_to_key
 from typing import TypeVar, List
 
 from jmetal.algorithm.singleobjective.genetic_algorithm import GeneticAlgorithm
@@ -8,7 +7,7 @@ from jmetal.core.operator import Mutation, Crossover, Selection
 from jmetal.core.problem import Problem
 from jmetal.operator import BinaryTournamentSelection
 from jmetal.util.archive import BoundedArchive
-from jmetal.util.comparator import Comparator, MultiComparator
+from jmetal.util.comparator import Comparator, MultiComparator, sort_solutions
 from jmetal.util.density_estimator import CrowdingDistance, DensityEstimator
 from jmetal.util.evaluator import Evaluator
 from jmetal.util.generator import Generator
@@ -124,7 +123,7 @@ class MOCell(GeneticAlgorithm[S, R]):
             for i in range(ranking.get_number_of_subfronts()):
                 density_estimator.compute_density_estimator(ranking.get_subfront(i))
 
-            self.current_neighbors.sort(key=cmp_to_key(self.comparator.compare))
+            sort_solutions(self.current_neighbors, self.comparator)
             worst_solution = self.current_neighbors[-1]
 
             self.archive.add(new_individual)
@@ -15,9 +15,9 @@ from jmetal.core.problem import Problem, DynamicProblem
 from jmetal.operator import BinaryTournamentSelection
 from jmetal.util.density_estimator import CrowdingDistance
 from jmetal.util.evaluator import Evaluator
-from jmetal.util.ranking import FastNonDominatedRanking
+from jmetal.util.ranking import FastNonDominatedRanking, Ranking, IncrementalNonDominatedRanking
 from jmetal.util.replacement import RankingAndDensityEstimatorReplacement, RemovalPolicyType
-from jmetal.util.comparator import DominanceComparator, Comparator, MultiComparator
+from jmetal.util.comparator import DominanceComparator, Comparator, MultiComparator, DominanceCache
 from jmetal.util.termination_criterion import TerminationCriterion
 
 S = TypeVar('S')
@@ -46,7 +46,8 @@ class NSGAII(GeneticAlgorithm[S, R]):
                  termination_criterion: TerminationCriterion = store.default_termination_criteria,
                  population_generator: Generator = store.default_generator,
                  population_evaluator: Evaluator = store.default_evaluator,
-                 dominance_comparator: Comparator = store.default_comparator):
+                 dominance_comparator: Comparator = store.default_comparator,
+                 ranking: Ranking = None):
         """
         NSGA-II implementation as described in
 
@@ -65,6 +66,12 @@ class NSGAII(GeneticAlgorithm[S, R]):
         :param mutation: Mutation operator (see :py:mod:`jmetal.operator.mutation`).
         :param crossover: Crossover operator (see :py:mod:`jmetal.operator.crossover`).
         :param selection: Selection operator (see :py:mod:`jmetal.operator.selection`).
+        :param dominance_comparator: Dominance comparator of the ranking. A :class:`DominanceCache` is registered as an
+            observer, so it keeps the comparisons between the solutions of the population for the next generation; the
+            same instance can be given to the selection operator.
+        :param ranking: Non-dominated ranking of the replacement (by default, a :class:`FastNonDominatedRanking` with
+            the dominance comparator, or an :class:`IncrementalNonDominatedRanking` in the steady-state version). The
+            sorts of :py:mod:`jmetal.util.ranking` based on the objective matrix scale to much larger populations.
         """
         super(NSGAII, self).__init__(
             problem=problem,
@@ -78,6 +85,13 @@ class NSGAII(GeneticAlgorithm[S, R]):
             population_generator=population_generator
         )
         self.dominance_comparator = dominance_comparator
+        if isinstance(dominance_comparator, DominanceCache):
+            self.observable.register(dominance_comparator)
+
+        if ranking is None and offspring_population_size == 1:
+            # Kept across generations, so each replacement only inserts the offspring and removes the worst solution
+            ranking = IncrementalNonDominatedRanking(dominance_comparator)
+        self.ranking = ranking
 
     def replacement(self, population: List[S], offspring_population: List[S]) -> List[List[S]]:
         """ This method joins the current and offspring populations to produce the population of the next generation
@@ -87,7 +101,7 @@ class NSGAII(GeneticAlgorithm[S, R]):
         :param offspring_population: Offspring population.
         :return: New population after ranking and crowding distance selection is applied.
         """
-        ranking = FastNonDominatedRanking(self.dominance_comparator)
+        ranking = self.ranking if self.ranking is not None else FastNonDominatedRanking(self.dominance_comparator)
         density_estimator = CrowdingDistance()
 
         r = RankingAndDensityEstimatorReplacement(ranking, density_estimator, RemovalPolicyType.ONE_SHOT)
@@ -224,6 +238,9 @@ class DistributedNSGAII(Algorithm[S, R]):
 
         task_pool = as_completed([], with_results=True)
 
+        # The population changes in one solution per step, so the ranking is updated incrementally
+        ranking = IncrementalNonDominatedRanking(self.dominance_comparator)
+
         for _ in range(self.number_of_cores):
             new_solution = create_solution()
             new_evaluated_solution = evaluate_solution(new_solution)
@@ -260,7 +277,6 @@ class DistributedNSGAII(Algorithm[S, R]):
                 offspring_population = [received_solution]
 
                 # replacement
-                ranking = FastNonDominatedRanking(self.dominance_comparator)
                 density_estimator = CrowdingDistance()
 
                 r = RankingAndDensityEstimatorReplacement(ranking, density_estimator, RemovalPolicyType.ONE_SHOT)
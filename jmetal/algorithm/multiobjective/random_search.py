@@ -4,7 +4,7 @@ from typing import TypeVar, List
 from jmetal.config import store
 from jmetal.core.algorithm import Algorithm
 from jmetal.core.problem import Problem
-from jmetal.util.archive import NonDominatedSolutionsArchive
+from jmetal.util.archive import NDTreeArchive
 from jmetal.util.termination_criterion import TerminationCriterion
 
 S = TypeVar('S')
@@ -29,7 +29,7 @@ class RandomSearch(Algorithm[S, R]):
         self.termination_criterion = termination_criterion
         self.observable.register(termination_criterion)
 
-        self.archive = NonDominatedSolutionsArchive()
+        self.archive = NDTreeArchive()
 
     def get_observable_data(self) -> dict:
         ctime = time.time() - self.start_computing_time
@@ -63,7 +63,7 @@ class RandomSearch(Algorithm[S, R]):
         self.observable.notify_all(**observable_data)
 
     def get_result(self) -> List[S]:
-        return self.archive.solution_list
+        return list(self.archive.solution_list)
 
     def get_name(self) -> str:
         return 'Random Search'
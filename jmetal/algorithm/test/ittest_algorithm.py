@@ -2,6 +2,7 @@ import unittest
 
 from jmetal.algorithm.multiobjective.nsgaii import NSGAII
 from jmetal.algorithm.multiobjective.smpso import SMPSO
+from jmetal.algorithm.multiobjective.asynchronous_genetic_algorithm import AsynchronousGeneticAlgorithm
 from jmetal.core.quality_indicator import HyperVolume
 from jmetal.operator import PolynomialMutation, SBXCrossover
 from jmetal.problem import ZDT1
@@ -39,6 +40,19 @@ class RunningAlgorithmsTestCases(unittest.TestCase):
             termination_criterion=StoppingByEvaluations(max_evaluations=1000)
         ).run()
 
+    def test_AsynchronousNSGAII(self):
+        AsynchronousGeneticAlgorithm(
+            NSGAII(
+                problem=self.problem,
+                population_size=self.population_size,
+                offspring_population_size=1,
+                mutation=self.mutation,
+                crossover=self.crossover,
+                termination_criterion=StoppingByEvaluations(max_evaluations=1000)
+            ),
+            number_of_workers=2
+        ).run()
+
 
 class IntegrationTestCases(unittest.TestCase):
 
@@ -83,6 +97,29 @@ class IntegrationTestCases(unittest.TestCase):
 
         self.assertTrue(value >= 0.655)
 
+    def test_should_asynchronous_NSGAII_work_when_solving_problem_ZDT1_with_standard_settings(self):
+        problem = ZDT1()
+
+        algorithm = AsynchronousGeneticAlgorithm(
+            NSGAII(
+                problem=problem,
+                population_size=100,
+                offspring_population_size=1,
+                mutation=PolynomialMutation(probability=1.0 / problem.number_of_variables, distribution_index=20),
+                crossover=SBXCrossover(probability=1.0, distribution_index=20),
+                termination_criterion=StoppingByEvaluations(max_evaluations=25000)
+            ),
+            number_of_workers=4
+        )
+
+        algorithm.run()
+        front = algorithm.get_result()
+
+        hv = HyperVolume(reference_point=[1, 1])
+        value = hv.compute([front[i].objectives for i in range(len(front))])
+
+        self.assertTrue(value >= 0.65)
+
 
 if __name__ == '__main__':
     unittest.main()
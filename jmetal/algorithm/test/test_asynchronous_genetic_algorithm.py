@@ -0,0 +1,78 @@
+import unittest
+
+from jmetal.algorithm.multiobjective.asynchronous_genetic_algorithm import AsynchronousGeneticAlgorithm
+from jmetal.algorithm.multiobjective.nsgaii import NSGAII
+from jmetal.core.observer import Observer
+from jmetal.operator import PolynomialMutation, SBXCrossover
+from jmetal.problem import ZDT1
+from jmetal.util.ckecking import InvalidConditionException
+from jmetal.util.termination_criterion import StoppingByEvaluations
+
+
+class MockedCountingZDT1(ZDT1):
+
+    def __init__(self):
+        super(MockedCountingZDT1, self).__init__(number_of_variables=5)
+        self.number_of_evaluations = 0
+
+    def evaluate(self, solution):
+        self.number_of_evaluations += 1
+        return super(MockedCountingZDT1, self).evaluate(solution)
+
+
+class MockedObserver(Observer):
+
+    def __init__(self):
+        self.evaluations = []
+
+    def update(self, *args, **kwargs):
+        self.evaluations.append(kwargs['EVALUATIONS'])
+
+
+class AsynchronousGeneticAlgorithmTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = MockedCountingZDT1()
+
+    def create_nsgaii(self, offspring_population_size: int = 1, max_evaluations: int = 60) -> NSGAII:
+        return NSGAII(
+            problem=self.problem,
+            population_size=10,
+            offspring_population_size=offspring_population_size,
+            mutation=PolynomialMutation(probability=1.0 / self.problem.number_of_variables),
+            crossover=SBXCrossover(probability=1.0),
+            termination_criterion=StoppingByEvaluations(max_evaluations=max_evaluations)
+        )
+
+    def test_should_constructor_raise_an_exception_if_the_offspring_population_size_is_not_one(self):
+        with self.assertRaises(InvalidConditionException):
+            AsynchronousGeneticAlgorithm(self.create_nsgaii(offspring_population_size=2), number_of_workers=2)
+
+    def test_should_get_name_return_the_name_of_the_wrapped_algorithm(self):
+        algorithm = AsynchronousGeneticAlgorithm(self.create_nsgaii(), number_of_workers=2)
+
+        self.assertEqual('Asynchronous NSGAII', algorithm.get_name())
+
+    def test_should_run_integrate_one_offspring_at_a_time_until_the_termination_criterion_is_met(self):
+        algorithm = AsynchronousGeneticAlgorithm(self.create_nsgaii(), number_of_workers=2, max_in_flight=4)
+        observer = MockedObserver()
+        algorithm.observable.register(observer)
+
+        algorithm.run()
+
+        self.assertEqual(list(range(10, 61)), observer.evaluations)
+        self.assertEqual(10, len(algorithm.solutions))
+        self.assertIs(algorithm.algorithm.solutions, algorithm.solutions)
+
+    def test_should_the_solutions_be_evaluated_in_the_worker_processes(self):
+        algorithm = AsynchronousGeneticAlgorithm(self.create_nsgaii(), number_of_workers=2)
+
+        algorithm.run()
+
+        self.assertEqual(0, self.problem.number_of_evaluations)
+        for solution in algorithm.solutions:
+            self.assertEqual(solution.variables[0], solution.objectives[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -84,8 +84,21 @@ class Algorithm(Generic[S, R], threading.Thread, ABC):
             self.step()
             self.update_progress()
 
+        self.evaluate_surrogates()
+
         self.total_computing_time = time.time() - self.start_computing_time
 
+    def evaluate_surrogates(self) -> None:
+        """ Evaluate with the problem the solutions of the population and the result whose objectives were only
+        predicted by the evaluator of the algorithm (see :class:`jmetal.util.evaluator.SurrogateEvaluator`). """
+        for evaluator in (getattr(self, 'population_evaluator', None), getattr(self, 'swarm_evaluator', None)):
+            if hasattr(evaluator, 'evaluate_surrogates'):
+                evaluator.evaluate_surrogates(self.solutions, self.problem)
+
+                result = self.get_result()
+                if isinstance(result, list) and result is not self.solutions:
+                    evaluator.evaluate_surrogates(result, self.problem)
+
     @abstractmethod
     def get_result(self) -> R:
         pass
@@ -129,10 +142,16 @@ class EvolutionaryAlgorithm(Algorithm[S, R], ABC):
         pass
 
     def get_observable_data(self) -> dict:
-        return {'PROBLEM': self.problem,
-                'EVALUATIONS': self.evaluations,
-                'SOLUTIONS': self.get_result(),
-                'COMPUTING_TIME': time.time() - self.start_computing_time}
+        observable_data = {'PROBLEM': self.problem,
+                           'EVALUATIONS': self.evaluations,
+                           'SOLUTIONS': self.get_result(),
+                           'COMPUTING_TIME': time.time() - self.start_computing_time}
+
+        evaluator = getattr(self, 'population_evaluator', None)
+        if hasattr(evaluator, 'get_statistics'):
+            observable_data['EVALUATOR_STATISTICS'] = evaluator.get_statistics()
+
+        return observable_data
 
     def init_progress(self) -> None:
         self.evaluations = self.population_size
@@ -200,10 +219,16 @@ class ParticleSwarmOptimization(Algorithm[FloatSolution, List[FloatSolution]], A
         pass
 
     def get_observable_data(self) -> dict:
-        return {'PROBLEM': self.problem,
-                'EVALUATIONS': self.evaluations,
-                'SOLUTIONS': self.get_result(),
-                'COMPUTING_TIME': time.time() - self.start_computing_time}
+        observable_data = {'PROBLEM': self.problem,
+                           'EVALUATIONS': self.evaluations,
+                           'SOLUTIONS': self.get_result(),
+                           'COMPUTING_TIME': time.time() - self.start_computing_time}
+
+        evaluator = getattr(self, 'swarm_evaluator', None)
+        if hasattr(evaluator, 'get_statistics'):
+            observable_data['EVALUATOR_STATISTICS'] = evaluator.get_statistics()
+
+        return observable_data
 
     def init_progress(self) -> None:
         self.evaluations = self.swarm_size
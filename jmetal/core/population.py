@@ -0,0 +1,268 @@
+import copy
+import weakref
+from collections.abc import Sequence
+from typing import List, TypeVar, Generic, Union
+
+import numpy
+
+from jmetal.core.solution import FloatSolution, IntegerSolution
+from jmetal.util.ckecking import Check
+from jmetal.util.constraint_handling import overall_constraint_violation_degree
+
+S = TypeVar('S')
+
+"""
+.. module:: population
+   :platform: Unix, Windows
+   :synopsis: Array-backed population of solutions.
+"""
+
+
+class _ArrayRow(Sequence):
+    """ List-like proxy to one row of an array owned by a :class:`Population`. Reads and item assignments go straight
+    to the array; slicing, copying and pickling produce plain lists, so copies of a solution never keep a reference
+    to the whole population. """
+
+    __slots__ = ('_population', '_name', '_row')
+
+    def __init__(self, population: 'Population', name: str, row: int):
+        self._population = population
+        self._name = name
+        self._row = row
+
+    @property
+    def _data(self) -> numpy.ndarray:
+        return self._population._arrays[self._name][self._row]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._data[index].tolist()
+        return self._data[index]
+
+    def __setitem__(self, index, value):
+        self._data[index] = value
+
+    def __len__(self) -> int:
+        return self._data.shape[0]
+
+    def __iter__(self):
+        return iter(self._data.tolist())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (_ArrayRow, list, tuple, numpy.ndarray)):
+            return self.tolist() == list(other)
+        return False
+
+    def __array__(self, dtype=None, copy=None):
+        return numpy.asarray(self._data, dtype=dtype)
+
+    def __copy__(self):
+        return self.tolist()
+
+    def __deepcopy__(self, memo):
+        return self.tolist()
+
+    def __reduce__(self):
+        return list, (self.tolist(),)
+
+    def tolist(self) -> list:
+        return self._data.tolist()
+
+    def __str__(self) -> str:
+        return str(self.tolist())
+
+    __repr__ = __str__
+
+
+class Population(Sequence, Generic[S]):
+    """ Population storing the variables, objectives and constraints of its solutions as contiguous 2-D NumPy arrays
+    (one row per solution).
+
+    Indexing a population returns a regular :class:`FloatSolution` (or :class:`IntegerSolution`) whose `variables`,
+    `objectives` and `constraints` are views over the corresponding rows, so existing operators and problems can
+    work with it unchanged while rankings, density estimators and indicators read the matrices directly (see
+    :func:`objective_matrix`).
+
+    The views are only kept while they are referenced; their `attributes` are stored by the population, so they
+    survive when a view is created again. Item assignments (`solution.objectives[0] = ...`) write straight into the
+    arrays. A list assigned to a field of a view (`solution.objectives = [...]`) is copied into the arrays the next
+    time they are read, provided that the view has been obtained from the population after the previous read.
+
+    Example:
+
+    >>> population = Population.from_solutions([problem.create_solution() for _ in range(100)])
+    >>> evaluator.evaluate(population, problem)
+    >>> population.objectives  # (100, number_of_objectives) array
+    """
+
+    _FIELDS = ('variables', 'objectives', 'constraints')
+
+    def __init__(self,
+                 lower_bound: List[float],
+                 upper_bound: List[float],
+                 number_of_objectives: int,
+                 number_of_constraints: int = 0,
+                 solution_type: type = FloatSolution,
+                 capacity: int = 0):
+        """
+        :param lower_bound: Lower bounds of the decision variables.
+        :param upper_bound: Upper bounds of the decision variables.
+        :param number_of_objectives: Number of objectives.
+        :param number_of_constraints: Number of constraints.
+        :param solution_type: Either :class:`FloatSolution` or :class:`IntegerSolution`.
+        :param capacity: Number of rows to preallocate.
+        """
+        Check.that(solution_type in (FloatSolution, IntegerSolution),
+                   'Solution type not supported by Population: ' + str(solution_type))
+        Check.that(len(lower_bound) == len(upper_bound), 'The bounds must have the same length')
+
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
+        self.number_of_variables = len(lower_bound)
+        self.number_of_objectives = number_of_objectives
+        self.number_of_constraints = number_of_constraints
+        self.solution_type = solution_type
+
+        variables_dtype = float if solution_type is FloatSolution else int
+        self._arrays = {
+            'variables': numpy.zeros((capacity, self.number_of_variables), dtype=variables_dtype),
+            'objectives': numpy.zeros((capacity, number_of_objectives)),
+            'constraints': numpy.zeros((capacity, number_of_constraints))
+        }
+        self._size = 0
+        self._attributes = []
+        self._views = weakref.WeakValueDictionary()
+        self._dirty = {}
+
+    @classmethod
+    def from_solutions(cls, solutions: List[S]) -> 'Population[S]':
+        """ Pack a list of float or integer solutions into a new population. The solutions are copied. """
+        Check.collection_is_not_empty(solutions)
+        first = solutions[0]
+        Check.that(type(first) in (FloatSolution, IntegerSolution),
+                   'Solution type not supported by Population: ' + str(type(first)))
+
+        population = cls(first.lower_bound, first.upper_bound, first.number_of_objectives,
+                         first.number_of_constraints, type(first), capacity=len(solutions))
+        population.extend(solutions)
+
+        return population
+
+    @property
+    def variables(self) -> numpy.ndarray:
+        return self._get_array('variables')
+
+    @property
+    def objectives(self) -> numpy.ndarray:
+        return self._get_array('objectives')
+
+    @property
+    def constraints(self) -> numpy.ndarray:
+        return self._get_array('constraints')
+
+    def append(self, solution: S) -> S:
+        """ Copy the values of a solution into a new row and return the view bound to that row. """
+        Check.that(len(solution.variables) == self.number_of_variables, 'Wrong number of variables')
+
+        self._reserve(self._size + 1)
+        row = self._size
+        self._size += 1
+
+        for name in self._FIELDS:
+            self._arrays[name][row] = getattr(solution, name)
+        self._attributes.append(solution.attributes.copy())
+
+        return self[row]
+
+    def extend(self, solutions: List[S]) -> None:
+        self._reserve(self._size + len(solutions))
+        for solution in solutions:
+            self.append(solution)
+
+    def to_solutions(self) -> List[S]:
+        """ Return detached copies of all the solutions of the population. """
+        return [copy.copy(self[i]) for i in range(self._size)]
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('Population index out of range: {}'.format(index))
+
+        view = self._views.get(index)
+        if view is None:
+            view = self._create_view(index)
+            self._views[index] = view
+
+        # The caller may assign new lists to the fields of the view, so it is kept until the next synchronization
+        self._dirty[index] = view
+
+        return view
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _create_view(self, row: int) -> S:
+        view = self.solution_type.__new__(self.solution_type)
+        view.number_of_variables = self.number_of_variables
+        view.number_of_objectives = self.number_of_objectives
+        view.number_of_constraints = self.number_of_constraints
+        view.lower_bound = self.lower_bound
+        view.upper_bound = self.upper_bound
+        view.attributes = self._attributes[row]
+
+        for name in self._FIELDS:
+            setattr(view, name, _ArrayRow(self, name, row))
+
+        return view
+
+    def _get_array(self, name: str) -> numpy.ndarray:
+        self._synchronize()
+        return self._arrays[name][:self._size]
+
+    def _synchronize(self) -> None:
+        """ Problems such as DTLZ assign a brand new list (e.g., `solution.objectives = [...]`) instead of writing
+        the existing one item by item. Those values are copied back into the arrays and the views re-bound; only the
+        views handed out since the last synchronization are checked. """
+        for row, view in self._dirty.items():
+            for name in self._FIELDS:
+                value = getattr(view, name)
+                if not (isinstance(value, _ArrayRow) and value._population is self):
+                    self._arrays[name][row] = value
+                    setattr(view, name, _ArrayRow(self, name, row))
+            self._attributes[row] = view.attributes
+
+        self._dirty.clear()
+
+    def _reserve(self, size: int) -> None:
+        capacity = self._arrays['objectives'].shape[0]
+        if size <= capacity:
+            return
+
+        new_capacity = max(size, 2 * capacity)
+        for name, array in self._arrays.items():
+            new_array = numpy.zeros((new_capacity, array.shape[1]), dtype=array.dtype)
+            new_array[:self._size] = array[:self._size]
+            self._arrays[name] = new_array
+
+
+def objective_matrix(solutions: List[S]) -> numpy.ndarray:
+    """ Return the objective matrix (one row per solution) of a list of solutions. The matrix of a
+    :class:`Population` is returned without copying it, so it must not be modified. """
+    if isinstance(solutions, Population):
+        return solutions.objectives
+
+    return numpy.array([solution.objectives for solution in solutions], dtype=float)
+
+
+def overall_constraint_violation_vector(solutions: List[S]) -> numpy.ndarray:
+    """ Return the overall constraint violation degree of every solution of a list (the constraint matrix of a
+    :class:`Population` is read directly). """
+    if isinstance(solutions, Population):
+        constraints = solutions.constraints
+        return numpy.where(constraints < 0, constraints, 0.0).sum(axis=1)
+
+    return numpy.array([overall_constraint_violation_degree(solution) for solution in solutions], dtype=float)
@@ -12,7 +12,11 @@ S = TypeVar('S')
 
 
 class Problem(Generic[S], ABC):
-    """ Class representing problems. """
+    """ Class representing problems.
+
+    Problems may optionally provide a vectorized `evaluate_batch(variables: numpy.ndarray) -> (F, G)` method, where
+    `variables` is a (solutions x variables) matrix and `F` and `G` are the (solutions x objectives) and
+    (solutions x constraints) matrices. Evaluators use it instead of :meth:`evaluate` when it is available. """
 
     MINIMIZE = -1
     MAXIMIZE = 1
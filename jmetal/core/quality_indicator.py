@@ -3,6 +3,8 @@ from abc import ABC, abstractmethod
 import numpy as np
 from scipy import spatial
 
+from jmetal.core.population import Population
+
 
 class QualityIndicator(ABC):
 
@@ -13,7 +15,7 @@ class QualityIndicator(ABC):
     def compute(self, solutions: np.array):
         """
         :param solutions: [m, n] bi-dimensional numpy array, being m the number of solutions and n the dimension of
-        each solution
+        each solution (the objective matrix of a :class:`Population` is used directly)
         :return: the value of the quality indicator
         """
         pass
@@ -27,6 +29,14 @@ class QualityIndicator(ABC):
         pass
 
 
+def _as_front(solutions):
+    """ Return the objective matrix of a :class:`Population`; other fronts are returned unchanged. """
+    if isinstance(solutions, Population):
+        return solutions.objectives
+
+    return solutions
+
+
 class FitnessValue(QualityIndicator):
     def __init__(self, is_minimization: bool = True):
         super(FitnessValue, self).__init__(is_minimization=is_minimization)
@@ -59,7 +69,7 @@ class GenerationalDistance(QualityIndicator):
         if self.reference_front is None:
             raise Exception('Reference front is none')
 
-        distances = spatial.distance.cdist(solutions, self.reference_front)
+        distances = spatial.distance.cdist(_as_front(solutions), self.reference_front)
 
         return np.mean(np.min(distances, axis=1))
 
@@ -79,7 +89,7 @@ class InvertedGenerationalDistance(QualityIndicator):
         if self.reference_front is None:
             raise Exception('Reference front is none')
 
-        distances = spatial.distance.cdist(self.reference_front, solutions)
+        distances = spatial.distance.cdist(self.reference_front, _as_front(solutions))
 
         return np.mean(np.min(distances, axis=1))
 
@@ -96,6 +106,7 @@ class EpsilonIndicator(QualityIndicator):
         self.reference_front = reference_front
 
     def compute(self, front: np.array) -> float:
+        front = _as_front(front)
         return max([min(
             [max([s2[k] - s1[k] for k in range(len(s2))]) for s2 in front]) for s1 in self.reference_front])
 
@@ -126,7 +137,7 @@ class HyperVolume(QualityIndicator):
 
         :return: The hypervolume that is dominated by a non-dominated front.
         """
-        front = solutions
+        front = _as_front(solutions)
 
         def weakly_dominates(point, other):
             for i in range(len(point)):
@@ -0,0 +1,139 @@
+import copy
+import gc
+import pickle
+import unittest
+
+import numpy
+
+from jmetal.core.population import Population, objective_matrix, overall_constraint_violation_vector
+from jmetal.core.quality_indicator import InvertedGenerationalDistance
+from jmetal.core.solution import FloatSolution, IntegerSolution, BinarySolution
+from jmetal.util.ckecking import InvalidConditionException
+from jmetal.util.density_estimator import CrowdingDistance
+from jmetal.util.ranking import FastNonDominatedRanking
+
+
+class PopulationTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.solutions = []
+        for i in range(3):
+            solution = FloatSolution([0.0, 0.0], [5.0, 5.0], 2, 1)
+            solution.variables = [1.0 * i, 2.0 * i]
+            solution.objectives = [10.0 * i, -10.0 * i]
+            solution.constraints = [-1.0 * i]
+            self.solutions.append(solution)
+
+        self.population = Population.from_solutions(self.solutions)
+
+    def test_should_from_solutions_copy_the_values_into_the_arrays(self):
+        self.assertEqual(3, len(self.population))
+        self.assertEqual((3, 2), self.population.variables.shape)
+        self.assertEqual((3, 2), self.population.objectives.shape)
+        self.assertEqual((3, 1), self.population.constraints.shape)
+        self.assertEqual([[0.0, 0.0], [1.0, 2.0], [2.0, 4.0]], self.population.variables.tolist())
+        self.assertEqual([[0.0, -0.0], [10.0, -10.0], [20.0, -20.0]], self.population.objectives.tolist())
+
+    def test_should_views_be_float_solutions(self):
+        solution = self.population[1]
+
+        self.assertIs(FloatSolution, type(solution))
+        self.assertEqual([1.0, 2.0], solution.variables)
+        self.assertEqual([10.0, -10.0], solution.objectives)
+        self.assertEqual(2, solution.number_of_variables)
+        self.assertIs(self.population[1], solution)
+
+    def test_should_item_assignment_on_a_view_write_into_the_arrays(self):
+        self.population[2].objectives[0] = 3.5
+        self.population[2].variables[1] = 4.5
+
+        self.assertEqual(3.5, self.population.objectives[2, 0])
+        self.assertEqual(4.5, self.population.variables[2, 1])
+
+    def test_should_list_assignment_on_a_view_be_synchronized_with_the_arrays(self):
+        self.population[0].objectives = [7.0, 8.0]
+
+        self.assertEqual([7.0, 8.0], self.population.objectives[0].tolist())
+
+        self.population[0].objectives[1] = 9.0
+        self.assertEqual(9.0, self.population.objectives[0, 1])
+
+    def test_should_copies_of_a_view_be_detached_from_the_population(self):
+        shallow_copy = copy.copy(self.population[1])
+        deep_copy = copy.deepcopy(self.population[1])
+        unpickled = pickle.loads(pickle.dumps(self.population[1]))
+
+        for solution in [shallow_copy, deep_copy, unpickled]:
+            self.assertIsInstance(solution.objectives, list)
+            solution.objectives[0] = -1.0
+
+        self.assertEqual(10.0, self.population.objectives[1, 0])
+
+    def test_should_append_grow_the_population(self):
+        solution = FloatSolution([0.0, 0.0], [5.0, 5.0], 2, 1)
+        solution.variables = [3.0, 3.0]
+        solution.attributes['dominance_ranking'] = 0
+
+        view = self.population.append(solution)
+
+        self.assertEqual(4, len(self.population))
+        self.assertEqual([3.0, 3.0], self.population.variables[3].tolist())
+        self.assertEqual(0, view.attributes['dominance_ranking'])
+
+    def test_should_to_solutions_return_detached_solutions(self):
+        solutions = self.population.to_solutions()
+
+        self.assertEqual(self.solutions[2].variables, solutions[2].variables)
+        self.assertIsInstance(solutions[2].variables, list)
+
+    def test_should_integer_solutions_be_stored_as_integers(self):
+        solution = IntegerSolution([0, 0], [5, 5], 1)
+        solution.variables = [2, 3]
+
+        population = Population.from_solutions([solution])
+
+        self.assertEqual([2, 3], population[0].variables)
+        self.assertIs(IntegerSolution, type(population[0]))
+
+    def test_should_constructor_raise_an_exception_if_the_solution_type_is_not_supported(self):
+        with self.assertRaises(InvalidConditionException):
+            Population.from_solutions([BinarySolution(1, 2)])
+
+    def test_should_views_not_be_kept_if_they_are_not_referenced(self):
+        self.population[1].attributes['dominance_ranking'] = 2
+        self.population.objectives
+        gc.collect()
+
+        self.assertEqual(0, len(self.population._views))
+        self.assertEqual(2, self.population[1].attributes['dominance_ranking'])
+
+    def test_should_synchronization_only_check_the_views_handed_out_since_the_last_one(self):
+        view = self.population[0]
+        self.population.objectives
+
+        self.assertEqual({}, self.population._dirty)
+
+        self.population[2].objectives = [1.0, 1.0]
+        self.assertEqual([2], list(self.population._dirty))
+        self.assertEqual([1.0, 1.0], self.population.objectives[2].tolist())
+        self.assertIs(view, self.population[0])
+
+    def test_should_objective_matrix_return_the_array_of_a_population_without_copying_it(self):
+        self.assertTrue(numpy.shares_memory(self.population._arrays['objectives'], objective_matrix(self.population)))
+        self.assertEqual(objective_matrix(self.solutions).tolist(), objective_matrix(self.population).tolist())
+        self.assertEqual([0.0, -1.0, -2.0], overall_constraint_violation_vector(self.population).tolist())
+
+    def test_should_ranking_crowding_and_indicators_accept_a_population(self):
+        ranking = FastNonDominatedRanking()
+        ranking.compute_ranking(self.population)
+        distances = CrowdingDistance().compute_density_estimator(self.population)
+        indicator = InvertedGenerationalDistance(numpy.array([[0.0, 0.0]]))
+
+        self.assertEqual([0, 1, 2], [solution.attributes['dominance_ranking'] for solution in self.population])
+        self.assertEqual(CrowdingDistance.compute_distances(objective_matrix(self.solutions)).tolist(),
+                         distances.tolist())
+        self.assertEqual(indicator.compute(objective_matrix(self.solutions)), indicator.compute(self.population))
+
+
+if __name__ == '__main__':
+    unittest.main()
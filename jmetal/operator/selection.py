@@ -201,9 +201,8 @@ class RankingAndCrowdingDistanceSelection(Selection[List[S], List[S]]):
             else:
                 subfront = ranking.get_subfront(ranking_index)
                 crowding_distance.compute_density_estimator(subfront)
-                sorted_subfront = sorted(subfront, key=lambda x: x.attributes['crowding_distance'], reverse=True)
-                for i in range((self.max_population_size - len(new_solution_list))):
-                    new_solution_list.append(sorted_subfront[i])
+                new_solution_list.extend(
+                    crowding_distance.truncate(subfront, self.max_population_size - len(new_solution_list)))
 
         return new_solution_list
 
@@ -1,5 +1,7 @@
 from math import pi, cos, sin
 
+import numpy
+
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
 
@@ -51,6 +53,18 @@ class DTLZ1(FloatProblem):
 
         return solution
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> (numpy.ndarray, numpy.ndarray):
+        """ Vectorized version of :meth:`evaluate` over a (solutions x variables) matrix. """
+        k = self.number_of_variables - self.number_of_objectives + 1
+
+        x = variables[:, self.number_of_variables - k:] - 0.5
+        g = 100 * (k + (x * x - numpy.cos(20.0 * pi * x)).sum(axis=1))
+
+        position = variables[:, :self.number_of_objectives - 1]
+        objectives = _shape_objectives((1.0 + g) * 0.5, position, 1.0 - position)
+
+        return objectives, numpy.zeros((variables.shape[0], 0))
+
     def get_name(self):
         return 'DTLZ1'
 
@@ -82,6 +96,17 @@ class DTLZ2(DTLZ1):
 
         return solution
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> (numpy.ndarray, numpy.ndarray):
+        k = self.number_of_variables - self.number_of_objectives + 1
+
+        x = variables[:, self.number_of_variables - k:] - 0.5
+        g = (x * x).sum(axis=1)
+
+        theta = variables[:, :self.number_of_objectives - 1] * 0.5 * pi
+        objectives = _shape_objectives(1.0 + g, numpy.cos(theta), numpy.sin(theta))
+
+        return objectives, numpy.zeros((variables.shape[0], 0))
+
     def get_name(self):
         return 'DTLZ2'
 
@@ -117,6 +142,17 @@ class DTLZ3(DTLZ1):
 
         return solution
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> (numpy.ndarray, numpy.ndarray):
+        k = self.number_of_variables - self.number_of_objectives + 1
+
+        x = variables[:, self.number_of_variables - k:] - 0.5
+        g = 100.0 * (k + (x ** 2 - numpy.cos(20.0 * pi * x)).sum(axis=1))
+
+        theta = variables[:, :self.number_of_objectives - 1] * 0.5 * pi
+        objectives = _shape_objectives(1.0 + g, numpy.cos(theta), numpy.sin(theta))
+
+        return objectives, numpy.zeros((variables.shape[0], 0))
+
     def get_name(self):
         return 'DTLZ3'
 
@@ -151,6 +187,18 @@ class DTLZ4(DTLZ1):
 
         return solution
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> (numpy.ndarray, numpy.ndarray):
+        alpha = 100.0
+        k = self.number_of_variables - self.number_of_objectives + 1
+
+        x = variables[:, self.number_of_variables - k:] - 0.5
+        g = (x ** 2).sum(axis=1)
+
+        theta = numpy.power(variables[:, :self.number_of_objectives - 1], alpha) * pi / 2.0
+        objectives = _shape_objectives(1.0 + g, numpy.cos(theta), numpy.sin(theta))
+
+        return objectives, numpy.zeros((variables.shape[0], 0))
+
     def get_name(self):
         return 'DTLZ4'
 
@@ -190,6 +238,17 @@ class DTLZ5(DTLZ1):
 
         return solution
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> (numpy.ndarray, numpy.ndarray):
+        k = self.number_of_variables - self.number_of_objectives + 1
+
+        x = variables[:, self.number_of_variables - k:] - 0.5
+        g = (x ** 2).sum(axis=1)
+
+        theta = _degenerate_theta(variables, g, self.number_of_objectives)
+        objectives = _shape_objectives(1.0 + g, numpy.cos(theta), numpy.sin(theta))
+
+        return objectives, numpy.zeros((variables.shape[0], 0))
+
     def get_name(self):
         return 'DTLZ5'
 
@@ -229,6 +288,16 @@ class DTLZ6(DTLZ1):
 
         return solution
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> (numpy.ndarray, numpy.ndarray):
+        k = self.number_of_variables - self.number_of_objectives + 1
+
+        g = numpy.power(variables[:, self.number_of_variables - k:], 0.1).sum(axis=1)
+
+        theta = _degenerate_theta(variables, g, self.number_of_objectives)
+        objectives = _shape_objectives(1.0 + g, numpy.cos(theta), numpy.sin(theta))
+
+        return objectives, numpy.zeros((variables.shape[0], 0))
+
     def get_name(self):
         return 'DTLZ6'
 
@@ -258,5 +327,50 @@ class DTLZ7(DTLZ1):
 
         return solution
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> (numpy.ndarray, numpy.ndarray):
+        k = self.number_of_variables - self.number_of_objectives + 1
+
+        g = variables[:, self.number_of_variables - k:].sum(axis=1)
+        g = 1.0 + (9.0 * g) / k
+
+        x = variables[:, :self.number_of_objectives - 1]
+        h = ((x / (1.0 + g)[:, None]) * (1 + numpy.sin(3.0 * pi * x))).sum(axis=1)
+        h = self.number_of_objectives - h
+
+        objectives = numpy.column_stack((x, (1.0 + g) * h))
+
+        return objectives, numpy.zeros((variables.shape[0], 0))
+
     def get_name(self):
         return 'DTLZ7'
+
+
+def _shape_objectives(scale: numpy.ndarray, first: numpy.ndarray, last: numpy.ndarray) -> numpy.ndarray:
+    """ Shape function shared by the DTLZ problems, computed for a batch of solutions:
+    f_i = scale * first_0 * ... * first_(M-2-i) * last_(M-1-i), where the last factor is omitted for f_0.
+
+    :param scale: Vector with the (1 + g) term of each solution.
+    :param first: (solutions x M-1) matrix of the leading factors.
+    :param last: (solutions x M-1) matrix of the trailing factors.
+    """
+    number_of_objectives = first.shape[1] + 1
+    objectives = numpy.empty((first.shape[0], number_of_objectives))
+
+    for i in range(number_of_objectives):
+        objectives[:, i] = scale * first[:, :number_of_objectives - (i + 1)].prod(axis=1)
+
+        if i != 0:
+            objectives[:, i] *= last[:, number_of_objectives - (i + 1)]
+
+    return objectives
+
+
+def _degenerate_theta(variables: numpy.ndarray, g: numpy.ndarray, number_of_objectives: int) -> numpy.ndarray:
+    """ Angles of DTLZ5 and DTLZ6, computed for a batch of solutions. """
+    t = pi / (4.0 * (1.0 + g))
+
+    theta = numpy.empty((variables.shape[0], number_of_objectives - 1))
+    theta[:, 0] = variables[:, 0] * pi / 2.0
+    theta[:, 1:] = t[:, None] * (1.0 + 2.0 * g[:, None] * variables[:, 1:number_of_objectives - 1])
+
+    return theta
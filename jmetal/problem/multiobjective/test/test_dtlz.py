@@ -0,0 +1,29 @@
+import unittest
+
+import numpy
+
+from jmetal.problem.multiobjective.dtlz import DTLZ1, DTLZ2, DTLZ3, DTLZ4, DTLZ5, DTLZ6, DTLZ7
+
+
+class DTLZBatchEvaluationTestCases(unittest.TestCase):
+
+    def test_should_evaluate_batch_return_the_same_values_as_evaluate(self) -> None:
+        problems = [DTLZ1(), DTLZ2(), DTLZ3(), DTLZ4(), DTLZ5(), DTLZ6(), DTLZ7(),
+                    DTLZ2(number_of_variables=14, number_of_objectives=5),
+                    DTLZ5(number_of_variables=14, number_of_objectives=5)]
+
+        for problem in problems:
+            solutions = [problem.create_solution() for _ in range(10)]
+            objectives, constraints = problem.evaluate_batch(numpy.array([s.variables for s in solutions]))
+
+            for i, solution in enumerate(solutions):
+                problem.evaluate(solution)
+                for j in range(problem.number_of_objectives):
+                    self.assertAlmostEqual(solution.objectives[j], objectives[i, j], places=8)
+
+            self.assertEqual((10, problem.number_of_objectives), objectives.shape)
+            self.assertEqual((10, 0), constraints.shape)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy
+
 from jmetal.problem.multiobjective.zdt import ZDT1, ZDT2, ZDT3, ZDT4, ZDT6
 
 
@@ -216,5 +218,20 @@ class ZDT6TestCases(unittest.TestCase):
         self.assertEqual("ZDT6", problem.get_name())
 
 
+class ZDTBatchEvaluationTestCases(unittest.TestCase):
+
+    def test_should_evaluate_batch_return_the_same_values_as_evaluate(self) -> None:
+        for problem in [ZDT1(), ZDT2(), ZDT3(), ZDT4(), ZDT6()]:
+            solutions = [problem.create_solution() for _ in range(10)]
+            objectives, constraints = problem.evaluate_batch(numpy.array([s.variables for s in solutions]))
+
+            for i, solution in enumerate(solutions):
+                problem.evaluate(solution)
+                self.assertAlmostEqual(solution.objectives[0], objectives[i, 0])
+                self.assertAlmostEqual(solution.objectives[1], objectives[i, 1])
+
+            self.assertEqual((10, 0), constraints.shape)
+
+
 if __name__ == '__main__':
     unittest.main()
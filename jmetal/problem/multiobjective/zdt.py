@@ -1,5 +1,7 @@
 from math import sqrt, pow, sin, pi, cos
 
+import numpy
+
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
 
@@ -52,6 +54,26 @@ class ZDT1(FloatProblem):
     def eval_h(self, f: float, g: float) -> float:
         return 1.0 - sqrt(f / g)
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> (numpy.ndarray, numpy.ndarray):
+        """ Vectorized version of :meth:`evaluate` over a (solutions x variables) matrix. """
+        f = variables[:, 0]
+        g = self.eval_g_batch(variables)
+        h = self.eval_h_batch(f, g)
+
+        objectives = numpy.column_stack((f, h * g))
+
+        return objectives, numpy.zeros((variables.shape[0], 0))
+
+    def eval_g_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        g = variables[:, 1:].sum(axis=1)
+
+        constant = 9.0 / (variables.shape[1] - 1)
+
+        return constant * g + 1.0
+
+    def eval_h_batch(self, f: numpy.ndarray, g: numpy.ndarray) -> numpy.ndarray:
+        return 1.0 - numpy.sqrt(f / g)
+
     def get_name(self):
         return 'ZDT1'
 
@@ -82,6 +104,9 @@ class ZDT2(ZDT1):
     def eval_h(self, f: float, g: float) -> float:
         return 1.0 - pow(f / g, 2.0)
 
+    def eval_h_batch(self, f: numpy.ndarray, g: numpy.ndarray) -> numpy.ndarray:
+        return 1.0 - numpy.power(f / g, 2.0)
+
     def get_name(self):
         return 'ZDT2'
 
@@ -95,6 +120,9 @@ class ZDT3(ZDT1):
     def eval_h(self, f: float, g: float) -> float:
         return 1.0 - sqrt(f / g) - (f / g) * sin(10.0 * f * pi)
 
+    def eval_h_batch(self, f: numpy.ndarray, g: numpy.ndarray) -> numpy.ndarray:
+        return 1.0 - numpy.sqrt(f / g) - (f / g) * numpy.sin(10.0 * f * pi)
+
     def get_name(self):
         return 'ZDT3'
 
@@ -128,6 +156,12 @@ class ZDT4(ZDT1):
     def eval_h(self, f: float, g: float) -> float:
         return 1.0 - sqrt(f / g)
 
+    def eval_g_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        x = variables[:, 1:]
+        g = (numpy.power(x, 2.0) - 10.0 * numpy.cos(4.0 * pi * x)).sum(axis=1)
+
+        return g + 1.0 + 10.0 * (variables.shape[1] - 1)
+
     def get_name(self):
         return 'ZDT4'
 
@@ -156,5 +190,13 @@ class ZDT6(ZDT1):
     def eval_h(self, f: float, g: float) -> float:
         return 1.0 - pow(f / g, 2.0)
 
+    def eval_g_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        g = variables[:, 1:].sum(axis=1) / (variables.shape[1] - 1)
+
+        return 1.0 + 9.0 * numpy.power(g, 0.25)
+
+    def eval_h_batch(self, f: numpy.ndarray, g: numpy.ndarray) -> numpy.ndarray:
+        return 1.0 - numpy.power(f / g, 2.0)
+
     def get_name(self):
         return 'ZDT6'
@@ -1,10 +1,15 @@
 import copy
+import operator
 import random
 from abc import ABC, abstractmethod
 from threading import Lock
 from typing import TypeVar, Generic, List
 
+import numpy
+from scipy.spatial.distance import cdist
+
 from jmetal.util.comparator import Comparator, DominanceComparator, SolutionAttributeComparator
+from jmetal.util.constraint_handling import overall_constraint_violation_degree
 from jmetal.util.density_estimator import DensityEstimator, CrowdingDistance
 
 S = TypeVar('S')
@@ -42,12 +47,13 @@ class BoundedArchive(Archive[S]):
     def __init__(self,
                  maximum_size: int,
                  comparator: Comparator[S] = None,
-                 density_estimator: DensityEstimator = None):
+                 density_estimator: DensityEstimator = None,
+                 dominance_comparator: Comparator[S] = DominanceComparator()):
         super(BoundedArchive, self).__init__()
         self.maximum_size = maximum_size
         self.comparator = comparator
         self.density_estimator = density_estimator
-        self.non_dominated_solution_archive = NonDominatedSolutionsArchive()
+        self.non_dominated_solution_archive = NonDominatedSolutionsArchive(dominance_comparator)
         self.solution_list = self.non_dominated_solution_archive.solution_list
 
     def compute_density_estimator(self):
@@ -118,14 +124,218 @@ class NonDominatedSolutionsArchive(Archive[S]):
         return False
 
 
+class NDTreeArchive(Archive[S]):
+
+    def __init__(self, maximum_leaf_size: int = 20, number_of_children: int = None):
+        """ Unbounded archive of non-dominated solutions indexed by an ND-Tree, as described in
+
+        * A. Jaszkiewicz and T. Lust, "ND-Tree-Based Update: A Fast Algorithm for the Dynamic Nondominance Problem,"
+          in IEEE Transactions on Evolutionary Computation, vol. 22, no. 5, pp. 778-791, Oct 2018.
+          doi: 10.1109/TEVC.2018.2799684
+
+        The solutions are kept in a tree whose nodes store the (approximate) ideal and nadir points of the solutions
+        below them, so a new solution is only compared with the nodes whose bounding box can contain solutions
+        dominating it or dominated by it. It keeps the same solutions, in the same order, as a
+        :class:`NonDominatedSolutionsArchive` with a :class:`DominanceComparator`: the overall constraint violation
+        degree is compared first, and a solution with the same objectives as a member is not added.
+
+        `solution_list` is rebuilt after every change and must not be modified; use :meth:`add` instead. This archive
+        cannot be used as the non-dominated archive of a :class:`BoundedArchive`, which removes solutions from it.
+
+        :param maximum_leaf_size: Number of solutions of a leaf above which it is split.
+        :param number_of_children: Number of children of the split leaves (by default, the number of objectives + 1).
+        """
+        super(NDTreeArchive, self).__init__()
+        self.maximum_leaf_size = maximum_leaf_size
+        self.number_of_children = number_of_children
+
+    @property
+    def solution_list(self) -> List[S]:
+        """ Members of the archive, in insertion order. The list is cached until the next change and must not be
+        modified by the callers (copy it if needed); assigning a list replaces the members. """
+        if self._solution_list is None:
+            self._solution_list = list(self._members.values())
+
+        return self._solution_list
+
+    @solution_list.setter
+    def solution_list(self, solution_list: List[S]) -> None:
+        self._members = {}
+        self._solution_list = None
+        self._root = None
+        self._violation = None
+
+        for solution in solution_list:
+            self.add(solution)
+
+    def size(self) -> int:
+        return len(self._members)
+
+    def add(self, solution: S) -> bool:
+        point = tuple(float(value) for value in solution.objectives)
+        violation = overall_constraint_violation_degree(solution)
+
+        if self._root is None or violation > self._violation:
+            # The solutions with a larger violation degree dominate all the members
+            self.solution_list = []
+            self._violation = violation
+        elif violation < self._violation or not self._update(self._root, point, numpy.array(point)):
+            return False
+
+        if self._root is None or self._is_empty(self._root):
+            self._root = _NDTreeNode(point, solution)
+        else:
+            self._insert(self._root, point, solution)
+
+        self._members[id(solution)] = solution
+        self._solution_list = None
+
+        return True
+
+    def is_dominated(self, solution: S) -> bool:
+        """ Return whether a member dominates the solution or has its objectives (i.e., whether :meth:`add` would
+        reject it). """
+        if self._root is None:
+            return False
+
+        violation = overall_constraint_violation_degree(solution)
+        if violation != self._violation:
+            return violation < self._violation
+
+        point = tuple(float(value) for value in solution.objectives)
+        return self._is_weakly_dominated(self._root, point, numpy.array(point))
+
+    def _is_weakly_dominated(self, node: '_NDTreeNode', point: tuple, vector: numpy.ndarray) -> bool:
+        if all(map(operator.le, node.nadir, point)):
+            return not self._is_empty(node)
+        if not all(map(operator.le, node.ideal, point)):
+            return False
+
+        if node.children is None:
+            return bool((node.points <= vector).all(axis=1).any())
+
+        return any(self._is_weakly_dominated(child, point, vector) for child in node.children)
+
+    def _update(self, node: '_NDTreeNode', point: tuple, vector: numpy.ndarray) -> bool:
+        """ Remove the solutions dominated by the point from the subtree of the node; return False if the point is
+        dominated by (or equal to) a solution of the subtree. """
+        if all(map(operator.le, node.nadir, point)):
+            return False
+        if all(map(operator.le, point, node.ideal)):
+            if point != node.ideal:
+                self._discard(node)
+                return True
+        elif not all(map(operator.le, node.ideal, point)) and not all(map(operator.le, point, node.nadir)):
+            return True
+
+        if node.children is None:
+            if (node.points <= vector).all(axis=1).any():
+                return False
+
+            dominated = (vector <= node.points).all(axis=1)
+            if dominated.any():
+                for index in numpy.flatnonzero(dominated):
+                    del self._members[id(node.solutions[index])]
+                node.points = node.points[~dominated]
+                node.solutions = [solution for solution, flag in zip(node.solutions, dominated) if not flag]
+        else:
+            for child in node.children:
+                # A dominated point cannot dominate any member, so nothing has been removed if it is rejected
+                if not self._update(child, point, vector):
+                    return False
+
+            node.children = [child for child in node.children if not self._is_empty(child)]
+            if len(node.children) == 1:
+                child = node.children[0]
+                node.ideal, node.nadir = child.ideal, child.nadir
+                node.children, node.points, node.solutions = child.children, child.points, child.solutions
+
+        return True
+
+    def _insert(self, node: '_NDTreeNode', point: tuple, solution: S) -> None:
+        while node.children is not None:
+            node.include(point)
+            node = min(node.children, key=lambda child: child.distance_to_middle(point))
+
+        node.include(point)
+        node.points = numpy.vstack((node.points, point))
+        node.solutions.append(solution)
+
+        if len(node.solutions) > self.maximum_leaf_size:
+            self._split(node)
+
+    def _split(self, node: '_NDTreeNode') -> None:
+        number_of_children = self.number_of_children or node.points.shape[1] + 1
+        number_of_children = min(number_of_children, len(node.solutions))
+        distances = cdist(node.points, node.points)
+
+        # The seeds are the points farthest (on average) from the rest and from the previous seeds
+        seeds = [int(numpy.argmax(distances.mean(axis=1)))]
+        while len(seeds) < number_of_children:
+            average = distances[:, seeds].mean(axis=1)
+            average[seeds] = -1.0
+            seeds.append(int(numpy.argmax(average)))
+
+        points = [tuple(point) for point in node.points.tolist()]
+        children = [_NDTreeNode(points[index], node.solutions[index]) for index in seeds]
+        for index, point in enumerate(points):
+            if index in seeds:
+                continue
+
+            child = min(children, key=lambda child: child.distance_to_middle(point))
+            child.include(point)
+            child.points = numpy.vstack((child.points, point))
+            child.solutions.append(node.solutions[index])
+
+        node.children, node.points, node.solutions = children, None, None
+
+    def _discard(self, node: '_NDTreeNode') -> None:
+        if node.children is None:
+            for solution in node.solutions:
+                del self._members[id(solution)]
+            node.points, node.solutions = node.points[:0], []
+        else:
+            for child in node.children:
+                self._discard(child)
+            node.children = []
+
+    @staticmethod
+    def _is_empty(node: '_NDTreeNode') -> bool:
+        return len(node.children if node.children is not None else node.solutions) == 0
+
+
+class _NDTreeNode:
+    """ Node of an :class:`NDTreeArchive`: a leaf stores solutions and the matrix of their objectives, an internal
+    node its children. The ideal and nadir points (tuples) bound the solutions below the node; they are not tightened
+    when solutions are removed. """
+
+    __slots__ = ('ideal', 'nadir', 'children', 'points', 'solutions')
+
+    def __init__(self, point: tuple, solution):
+        self.ideal = point
+        self.nadir = point
+        self.children = None
+        self.points = numpy.array([point])
+        self.solutions = [solution]
+
+    def include(self, point: tuple) -> None:
+        self.ideal = tuple(map(min, self.ideal, point))
+        self.nadir = tuple(map(max, self.nadir, point))
+
+    def distance_to_middle(self, point: tuple) -> float:
+        return sum((lower + upper - 2 * value) ** 2 for lower, upper, value in zip(self.ideal, self.nadir, point))
+
+
 class CrowdingDistanceArchive(BoundedArchive[S]):
 
     def __init__(self,
-                 maximum_size: int):
+                 maximum_size: int,
+                 dominance_comparator: Comparator[S] = DominanceComparator()):
         super(CrowdingDistanceArchive, self).__init__(
             maximum_size=maximum_size,
             comparator=SolutionAttributeComparator("crowding_distance", lowest_is_best=False),
-            density_estimator=CrowdingDistance())
+            density_estimator=CrowdingDistance(),
+            dominance_comparator=dominance_comparator)
 
 
 class ArchiveWithReferencePoint(BoundedArchive[S]):
@@ -1,7 +1,12 @@
 import math
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic
+from functools import cmp_to_key
+from typing import TypeVar, Generic, List
 
+import numpy
+
+from jmetal.core.observer import Observer
+from jmetal.core.population import objective_matrix, overall_constraint_violation_vector
 from jmetal.core.solution import Solution
 from jmetal.util.constraint_handling import overall_constraint_violation_degree
 
@@ -14,6 +19,35 @@ class Comparator(Generic[S], ABC):
     def compare(self, solution1: S, solution2: S) -> int:
         pass
 
+    @property
+    def batched(self) -> bool:
+        """ Whether :meth:`compare_all` is computed with array operations instead of pairwise calls. """
+        return False
+
+    def compare_all(self, solutions1: List[S], solutions2: List[S], block_size: int = None) -> numpy.ndarray:
+        """ Return the matrix whose element (i, j) is `compare(solutions1[i], solutions2[j])`.
+
+        :param block_size: Number of rows computed at once by the batched implementations.
+        """
+        result = numpy.zeros((len(solutions1), len(solutions2)), dtype=numpy.int8)
+        for i, solution1 in enumerate(solutions1):
+            for j, solution2 in enumerate(solutions2):
+                result[i, j] = self.compare(solution1, solution2)
+
+        return result
+
+    @property
+    def key_based(self) -> bool:
+        """ Whether the comparator orders the solutions by :meth:`sort_key`. """
+        return False
+
+    def sort_key(self, solution: S):
+        """ Return a key such that sorting by it (lowest first) orders the solutions as :meth:`compare` does.
+
+        Key based comparators return a tuple of numbers, which contains None if a value needed by the comparator is
+        missing; by default, :meth:`compare` is wrapped with :func:`functools.cmp_to_key`. """
+        return cmp_to_key(self.compare)(solution)
+
 
 class EqualSolutionsComparator(Comparator):
 
@@ -79,6 +113,17 @@ class SolutionAttributeComparator(Comparator):
 
         return result
 
+    @property
+    def key_based(self) -> bool:
+        return True
+
+    def sort_key(self, solution: Solution) -> tuple:
+        value = solution.attributes.get(self.key)
+        if value is None or self.lowest_is_best:
+            return value,
+
+        return -value,
+
 
 class MultiComparator(Comparator):
     """
@@ -97,6 +142,16 @@ class MultiComparator(Comparator):
 
         return 0
 
+    @property
+    def key_based(self) -> bool:
+        return all(comparator.key_based for comparator in self.comparator_list)
+
+    def sort_key(self, solution: Solution):
+        if not self.key_based:
+            return super(MultiComparator, self).sort_key(solution)
+
+        return sum((comparator.sort_key(solution) for comparator in self.comparator_list), ())
+
 
 class RankingAndCrowdingDistanceComparator(Comparator):
 
@@ -110,6 +165,14 @@ class RankingAndCrowdingDistanceComparator(Comparator):
 
         return result
 
+    @property
+    def key_based(self) -> bool:
+        return True
+
+    def sort_key(self, solution: Solution) -> tuple:
+        return SolutionAttributeComparator('dominance_ranking').sort_key(solution) + \
+               SolutionAttributeComparator("crowding_distance", lowest_is_best=False).sort_key(solution)
+
 
 class StrengthAndKNNDistanceComparator(Comparator):
 
@@ -123,6 +186,14 @@ class StrengthAndKNNDistanceComparator(Comparator):
 
         return result
 
+    @property
+    def key_based(self) -> bool:
+        return True
+
+    def sort_key(self, solution: Solution) -> tuple:
+        return SolutionAttributeComparator('dominance_ranking').sort_key(solution) + \
+               SolutionAttributeComparator("knn_density", lowest_is_best=False).sort_key(solution)
+
 
 class OverallConstraintViolationComparator(Comparator):
     def compare(self, solution1: Solution, solution2: Solution) -> int:
@@ -185,6 +256,21 @@ class DominanceComparator(Comparator):
 
         return result
 
+    @property
+    def batched(self) -> bool:
+        return type(self).compare is DominanceComparator.compare and \
+               _violation_vector(self.constraint_comparator, []) is not None
+
+    def compare_all(self, solutions1: List[Solution], solutions2: List[Solution], block_size: int = None) \
+            -> numpy.ndarray:
+        if not self.batched:
+            return super(DominanceComparator, self).compare_all(solutions1, solutions2)
+
+        return dominance_test_matrix(_objective_matrix(solutions1), _objective_matrix(solutions2),
+                                     _violation_vector(self.constraint_comparator, solutions1),
+                                     _violation_vector(self.constraint_comparator, solutions2),
+                                     block_size)
+
     @staticmethod
     def dominance_test(vector1: [float], vector2: [float]) -> int:
         result = 0
@@ -249,6 +335,22 @@ class EpsilonDominanceComparator(DominanceComparator):
 
         return result
 
+    @property
+    def batched(self) -> bool:
+        return type(self).compare is EpsilonDominanceComparator.compare and \
+               _violation_vector(self.constraint_comparator, []) is not None
+
+    def compare_all(self, solutions1: List[Solution], solutions2: List[Solution], block_size: int = None) \
+            -> numpy.ndarray:
+        if not self.batched:
+            return Comparator.compare_all(self, solutions1, solutions2)
+
+        return epsilon_dominance_test_matrix(_objective_matrix(solutions1), _objective_matrix(solutions2),
+                                             self.epsilon,
+                                             _violation_vector(self.constraint_comparator, solutions1),
+                                             _violation_vector(self.constraint_comparator, solutions2),
+                                             block_size)
+
     def __dominance_test(self, solution1: Solution, solution2: Solution):
         best_is_one = False
         best_is_two = False
@@ -285,3 +387,281 @@ class EpsilonDominanceComparator(DominanceComparator):
                 return 1
             else:
                 return -1
+
+
+class DominanceCache(Comparator, Observer):
+    """ Comparator wrapping another one (by default, a :class:`DominanceComparator`) which remembers the result of the
+    comparisons, keyed by the identity of the solutions. The same instance can be shared by the selection operator,
+    the ranking of the replacement and the archives of an algorithm, so each pair is compared only once per generation.
+
+    Pairs are cached lazily by :meth:`compare`, up to `maximum_size` of them (the cache is emptied when it is full),
+    and in bulk by :meth:`compare_all` (which keeps the whole matrix of the last call). The cache holds references to
+    the solutions it knows, so their identities are not reused while cached.
+
+    Registered as an observer of the algorithm, it only keeps, after every iteration, the pairs of solutions in the
+    current population (`SOLUTIONS`) whose objectives and constraints have not changed since they were cached, so the
+    solutions re-evaluated in place (e.g., by :class:`DynamicNSGAII` when the problem changes) are compared again. If
+    the solutions are re-evaluated in place without notifying the cache, :meth:`clear` must be called.
+
+    The number of comparisons answered from the cache and computed are available in `hits` and `misses`.
+    """
+
+    def __init__(self, comparator: Comparator = None, antisymmetric: bool = None, maximum_size: int = 1000000):
+        """
+        :param comparator: Comparator used for the pairs not found in the cache.
+        :param antisymmetric: Whether `compare(b, a) == -compare(a, b)`, so a result answers both orders. By default,
+            True unless the comparator is an :class:`EpsilonDominanceComparator` (whose ties are not antisymmetric).
+        :param maximum_size: Maximum number of pairs cached by :meth:`compare`.
+        """
+        super(DominanceCache, self).__init__()
+        self.comparator = comparator if comparator is not None else DominanceComparator()
+        if antisymmetric is None:
+            antisymmetric = not isinstance(self.comparator, EpsilonDominanceComparator)
+        self.antisymmetric = antisymmetric
+        self.maximum_size = maximum_size
+
+        self.hits = 0
+        self.misses = 0
+        self.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    @property
+    def batched(self) -> bool:
+        return self.comparator.batched
+
+    def clear(self) -> None:
+        self._solutions = {}
+        self._pairs = {}
+        self._rows = {}
+        self._columns = {}
+        self._matrix = None
+
+    def compare(self, solution1: S, solution2: S) -> int:
+        key1, key2 = id(solution1), id(solution2)
+
+        result = self._pairs.get((key1, key2))
+        if result is None:
+            result = self._lookup(key1, key2)
+
+        if result is None:
+            self.misses += 1
+            result = self.comparator.compare(solution1, solution2)
+
+            if len(self._pairs) >= self.maximum_size:
+                self._pairs = {}
+                self._solutions = {key: self._solutions[key] for key in set(self._rows) | set(self._columns)}
+            self._remember(solution1)
+            self._remember(solution2)
+            self._pairs[key1, key2] = result
+        else:
+            self.hits += 1
+
+        return result
+
+    def compare_all(self, solutions1: List[S], solutions2: List[S], block_size: int = None) -> numpy.ndarray:
+        known_rows = [index for index, solution in enumerate(solutions1) if id(solution) in self._rows]
+        known_columns = [index for index, solution in enumerate(solutions2) if id(solution) in self._columns]
+
+        reused = len(known_rows) * len(known_columns)
+
+        if reused == 0:
+            result = self.comparator.compare_all(solutions1, solutions2, block_size)
+        else:
+            # The block of solutions compared in the last call is copied; only the rest is computed
+            new_rows = numpy.setdiff1d(numpy.arange(len(solutions1)), known_rows)
+            new_columns = numpy.setdiff1d(numpy.arange(len(solutions2)), known_columns)
+
+            result = numpy.empty((len(solutions1), len(solutions2)), dtype=numpy.int8)
+            result[numpy.ix_(known_rows, known_columns)] = self._matrix[numpy.ix_(
+                [self._rows[id(solutions1[index])] for index in known_rows],
+                [self._columns[id(solutions2[index])] for index in known_columns])]
+
+            if len(new_rows) > 0:
+                result[new_rows] = self.comparator.compare_all([solutions1[index] for index in new_rows], solutions2,
+                                                               block_size)
+            if len(new_columns) > 0:
+                result[numpy.ix_(known_rows, new_columns)] = self.comparator.compare_all(
+                    [solutions1[index] for index in known_rows], [solutions2[index] for index in new_columns],
+                    block_size)
+
+        self.hits += reused
+        self.misses += result.size - reused
+
+        for solution in solutions1 + solutions2:
+            self._remember(solution)
+        self._rows = {id(solution): index for index, solution in enumerate(solutions1)}
+        self._columns = {id(solution): index for index, solution in enumerate(solutions2)}
+        self._matrix = result
+
+        return result
+
+    def update(self, *args, **kwargs):
+        solutions = kwargs.get('SOLUTIONS')
+        if solutions is None:
+            self.clear()
+            return
+
+        # The solutions whose objectives or constraints changed since they were cached are forgotten
+        kept = set(id(solution) for solution in solutions
+                   if self._solutions.get(id(solution), (None, None))[1] == self._signature(solution))
+        self._solutions = {key: value for key, value in self._solutions.items() if key in kept}
+        self._pairs = {pair: result for pair, result in self._pairs.items()
+                       if pair[0] in kept and pair[1] in kept}
+        self._rows = {key: index for key, index in self._rows.items() if key in kept}
+        self._columns = {key: index for key, index in self._columns.items() if key in kept}
+
+    @staticmethod
+    def _signature(solution: S) -> tuple:
+        return tuple(solution.objectives), tuple(solution.constraints)
+
+    def _remember(self, solution: S) -> None:
+        if id(solution) not in self._solutions:
+            self._solutions[id(solution)] = (solution, self._signature(solution))
+
+    def _lookup(self, key1: int, key2: int):
+        if key1 in self._rows and key2 in self._columns:
+            return int(self._matrix[self._rows[key1], self._columns[key2]])
+
+        if self.antisymmetric:
+            result = self._pairs.get((key2, key1))
+            if result is not None:
+                return -result
+
+            if key2 in self._rows and key1 in self._columns:
+                return -int(self._matrix[self._rows[key2], self._columns[key1]])
+
+        return None
+
+
+def dominance_test_matrix(objectives1: numpy.ndarray,
+                          objectives2: numpy.ndarray,
+                          violation1: numpy.ndarray = None,
+                          violation2: numpy.ndarray = None,
+                          block_size: int = None) -> numpy.ndarray:
+    """ Batched version of :class:`DominanceComparator`: return the matrix whose element (i, j) is -1 if the i-th row
+    of `objectives1` dominates the j-th row of `objectives2`, 1 if it is dominated by it and 0 otherwise.
+
+    Constrained domination is applied: the solution with the higher violation value (the overall constraint violation
+    degree, which is zero or negative) wins, and Pareto dominance is only tested if both values are equal (or any of
+    them is NaN, as :class:`SolutionAttributeComparator` does with missing values).
+
+    :param objectives1: Objective matrix (one row per solution).
+    :param objectives2: Objective matrix (one row per solution).
+    :param violation1: Violation values of the first solutions (by default, all of them are feasible).
+    :param violation2: Violation values of the second solutions (by default, all of them are feasible).
+    :param block_size: Number of rows computed at once (by default, as many as fit in about 2^22 comparisons).
+    """
+
+    def pareto_test(block1: numpy.ndarray, block2: numpy.ndarray) -> numpy.ndarray:
+        less = numpy.any(block1 < block2, axis=2)
+        greater = numpy.any(block1 > block2, axis=2)
+        return (greater & ~less).astype(numpy.int8) - (less & ~greater).astype(numpy.int8)
+
+    return _blocked_test(pareto_test, objectives1, objectives2, violation1, violation2, block_size)
+
+
+def epsilon_dominance_test_matrix(objectives1: numpy.ndarray,
+                                  objectives2: numpy.ndarray,
+                                  epsilon: float,
+                                  violation1: numpy.ndarray = None,
+                                  violation2: numpy.ndarray = None,
+                                  block_size: int = None) -> numpy.ndarray:
+    """ Batched version of :class:`EpsilonDominanceComparator`, with the same result and parameters as
+    :func:`dominance_test_matrix`.
+
+    The objectives are compared by their boxes of size `epsilon`; if both solutions are in the same box, the one
+    closer to the corner of the box wins (the second one on ties).
+    """
+    boxes1, boxes2 = numpy.floor(objectives1 / epsilon), numpy.floor(objectives2 / epsilon)
+    distances1, distances2 = _distance_to_box(objectives1, boxes1, epsilon), _distance_to_box(objectives2, boxes2,
+                                                                                               epsilon)
+    boxes_and_distances1 = numpy.column_stack((boxes1, distances1))
+    boxes_and_distances2 = numpy.column_stack((boxes2, distances2))
+
+    def epsilon_test(block1: numpy.ndarray, block2: numpy.ndarray) -> numpy.ndarray:
+        less = numpy.any(block1[:, :, :-1] < block2[:, :, :-1], axis=2)
+        greater = numpy.any(block1[:, :, :-1] > block2[:, :, :-1], axis=2)
+        same_box = ~less & ~greater
+        closer = block1[:, :, -1] < block2[:, :, -1]
+
+        result = (greater & ~less).astype(numpy.int8) - (less & ~greater).astype(numpy.int8)
+        result[same_box] = numpy.where(closer[same_box], -1, 1)
+        return result
+
+    return _blocked_test(epsilon_test, boxes_and_distances1, boxes_and_distances2, violation1, violation2, block_size)
+
+
+def _blocked_test(test, values1: numpy.ndarray, values2: numpy.ndarray, violation1: numpy.ndarray,
+                  violation2: numpy.ndarray, block_size: int) -> numpy.ndarray:
+    if violation1 is None:
+        violation1 = numpy.zeros(len(values1))
+    if violation2 is None:
+        violation2 = numpy.zeros(len(values2))
+    if block_size is None:
+        block_size = max(1, 2 ** 22 // max(1, len(values2) * values2.shape[1]))
+
+    result = numpy.zeros((len(values1), len(values2)), dtype=numpy.int8)
+    if result.size == 0:
+        return result
+
+    for start in range(0, len(values1), block_size):
+        block = slice(start, start + block_size)
+        result[block] = test(values1[block, None, :], values2[None, :, :])
+
+        better = violation1[block, None] > violation2[None, :]
+        worse = violation1[block, None] < violation2[None, :]
+        result[block][better] = -1
+        result[block][worse] = 1
+
+    return result
+
+
+def _distance_to_box(objectives: numpy.ndarray, boxes: numpy.ndarray, epsilon: float) -> numpy.ndarray:
+    # Accumulated objective by objective, as EpsilonDominanceComparator does
+    distances = numpy.zeros(len(objectives))
+    for column in range(objectives.shape[1]):
+        distances += (objectives[:, column] - boxes[:, column] * epsilon) ** 2
+
+    return distances
+
+
+def _objective_matrix(solutions: List[Solution]) -> numpy.ndarray:
+    if len(solutions) == 0:
+        return numpy.empty((0, 0))
+
+    return objective_matrix(solutions)
+
+
+def _violation_vector(constraint_comparator: Comparator, solutions: List[Solution]):
+    """ Return the values compared by a constraint comparator (higher is better), or None if the comparator is not
+    supported by the batched dominance tests. """
+    if type(constraint_comparator) is OverallConstraintViolationComparator:
+        return overall_constraint_violation_vector(solutions)
+    elif type(constraint_comparator) is SolutionAttributeComparator and not constraint_comparator.lowest_is_best:
+        values = [solution.attributes.get(constraint_comparator.key) for solution in solutions]
+        return numpy.array([numpy.nan if value is None else value for value in values], dtype=float)
+
+    return None
+
+
+def sort_solutions(solutions: List[S], comparator: Comparator) -> None:
+    """ Sort a list of solutions in place (and stably) according to a comparator.
+
+    If the comparator is key based and all the solutions have the values it needs, the keys are sorted at once with
+    :func:`numpy.lexsort`; otherwise, the list is sorted with :meth:`Comparator.compare` through
+    :func:`functools.cmp_to_key`.
+    """
+    if comparator.key_based and len(solutions) > 1:
+        keys = [comparator.sort_key(solution) for solution in solutions]
+
+        if not any(None in key for key in keys):
+            keys = numpy.array(keys, dtype=float)
+            order = numpy.lexsort(keys.T[::-1])
+            solutions[:] = [solutions[index] for index in order]
+            return
+
+    solutions.sort(key=cmp_to_key(comparator.compare))
@@ -1,12 +1,12 @@
 import logging
 from abc import ABC, abstractmethod
-from functools import cmp_to_key
 from typing import TypeVar, List
 
 import numpy
-from scipy.spatial.distance import euclidean
+from scipy.spatial.distance import cdist
 
-from jmetal.util.comparator import SolutionAttributeComparator, Comparator
+from jmetal.core.population import objective_matrix
+from jmetal.util.comparator import SolutionAttributeComparator, Comparator, sort_solutions
 
 LOGGER = logging.getLogger('jmetal')
 
@@ -33,6 +33,23 @@ class DensityEstimator(List[S], ABC):
     def sort(self, solutions: List[S]) -> List[S]:
         pass
 
+    def truncate(self, solutions: List[S], size: int) -> List[S]:
+        """ Return the best `size` solutions according to the density estimator, sorted from best to worst. """
+        self.sort(solutions)
+        return solutions[:size]
+
+    def truncate_sequentially(self, solutions: List[S], size: int) -> List[S]:
+        """ Remove the worst solution, recomputing the density estimator of the rest, until `size` solutions remain.
+        """
+        result_list = list(solutions)
+        while len(result_list) > size:
+            self.sort(result_list)
+
+            del result_list[-1]
+            self.compute_density_estimator(result_list)
+
+        return result_list
+
     @classmethod
     def get_comparator(cls) -> Comparator:
         pass
@@ -42,55 +59,76 @@ class CrowdingDistance(DensityEstimator[List[S]]):
     """This class implements a DensityEstimator based on the crowding distance of algorithm NSGA-II.
     """
 
-    def compute_density_estimator(self, front: List[S]):
+    def compute_density_estimator(self, front: List[S]) -> numpy.ndarray:
         """This function performs the computation of the crowding density estimation over the solution list.
 
         .. note::
            This method assign the distance in the inner elements of the solution list.
 
         :param front: The list of solutions.
+        :return: The crowding distances of the solutions.
         """
-        size = len(front)
+        distances = self.compute_distances(objective_matrix(front))
 
-        if size is 0:
-            return
-        elif size is 1:
-            front[0].attributes['crowding_distance'] = float("inf")
-            return
-        elif size is 2:
-            front[0].attributes['crowding_distance'] = float("inf")
-            front[1].attributes['crowding_distance'] = float("inf")
-            return
+        for solution, distance in zip(front, distances):
+            solution.attributes['crowding_distance'] = float(distance)
+
+        return distances
 
-        for i in range(len(front)):
-            front[i].attributes['crowding_distance'] = 0.0
+    @staticmethod
+    def compute_distances(objectives: numpy.ndarray) -> numpy.ndarray:
+        """ Compute the crowding distances of the rows of an objective matrix.
 
-        number_of_objectives = front[0].number_of_objectives
+        The rows are stably sorted by each objective in turn (starting from the order of the previous objective), the
+        extreme ones get an infinite distance and the rest add the normalized gap between their neighbours.
+
+        :param objectives: Objective matrix (one row per solution).
+        :return: The crowding distance of every row.
+        """
+        size = objectives.shape[0]
+        if size <= 2:
+            return numpy.full(size, float('inf'))
 
-        for i in range(number_of_objectives):
-            # Sort the population by Obj n
-            front = sorted(front, key=lambda x: x.objectives[i])
-            objective_minn = front[0].objectives[i]
-            objective_maxn = front[len(front) - 1].objectives[i]
+        distances = numpy.zeros(size)
+        order = numpy.arange(size)
+        for column in objectives.T:
+            order = order[numpy.argsort(column[order], kind='stable')]
+            values = column[order]
 
-            # Set de crowding distance
-            front[0].attributes['crowding_distance'] = float('inf')
-            front[size - 1].attributes['crowding_distance'] = float('inf')
+            # Check if minimum and maximum are the same (in which case the gaps are not normalized)
+            gaps = values[2:] - values[:-2]
+            if values[-1] - values[0] != 0:
+                gaps = gaps / (values[-1] - values[0])
 
-            for j in range(1, size - 1):
-                distance = front[j + 1].objectives[i] - front[j - 1].objectives[i]
+            distances[order[1:-1]] += gaps
+            distances[order[[0, -1]]] = float('inf')
 
-                # Check if minimum and maximum are the same (in which case do nothing)
-                if objective_maxn - objective_minn == 0:
-                    pass;  # LOGGER.warning('Minimum and maximum are the same!')
-                else:
-                    distance = distance / (objective_maxn - objective_minn)
+        return distances
 
-                distance += front[j].attributes['crowding_distance']
-                front[j].attributes['crowding_distance'] = distance
+    def truncate(self, solutions: List[S], size: int) -> List[S]:
+        """ Return the `size` solutions with the largest crowding distance, sorted by decreasing distance (ties keep
+        the order of the list). The candidates are selected with a partition of the distance vector, so only them are
+        sorted.
+
+        :param solutions: Solutions with the crowding distance computed.
+        :param size: Number of solutions to keep.
+        """
+        if size <= 0:
+            return []
+
+        distances = numpy.array([solution.attributes['crowding_distance'] for solution in solutions], dtype=float)
+        size = min(size, len(solutions))
+        threshold = distances[numpy.argpartition(-distances, size - 1)[:size]].min()
+
+        larger = numpy.flatnonzero(distances > threshold)
+        tied = numpy.flatnonzero(distances == threshold)[:size - len(larger)]
+        selected = numpy.concatenate((larger, tied))
+        selected = selected[numpy.lexsort((selected, -distances[selected]))]
+
+        return [solutions[index] for index in selected]
 
     def sort(self, solutions: List[S]) -> List[S]:
-        solutions.sort(key=cmp_to_key(self.get_comparator().compare))
+        sort_solutions(solutions, self.get_comparator())
 
     @classmethod
     def get_comparator(cls) -> Comparator:
@@ -107,55 +145,84 @@ class KNearestNeighborDensityEstimator(DensityEstimator[List[S]]):
         self.distance_matrix = []
 
     def compute_density_estimator(self, solutions: List[S]):
-        solutions_size = len(solutions)
-        if solutions_size <= self.k:
+        points = objective_matrix(solutions)
+        self.distance_matrix = cdist(points, points)
+
+        if len(solutions) <= self.k:
             return
 
-        points = []
-        for i in range(solutions_size):
-            points.append(solutions[i].objectives)
-
-        # Compute distance matrix
-        self.distance_matrix = numpy.zeros(shape=(solutions_size, solutions_size))
-        for i in range(solutions_size):
-            for j in range(solutions_size):
-                self.distance_matrix[i, j] = self.distance_matrix[j, i] = euclidean(solutions[i].objectives,
-                                                                                    solutions[j].objectives)
-        # Gets the k-nearest distance of all the solutions
-        for i in range(solutions_size):
-            distances = []
-            for j in range(solutions_size):
-                distances.append(self.distance_matrix[i, j])
-            distances.sort()
-            solutions[i].attributes['knn_density'] = distances[self.k]
+        # Gets the k-nearest distance of all the solutions (the distance of a solution to itself comes first)
+        densities = numpy.partition(self.distance_matrix, self.k, axis=1)[:, self.k]
+        for solution, density in zip(solutions, densities):
+            solution.attributes['knn_density'] = float(density)
 
     def sort(self, solutions: List[S]) -> List[S]:
-        def compare(solution1, solution2):
-            distances1 = solution1.attributes["distances_"]
-            distances2 = solution2.attributes["distances_"]
-
-            tmp_k = self.k
-            if distances1[tmp_k] > distances2[tmp_k]:
-                return -1
-            elif distances1[tmp_k] < distances2[tmp_k]:
-                return 1
+        """ Sort the solutions by decreasing distance to their k-th nearest solution, breaking ties with the next
+        nearest ones. If there are no more than k solutions, their order is kept. """
+        if len(self.distance_matrix) != len(solutions):
+            points = objective_matrix(solutions)
+            self.distance_matrix = cdist(points, points)
+
+        sorted_distances = numpy.sort(self.distance_matrix, axis=1)
+        for solution, distances in zip(solutions, sorted_distances):
+            solution.attributes["distances_"] = distances.tolist()
+
+        if len(solutions) > self.k:
+            solutions[:] = [solutions[index] for index in self._order(sorted_distances)]
+
+    def truncate_sequentially(self, solutions: List[S], size: int) -> List[S]:
+        """ Remove the worst solution until `size` remain, as the default implementation does, but computing the
+        distance matrix and the sorted neighbour lists once: when a solution is removed, it is only deleted from the
+        lists of the rest. Each removal takes O(N^2) array operations instead of recomputing and sorting the matrix.
+
+        Solutions with identical neighbour distances are removed in list order. The result is sorted from best to
+        worst by the last sort and the `knn_density` of the remaining solutions is updated.
+        """
+        if len(solutions) <= size:
+            return list(solutions)
+
+        points = objective_matrix(solutions)
+        distances = cdist(points, points)
+
+        neighbors = numpy.argsort(distances, axis=1, kind='stable')
+        sorted_distances = numpy.take_along_axis(distances, neighbors, axis=1)
+        members = numpy.arange(len(solutions))
+
+        while len(members) > size:
+            if len(members) == size + 1:
+                order = self._order(sorted_distances)
+                members, neighbors, sorted_distances = members[order], neighbors[order], sorted_distances[order]
+                worst = size
             else:
-                while tmp_k < (len(distances1) - 1):
-                    tmp_k += 1
-                    if distances1[tmp_k] > distances2[tmp_k]:
-                        return -1
-                    elif distances1[tmp_k] < distances2[tmp_k]:
-                        return 1
-            return 0
-
-        for i in range(len(solutions)):
-            distances = []
-            for j in range(len(solutions)):
-                distances.append(self.distance_matrix[i, j])
-            distances.sort()
-            solutions[i].attributes["distances_"] = distances
-
-        solutions.sort(key=cmp_to_key(compare))
+                worst = self._worst(sorted_distances)
+
+            removed = members[worst]
+            members = numpy.delete(members, worst)
+            keep = neighbors != removed
+            keep[worst] = False
+            neighbors = neighbors[keep].reshape(len(members), len(members))
+            sorted_distances = sorted_distances[keep].reshape(len(members), len(members))
+
+        self.distance_matrix = distances[numpy.ix_(members, members)]
+        if len(members) > self.k:
+            for index, density in zip(members, sorted_distances[:, self.k]):
+                solutions[index].attributes['knn_density'] = float(density)
+
+        return [solutions[index] for index in members]
+
+    def _order(self, sorted_distances: numpy.ndarray) -> numpy.ndarray:
+        # Lexicographic order of the rows from column k (numpy.lexsort uses the last key as the primary one)
+        return numpy.lexsort(-sorted_distances[:, self.k:][:, ::-1].T)
+
+    def _worst(self, sorted_distances: numpy.ndarray) -> int:
+        candidates = numpy.arange(len(sorted_distances))
+        for column in range(self.k, sorted_distances.shape[1]):
+            values = sorted_distances[candidates, column]
+            candidates = candidates[values == values.min()]
+            if len(candidates) == 1:
+                break
+
+        return candidates[-1]
 
     @classmethod
     def get_comparator(cls) -> Comparator:
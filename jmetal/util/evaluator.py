@@ -1,19 +1,58 @@
+import asyncio
 import functools
+import hashlib
+import os
+import json
+import logging
+import pickle
+import selectors
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from enum import Enum
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
 from multiprocessing.pool import ThreadPool, Pool
-from typing import TypeVar, List, Generic
+from typing import TypeVar, List, Generic, Iterator
+
+import numpy
+
+try:
+    # Python 3.8+
+    from multiprocessing import resource_tracker
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:
+    pass
 
 try:
     import dask
 except ImportError:
     pass
 
+try:
+    from distributed import Client, as_completed
+except ImportError:
+    pass
+
 try:
     from pyspark import SparkConf, SparkContext
 except ImportError:
     pass
 
-from jmetal.core.problem import Problem
+from jmetal.core.population import Population
+from jmetal.core.problem import Problem, DynamicProblem
+from jmetal.util.surrogate import Surrogate, KrigingSurrogate, non_dominated_levels
+
+LOGGER = logging.getLogger('jmetal')
+
+# Python 3.7+; before, the CPU time of the whole process is used (exact unless the evaluations run in threads)
+_thread_time = getattr(time, 'thread_time', time.process_time)
 
 S = TypeVar('S')
 
@@ -28,63 +67,1483 @@ class Evaluator(Generic[S], ABC):
     def evaluate_solution(solution: S, problem: Problem) -> None:
         problem.evaluate(solution)
 
+    @staticmethod
+    def problem_has_changed(problem: Problem) -> bool:
+        """ Return whether the problem is a :class:`DynamicProblem` that reports a change. """
+        return isinstance(problem, DynamicProblem) and problem.the_problem_has_changed()
+
+    @staticmethod
+    def evaluate_batch(solution_list: List[S], problem: Problem) -> None:
+        """ Evaluate all the solutions with a single call to `problem.evaluate_batch` (see :class:`Problem`). """
+        if len(solution_list) == 0:
+            return
+
+        if isinstance(solution_list, Population):
+            objectives, constraints = problem.evaluate_batch(solution_list.variables)
+            solution_list.objectives[:] = objectives
+            solution_list.constraints[:] = constraints
+        else:
+            variables = numpy.array([solution.variables for solution in solution_list], dtype=float)
+            objectives, constraints = problem.evaluate_batch(variables)
+
+            for solution, f, g in zip(solution_list, objectives.tolist(), constraints.tolist()):
+                solution.objectives = f
+                solution.constraints = g
+
 
 class SequentialEvaluator(Evaluator[S]):
 
     def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
-        for solution in solution_list:
-            Evaluator.evaluate_solution(solution, problem)
+        if supports_batch_evaluation(problem):
+            Evaluator.evaluate_batch(solution_list, problem)
+        else:
+            for solution in solution_list:
+                Evaluator.evaluate_solution(solution, problem)
 
         return solution_list
 
 
+class AdaptiveChunkSize:
+    """ Chooses the number of solutions sent to a worker at once from the latencies measured in previous evaluations.
+
+    Cheap evaluations are grouped in large chunks (aiming at `target_time` seconds per chunk, with at most one chunk
+    per worker) to amortize the dispatching overhead, while heavy-tailed evaluation times (a coefficient of variation
+    above `heavy_tail_threshold`) are sent one by one so that a slow evaluation does not delay the rest of its chunk.
+    """
+
+    def __init__(self, number_of_workers: int, target_time: float = 0.05, heavy_tail_threshold: float = 1.0,
+                 smoothing: float = 0.5):
+        self.number_of_workers = number_of_workers
+        self.target_time = target_time
+        self.heavy_tail_threshold = heavy_tail_threshold
+        self.smoothing = smoothing
+
+        self.mean_latency = None
+        self.latency_variation = 0.0
+
+    def update(self, latencies: List[float]) -> None:
+        if len(latencies) == 0:
+            return
+
+        mean = sum(latencies) / len(latencies)
+        variance = sum((latency - mean) ** 2 for latency in latencies) / len(latencies)
+        variation = variance ** 0.5 / mean if mean > 0 else 0.0
+
+        if self.mean_latency is None:
+            self.mean_latency, self.latency_variation = mean, variation
+        else:
+            self.mean_latency += self.smoothing * (mean - self.mean_latency)
+            self.latency_variation += self.smoothing * (variation - self.latency_variation)
+
+    def get(self, number_of_tasks: int) -> int:
+        if self.mean_latency is None:
+            # Same heuristic as multiprocessing.Pool.map until latencies are known
+            return max(1, -(-number_of_tasks // (4 * self.number_of_workers)))
+
+        if self.latency_variation > self.heavy_tail_threshold:
+            return 1
+
+        chunk_size_by_time = round(self.target_time / self.mean_latency) if self.mean_latency > 0 else number_of_tasks
+        chunk_size_by_workers = -(-number_of_tasks // self.number_of_workers)
+
+        return max(1, min(chunk_size_by_time, chunk_size_by_workers))
+
+
 class MapEvaluator(Evaluator[S]):
 
+    def __init__(self, processes: int = None, chunk_size: int = None):
+        """
+        :param processes: Number of workers.
+        :param chunk_size: Fixed chunk size. If None, it is adapted to the measured evaluation latencies.
+        """
+        self.processes = processes or os.cpu_count()
+        self.pool = self.create_pool(processes)
+        self.chunk_size = chunk_size
+        self.adaptive_chunk_size = AdaptiveChunkSize(processes or os.cpu_count())
+
+    def create_pool(self, processes: int):
+        return ThreadPool(processes)
+
+    def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
+        results = self.pool.map(functools.partial(_timed_evaluation, problem=problem), solution_list,
+                                chunksize=self._get_chunk_size(len(solution_list)))
+        self.adaptive_chunk_size.update([latency for _, latency in results])
+
+        return solution_list
+
+    def evaluate_as_completed(self, solution_list: List[S], problem: Problem) -> Iterator[S]:
+        """ Evaluate the solutions, yielding each of them as soon as its evaluation finishes. """
+        latencies = []
+        for solution, latency in self.pool.imap_unordered(functools.partial(_timed_evaluation, problem=problem),
+                                                          solution_list,
+                                                          chunksize=self._get_chunk_size(len(solution_list))):
+            latencies.append(latency)
+            yield solution
+
+        self.adaptive_chunk_size.update(latencies)
+
+    def _get_chunk_size(self, number_of_tasks: int) -> int:
+        return self.chunk_size or self.adaptive_chunk_size.get(number_of_tasks)
+
+
+class MultiprocessEvaluator(MapEvaluator[S]):
+
+    def create_pool(self, processes: int):
+        return Pool(processes)
+
+    def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
+        results = self.pool.map(functools.partial(_timed_evaluation, problem=problem), solution_list,
+                                chunksize=self._get_chunk_size(len(solution_list)))
+        self.adaptive_chunk_size.update([latency for _, latency in results])
+
+        return [solution for solution, _ in results]
+
+
+class SharedMemoryEvaluator(Evaluator[S]):
+    """ Multiprocess evaluator for float and integer problems that does not pickle solutions. The matrix of decision
+    variables is written into a shared memory block and each worker evaluates a slice of it, storing the objectives and
+    constraints in place into a second shared block. Only the problem and the block names are sent to the workers.
+
+    .. warning:: Requires Python 3.8 or later (:py:mod:`multiprocessing.shared_memory`).
+    """
+
     def __init__(self, processes: int = None):
-        self.pool = ThreadPool(processes)
+        self.processes = processes or os.cpu_count()
+
+        # The workers must share the resource tracker of this process, which owns (and unlinks) the shared blocks
+        resource_tracker.ensure_running()
+        self.pool = Pool(self.processes)
 
     def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
-        self.pool.map(lambda solution: Evaluator.evaluate_solution(solution, problem), solution_list)
+        number_of_solutions = len(solution_list)
+        if number_of_solutions == 0:
+            return solution_list
+
+        if isinstance(solution_list, Population):
+            variables = solution_list.variables
+        else:
+            variables = numpy.array([solution.variables for solution in solution_list])
+
+        number_of_objectives = problem.number_of_objectives
+        output_shape = (number_of_solutions, number_of_objectives + problem.number_of_constraints)
+
+        input_memory = SharedMemory(create=True, size=max(variables.nbytes, 1))
+        output_memory = SharedMemory(create=True, size=max(output_shape[0] * output_shape[1] * 8, 1))
+        try:
+            shared_variables = numpy.ndarray(variables.shape, dtype=variables.dtype, buffer=input_memory.buf)
+            shared_variables[:] = variables
+            del shared_variables
+
+            chunk_size = -(-number_of_solutions // self.processes)
+            chunks = [(start, min(start + chunk_size, number_of_solutions))
+                      for start in range(0, number_of_solutions, chunk_size)]
+
+            self.pool.map(functools.partial(_evaluate_shared_chunk,
+                                            problem=problem,
+                                            input_name=input_memory.name,
+                                            output_name=output_memory.name,
+                                            input_shape=variables.shape,
+                                            input_dtype=variables.dtype.str), chunks)
+
+            shared_output = numpy.ndarray(output_shape, buffer=output_memory.buf)
+            output = shared_output.copy()
+            del shared_output
+        finally:
+            input_memory.close()
+            input_memory.unlink()
+            output_memory.close()
+            output_memory.unlink()
+
+        if isinstance(solution_list, Population):
+            solution_list.objectives[:] = output[:, :number_of_objectives]
+            solution_list.constraints[:] = output[:, number_of_objectives:]
+        else:
+            for solution, values in zip(solution_list, output.tolist()):
+                solution.objectives = values[:number_of_objectives]
+                solution.constraints = values[number_of_objectives:]
 
         return solution_list
 
 
-class MultiprocessEvaluator(Evaluator[S]):
+class WorkerPoolEvaluator(Evaluator[S]):
+    """ Multiprocess evaluator whose workers receive the problem once, at startup, through the pool initializer; after
+    that, only the solutions are sent to the workers and only their objectives and constraints are sent back. This
+    pays off for problems holding large data (e.g., the distance matrix of :class:`TSP`).
+
+    Pools are shared by all the instances of this class in the same process, so they survive across algorithm runs.
+    Each pool is tagged with the number of processes and a fingerprint of the problem (a hash of its pickled state).
+    When an evaluator is asked to evaluate a different problem, or a :class:`DynamicProblem` reports a change, it moves
+    to the pool of the new fingerprint; its previous pool is terminated once no other evaluator uses it.
+    """
+
+    _pools = {}
+    _users = {}
+    _lock = threading.Lock()
+
     def __init__(self, processes: int = None):
-        super().__init__()
-        self.pool = Pool(processes)
+        self.processes = processes or os.cpu_count()
+        self._problem = None
+        self._fingerprint = None
+
+    def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
+        pool = self._get_pool(problem)
+        results = pool.map(evaluate_with_installed_problem, solution_list)
+
+        for solution, (objectives, constraints) in zip(solution_list, results):
+            solution.objectives = objectives
+            solution.constraints = constraints
+
+        return solution_list
+
+    def _get_pool(self, problem: Problem) -> Pool:
+        previous_fingerprint = self._fingerprint
+        if problem is not self._problem or self.problem_has_changed(problem):
+            self._problem = problem
+            self._fingerprint = fingerprint(problem)
+
+        key = (self.processes, self._fingerprint)
+        with WorkerPoolEvaluator._lock:
+            if previous_fingerprint not in (None, self._fingerprint):
+                self._release((self.processes, previous_fingerprint))
+
+            pool = WorkerPoolEvaluator._pools.get(key)
+            if pool is None:
+                pool = Pool(self.processes, initializer=install_problem, initargs=(problem,))
+                WorkerPoolEvaluator._pools[key] = pool
+                # Evaluators that are garbage collected stop counting as users
+                WorkerPoolEvaluator._users[key] = weakref.WeakSet()
+            WorkerPoolEvaluator._users[key].add(self)
+
+        return pool
+
+    def _release(self, key: tuple) -> None:
+        users = WorkerPoolEvaluator._users.get(key)
+        if users is None:
+            return
+
+        users.discard(self)
+        if not users:
+            del WorkerPoolEvaluator._users[key]
+            WorkerPoolEvaluator._pools.pop(key).terminate()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """ Terminate all the worker pools. """
+        with cls._lock:
+            for pool in cls._pools.values():
+                pool.terminate()
+            cls._pools.clear()
+            cls._users.clear()
+
+
+class AsyncEvaluator(Evaluator[S]):
+    """ Evaluator for I/O-bound problems (e.g., calling external simulators or local services). Problems may define
+    a coroutine `async def evaluate_async(self, solution)`; otherwise, `evaluate` is run in the default executor of the
+    event loop.
+
+    The evaluations run on an event loop owned by the evaluator (in a background thread), so it can be used from
+    synchronous algorithms. At most `max_concurrency` evaluations are in flight at any time: that number of coroutines
+    pull the solutions one by one, so no more work is started until a previous evaluation finishes.
+    """
+
+    def __init__(self, max_concurrency: int = 16):
+        self.max_concurrency = max_concurrency
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
+        asyncio.run_coroutine_threadsafe(self.evaluate_async(solution_list, problem), self.loop).result()
+
+        return solution_list
+
+    async def evaluate_async(self, solution_list: List[S], problem: Problem) -> List[S]:
+        pending_solutions = iter(solution_list)
+
+        async def worker():
+            for solution in pending_solutions:
+                await _evaluate_solution_async(solution, problem)
+
+        number_of_workers = min(self.max_concurrency, len(solution_list))
+        await asyncio.gather(*[worker() for _ in range(number_of_workers)])
+
+        return solution_list
+
+    def close(self) -> None:
+        """ Stop the event loop of the evaluator. """
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+class CachingEvaluator(Evaluator[S]):
+    """ Evaluator wrapping another one to avoid re-evaluating solutions whose variables have been evaluated before
+    (e.g., offspring identical to their parents, which is common in binary and permutation problems). The objectives
+    and constraints are stored in a LRU cache keyed by the variables, bounded by a number of entries and, optionally,
+    by an estimation of its memory usage in bytes.
+
+    Algorithms keep counting every solution in the list as evaluated, so the stopping conditions based on the number
+    of evaluations (e.g., :class:`StoppingByEvaluations`) behave exactly as without the cache; the number of calls
+    to the problem is available in `misses`.
+    """
+
+    def __init__(self, evaluator: Evaluator = None, maximum_size: int = 100000,
+                 maximum_memory: int = None):
+        """
+        :param evaluator: Evaluator used for the solutions not found in the cache (by default, a
+            :class:`SequentialEvaluator`).
+        :param maximum_size: Maximum number of cached entries.
+        :param maximum_memory: Maximum (estimated) size of the cache in bytes. If None, only `maximum_size` applies.
+        """
+        self.evaluator = evaluator if evaluator is not None else SequentialEvaluator()
+        self.maximum_size = maximum_size
+        self.maximum_memory = maximum_memory
+
+        self.cache = OrderedDict()
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self._problem = None
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
+        if problem is not self._problem or self.problem_has_changed(problem):
+            self.clear()
+            self._problem = problem
+
+        keys = [_freeze(solution.variables) for solution in solution_list]
+        cached_entries = self.lookup(set(keys), problem)
+
+        pending = OrderedDict()
+        for key, solution in zip(keys, solution_list):
+            entry = cached_entries.get(key)
+
+            if entry is not None:
+                self.hits += 1
+                solution.objectives, solution.constraints = entry[0][:], entry[1][:]
+            elif key in pending:
+                self.hits += 1
+                pending[key].append(solution)
+            else:
+                self.misses += 1
+                pending[key] = [solution]
+
+        if pending:
+            evaluated = self.evaluator.evaluate([solutions[0] for solutions in pending.values()], problem)
+
+            new_entries = {}
+            for (key, solutions), evaluated_solution in zip(pending.items(), evaluated):
+                objectives, constraints = list(evaluated_solution.objectives), list(evaluated_solution.constraints)
+                for solution in solutions:
+                    solution.objectives, solution.constraints = objectives[:], constraints[:]
+
+                new_entries[key] = (objectives, constraints)
+
+            self.store(new_entries, problem)
+
+        return solution_list
+
+    def lookup(self, keys: set, problem: Problem) -> dict:
+        """ Return the (objectives, constraints) pairs stored for the given keys that are found in the cache. """
+        entries = {}
+        for key in keys:
+            entry = self.cache.get(key)
+            if entry is not None:
+                self.cache.move_to_end(key)
+                entries[key] = entry[0], entry[1]
+
+        return entries
+
+    def store(self, entries: dict, problem: Problem) -> None:
+        """ Add new (objectives, constraints) pairs to the cache. """
+        for key, (objectives, constraints) in entries.items():
+            self._store_in_memory(key, objectives, constraints)
+
+    def clear(self) -> None:
+        self.cache.clear()
+        self.memory = 0
+
+    def _store_in_memory(self, key, objectives: list, constraints: list) -> None:
+        size = _size_of(key) + _size_of(objectives) + _size_of(constraints)
+        self.cache[key] = (objectives, constraints, size)
+        self.memory += size
+
+        while len(self.cache) > self.maximum_size or \
+                (self.maximum_memory is not None and self.memory > self.maximum_memory and len(self.cache) > 1):
+            _, (_, _, evicted_size) = self.cache.popitem(last=False)
+            self.memory -= evicted_size
+
+
+class PersistentCachingEvaluator(CachingEvaluator[S]):
+    """ :class:`CachingEvaluator` backed by a SQLite database, so evaluations are reused across runs, processes and
+    :class:`jmetal.lab.experiment.Experiment` jobs (e.g., the initial populations injected with
+    :class:`InjectorGenerator`, or the evaluations of a crashed experiment that is run again). Entries are keyed by a
+    description of the problem (its class, name and numbers of variables, objectives and constraints) and a hash of
+    the variables. For dynamic problems, the description also includes a fingerprint of their state, taken again
+    whenever they change, so the evaluations made before a change are not reused after it. The database uses
+    write-ahead logging and `INSERT OR IGNORE`, so any number of processes can read and write it concurrently.
+
+    Example:
+
+    >>> jobs = [Job(algorithm=NSGAII(..., population_evaluator=PersistentCachingEvaluator(filename='cache.db')), ...)]
+    """
+
+    def __init__(self, evaluator: Evaluator = None, filename: str = 'evaluations.db',
+                 maximum_size: int = 100000, maximum_memory: int = None, timeout: float = 60.0):
+        """
+        :param evaluator: Evaluator used for the solutions not found in the cache (by default, a
+            :class:`SequentialEvaluator`).
+        :param filename: Path of the SQLite database. It is created if it does not exist.
+        :param maximum_size: Maximum number of entries of the in-memory LRU cache placed before the database.
+        :param maximum_memory: Maximum (estimated) size in bytes of the in-memory cache.
+        :param timeout: Seconds to wait for a database lock held by another process.
+        """
+        super(PersistentCachingEvaluator, self).__init__(evaluator, maximum_size, maximum_memory)
+        self.filename = filename
+        self.timeout = timeout
+        self._connection = None
+        self._pid = None
+        self._problem_key = None
+
+    def clear(self) -> None:
+        super(PersistentCachingEvaluator, self).clear()
+        # Called when the problem is replaced or changes, so its key is computed again
+        self._problem_key = None
+
+    def lookup(self, keys: set, problem: Problem) -> dict:
+        entries = super(PersistentCachingEvaluator, self).lookup(keys, problem)
+
+        digests = {_digest(key): key for key in keys if key not in entries}
+        digest_list = list(digests)
+        connection = self._get_connection()
+
+        # SQLite limits the number of parameters of a query
+        for start in range(0, len(digest_list), 500):
+            chunk = digest_list[start:start + 500]
+            rows = connection.execute(
+                'SELECT key, value FROM evaluations WHERE problem = ? AND key IN ({})'.format(','.join('?' * len(chunk))),
+                [self._get_problem_key(problem)] + chunk).fetchall()
+
+            for digest, value in rows:
+                key = digests[digest]
+                objectives, constraints = json.loads(value)
+                entries[key] = objectives, constraints
+                self._store_in_memory(key, objectives, constraints)
+
+        return entries
+
+    def store(self, entries: dict, problem: Problem) -> None:
+        super(PersistentCachingEvaluator, self).store(entries, problem)
+
+        connection = self._get_connection()
+        with connection:
+            connection.executemany(
+                'INSERT OR IGNORE INTO evaluations (problem, key, value) VALUES (?, ?, ?)',
+                [(self._get_problem_key(problem), _digest(key), json.dumps(value)) for key, value in entries.items()])
+
+    def _get_problem_key(self, problem: Problem) -> str:
+        if self._problem_key is None:
+            problem_class = type(problem)
+            self._problem_key = '{}.{}:{}:{}:{}:{}'.format(
+                problem_class.__module__, problem_class.__qualname__, problem.get_name(), problem.number_of_variables,
+                problem.number_of_objectives, problem.number_of_constraints)
+
+            if isinstance(problem, DynamicProblem):
+                self._problem_key += ':' + fingerprint(problem)
+
+        return self._problem_key
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # Connections cannot be shared between processes, so a new one is opened after a fork
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.filename, timeout=self.timeout, check_same_thread=False)
+            self._pid = os.getpid()
+
+            with self._connection:
+                self._connection.execute('PRAGMA journal_mode=WAL')
+                self._connection.execute('CREATE TABLE IF NOT EXISTS evaluations '
+                                         '(problem TEXT, key TEXT, value TEXT, PRIMARY KEY (problem, key))')
+
+        return self._connection
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_connection'] = None
+
+        return state
+
+
+class FailurePolicyType(Enum):
+    PENALTY = 1
+    RETRY = 2
+    DROP = 3
+
+
+class StragglerTolerantEvaluator(Evaluator[S]):
+    """ Multiprocess evaluator that does not let a slow or hung evaluation stall the whole population.
+
+    * Evaluations running for more than `timeout` seconds are cancelled (their worker process is killed and restarted).
+    * When there is nothing else to do, an idle worker launches a speculative copy of any evaluation running for more
+      than `speculation_factor` times the median latency of the list; the first copy to finish wins. The losing copies
+      are left to finish (also across calls) and their results are discarded; they are only killed when they exceed
+      the timeout, so set one if evaluations can hang.
+    * Failed evaluations (timed out or raising an exception) are handled according to `failure_policy`: PENALTY sets
+      all the objectives to `penalty`, RETRY evaluates them again up to `max_retries` times (and then applies the
+      penalty) and DROP applies the penalty and also marks them with the attribute `evaluation_dropped`, so the
+      caller can discard them.
+
+    The returned list contains all the solutions, in the order of the input list. Penalized solutions are marked with
+    the attribute `evaluation_failed`.
+    """
+
+    def __init__(self,
+                 processes: int = None,
+                 timeout: float = None,
+                 speculation_factor: float = 2.0,
+                 failure_policy: FailurePolicyType = FailurePolicyType.PENALTY,
+                 penalty: float = float('inf'),
+                 max_retries: int = 1,
+                 polling_interval: float = 0.05):
+        """
+        :param processes: Number of worker processes.
+        :param timeout: Maximum time (in seconds) of an evaluation. If None, evaluations never time out.
+        :param speculation_factor: Launch copies of evaluations slower than this factor times the median latency. If
+            None, no speculative copies are launched.
+        :param failure_policy: Policy applied to the evaluations that fail.
+        :param penalty: Value assigned to the objectives of penalized solutions.
+        :param max_retries: Maximum number of times a failed evaluation is retried (RETRY policy).
+        :param polling_interval: Maximum time (in seconds) waiting for results before checking for stragglers.
+        """
+        self.processes = processes or os.cpu_count()
+        self.timeout = timeout
+        self.speculation_factor = speculation_factor
+        self.failure_policy = failure_policy
+        self.penalty = penalty
+        self.max_retries = max_retries
+        self.polling_interval = polling_interval
+
+        self.workers = []
+        self._problem = None
+        # Losing speculative copies still running after the call that launched them (their index is None)
+        self._orphans = {}
+
+    def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
+        self._start_workers(problem)
+
+        pending = deque(range(len(solution_list)))
+        failures = [0] * len(solution_list)
+        latencies = []
+        speculated = set()
+        results = {}
+        running = self._orphans
+        self._orphans = {}
+
+        while len(results) < len(solution_list):
+            for worker in self.workers:
+                if worker in running:
+                    continue
+
+                index = self._next_task(pending, running, results, latencies, speculated)
+                if index is None:
+                    break
+
+                worker.connection.send(solution_list[index])
+                running[worker] = (index, time.time())
+
+            busy = {worker.connection: worker for worker in running}
+            for connection in wait(list(busy), timeout=self._get_waiting_time(running)):
+                worker = busy[connection]
+                index, start = running.pop(worker)
+
+                try:
+                    status, payload = connection.recv()
+                except (EOFError, OSError):
+                    worker.restart(problem)
+                    status, payload = 'error', 'the worker process died'
+
+                if index is None:
+                    continue
+                elif status == 'ok':
+                    latencies.append(time.time() - start)
+                    if index not in results:
+                        results[index] = payload
+                else:
+                    LOGGER.warning('Evaluation of solution {} failed: {}'.format(index, payload))
+                    self._handle_failure(index, failures, pending, running, results)
+
+            if self.timeout is not None:
+                now = time.time()
+                for worker, (index, start) in list(running.items()):
+                    if now - start > self.timeout:
+                        del running[worker]
+                        worker.restart(problem)
+                        if index is not None:
+                            LOGGER.warning('Evaluation of solution {} timed out'.format(index))
+                            self._handle_failure(index, failures, pending, running, results)
+
+        self._orphans = {worker: (None, start) for worker, (_, start) in running.items()}
+
+        for index, solution in enumerate(solution_list):
+            result = results[index]
+
+            if result is _PENALIZED:
+                solution.objectives = [self.penalty] * problem.number_of_objectives
+                solution.attributes['evaluation_failed'] = True
+                if self.failure_policy is FailurePolicyType.DROP:
+                    solution.attributes['evaluation_dropped'] = True
+            else:
+                solution.objectives, solution.constraints = result
+
+        return solution_list
+
+    def shutdown(self) -> None:
+        for worker in self.workers:
+            worker.terminate()
+        self.workers = []
+        self._problem = None
+        self._orphans = {}
+
+    def _start_workers(self, problem: Problem) -> None:
+        if problem is not self._problem or self.problem_has_changed(problem):
+            self.shutdown()
+            self.workers = [_Worker(problem) for _ in range(self.processes)]
+            self._problem = problem
+
+    def _next_task(self, pending: deque, running: dict, results: dict, latencies: list, speculated: set):
+        while pending:
+            index = pending.popleft()
+            if index not in results:
+                return index
+
+        if self.speculation_factor is None or not latencies:
+            return None
+
+        # Speculative execution of the slowest evaluation running with a single copy (at most once per solution)
+        threshold = self.speculation_factor * sorted(latencies)[len(latencies) // 2]
+        copies = {}
+        for index, start in running.values():
+            if index is not None:
+                copies.setdefault(index, []).append(start)
+
+        now = time.time()
+        stragglers = [(starts[0], index) for index, starts in copies.items()
+                      if len(starts) == 1 and index not in speculated and now - starts[0] > threshold]
+
+        if not stragglers:
+            return None
+
+        index = min(stragglers)[1]
+        speculated.add(index)
+
+        return index
+
+    def _handle_failure(self, index: int, failures: list, pending: deque, running: dict, results: dict) -> None:
+        if index in results or any(running_index == index for running_index, _ in running.values()):
+            return
+
+        failures[index] += 1
+        if self.failure_policy is FailurePolicyType.RETRY and failures[index] <= self.max_retries:
+            pending.append(index)
+        else:
+            results[index] = _PENALIZED
+
+    def _get_waiting_time(self, running: dict) -> float:
+        waiting_time = self.polling_interval
+        if self.timeout is not None and running:
+            first_deadline = min(start for _, start in running.values()) + self.timeout
+            waiting_time = min(waiting_time, max(0.0, first_deadline - time.time()))
+
+        return waiting_time
+
+
+class ExternalSimulatorEvaluator(Evaluator[S]):
+    """ Evaluator delegating the evaluations to a pool of long-lived external processes (e.g., simulators with a long
+    startup time), which are started once and reused across calls.
+
+    The processes read requests from their standard input and write responses to their standard output, one per line,
+    with whitespace-separated fields:
+
+    * Request: `<id> <variable 1> ... <variable n>`
+    * Response: `<id> <objective 1> ... <objective m> <constraint 1> ... <constraint k>`
+
+    Each process may have up to `pipeline_depth` requests outstanding and may answer them in any order. The problem is
+    only used to know the number of objectives and constraints. A process that exits, or that has outstanding requests
+    but does not answer any of them within `timeout` seconds, is (killed and) restarted and its outstanding requests are
+    sent again (at most `max_restarts` times per solution).
+    """
+
+    def __init__(self, command: List[str], processes: int = None, pipeline_depth: int = 4, max_restarts: int = 3,
+                 timeout: float = None):
+        """
+        :param command: Command (program and arguments) starting a simulator process.
+        :param processes: Number of simulator processes.
+        :param pipeline_depth: Maximum number of outstanding requests per process.
+        :param max_restarts: Maximum number of times a solution is resent after the crash of its process.
+        :param timeout: Maximum time (in seconds) a process with outstanding requests may go without answering before
+            it is considered hung. If None, the processes are waited for indefinitely.
+        """
+        self.command = command
+        self.processes = processes or os.cpu_count()
+        self.pipeline_depth = pipeline_depth
+        self.max_restarts = max_restarts
+        self.timeout = timeout
+
+        self.workers = []
+        self.selector = None
+
+    def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
+        if not self.workers:
+            self._start_workers()
+
+        pending = deque(range(len(solution_list)))
+        restarts = [0] * len(solution_list)
+        results = {}
+
+        try:
+            while len(results) < len(solution_list):
+                for worker in self.workers:
+                    while pending and len(worker.outstanding) < self.pipeline_depth:
+                        index = pending.popleft()
+                        if not worker.send(index, solution_list[index].variables):
+                            pending.appendleft(index)
+                            self._restart(worker, pending, restarts)
+                            break
+
+                for key, _ in self.selector.select(self._waiting_time()):
+                    worker = key.data
+                    lines = worker.read_lines()
+
+                    if lines is None:
+                        self._restart(worker, pending, restarts)
+                        continue
+
+                    for line in lines:
+                        index, values = self._parse(line, problem)
+                        worker.outstanding.discard(index)
+                        results[index] = values
+
+                for worker in self._hung_workers():
+                    self._restart(worker, pending, restarts)
+        except BaseException:
+            # Outstanding requests would be answered in later calls, so the processes are discarded
+            self.shutdown()
+            raise
+
+        for index, solution in enumerate(solution_list):
+            values = results[index]
+            solution.objectives = values[:problem.number_of_objectives]
+            solution.constraints = values[problem.number_of_objectives:]
+
+        return solution_list
+
+    def shutdown(self) -> None:
+        for worker in self.workers:
+            worker.terminate()
+        if self.selector is not None:
+            self.selector.close()
+
+        self.workers = []
+        self.selector = None
+
+    def _start_workers(self) -> None:
+        self.selector = selectors.DefaultSelector()
+        for _ in range(self.processes):
+            worker = _SimulatorProcess(self.command)
+            self.workers.append(worker)
+            self.selector.register(worker.process.stdout, selectors.EVENT_READ, worker)
+
+    def _waiting_time(self):
+        """ Time until the first process with outstanding requests times out (None if there is no timeout). """
+        if self.timeout is None:
+            return None
+
+        deadlines = [worker.last_activity + self.timeout for worker in self.workers if worker.outstanding]
+        if not deadlines:
+            return None
+
+        return max(0.0, min(deadlines) - time.time())
+
+    def _hung_workers(self) -> list:
+        if self.timeout is None:
+            return []
+
+        now = time.time()
+        return [worker for worker in self.workers
+                if worker.outstanding and now - worker.last_activity >= self.timeout]
+
+    def _restart(self, worker: '_SimulatorProcess', pending: deque, restarts: list) -> None:
+        for index in sorted(worker.outstanding, reverse=True):
+            restarts[index] += 1
+            if restarts[index] > self.max_restarts:
+                raise RuntimeError('Solution {} crashed or hung the simulator {} times'.format(index, restarts[index]))
+            pending.appendleft(index)
+
+        if worker.process.poll() is None:
+            LOGGER.warning('Simulator process {} timed out; restarting it'.format(worker.process.pid))
+        else:
+            LOGGER.warning('Simulator process {} exited; restarting it'.format(worker.process.pid))
+
+        self.selector.unregister(worker.process.stdout)
+        worker.restart()
+        self.selector.register(worker.process.stdout, selectors.EVENT_READ, worker)
+
+    @staticmethod
+    def _parse(line: bytes, problem: Problem):
+        fields = line.split()
+        expected_values = problem.number_of_objectives + problem.number_of_constraints
+
+        if len(fields) != expected_values + 1:
+            raise ValueError('Invalid response from the simulator: {!r}'.format(line))
+
+        return int(fields[0]), [float(field) for field in fields[1:]]
+
+
+class InstrumentedEvaluator(Evaluator[S]):
+    """ Wrapper recording where the evaluation time of any evaluator goes:
+
+    * Histogram of the latency of the evaluations (`latency_histogram`, with logarithmic bins).
+    * Wall time of the calls versus the summed time and CPU time of the evaluations.
+    * Fraction of time the workers are idle and number of evaluations per second.
+
+    Each evaluation is timed where it runs, so the figures include the work done in threads, processes or remote
+    workers. Evaluators that only ship the variables back (e.g., :class:`SharedMemoryEvaluator`) or problems evaluated
+    in batch do not return per-solution timings; for them, the latency is approximated by the wall time of the call
+    divided by the number of solutions and the CPU time is measured in the current process.
+
+    The algorithms add the figures returned by :meth:`get_statistics` to their observable data under the key
+    `EVALUATOR_STATISTICS`, so observers such as :class:`ProgressBarObserver` can show them.
+    """
+
+    LATENCY_BINS = numpy.logspace(-6, 4, 41)
+
+    def __init__(self, evaluator: Evaluator[S] = None, number_of_workers: int = None):
+        """
+        :param evaluator: Evaluator to instrument (by default, a :class:`SequentialEvaluator`).
+        :param number_of_workers: Number of workers of the evaluator. If None, its `processes` or `max_concurrency`
+            attribute is used (1 if it has none).
+        """
+        evaluator = evaluator if evaluator is not None else SequentialEvaluator()
+        self.evaluator = evaluator
+        self.number_of_workers = number_of_workers or getattr(evaluator, 'processes', None) or \
+                                 getattr(evaluator, 'max_concurrency', None) or 1
+
+        self.evaluations = 0
+        self.batches = 0
+        self.wall_time = 0.0
+        self.evaluation_time = 0.0
+        self.cpu_time = 0.0
+        self.last_batch_wall_time = 0.0
+        self.last_batch_cpu_time = 0.0
+        self.latency_histogram = numpy.zeros(len(self.LATENCY_BINS) - 1, dtype=int)
+
+        self._problem = None
+        self._instrumented_problem = None
 
     def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
-        return self.pool.map(functools.partial(evaluate_solution, problem=problem), solution_list)
+        # The proxy reports the changes of dynamic problems itself, so the inner evaluator sees them
+        if problem is not self._problem:
+            self._instrumented_problem = _instrument_problem(problem)
+            self._problem = problem
+
+        start_cpu_time = time.process_time()
+        start = time.perf_counter()
+        evaluated_solutions = self.evaluator.evaluate(solution_list, self._instrumented_problem)
+        wall_time = time.perf_counter() - start
+        cpu_time = time.process_time() - start_cpu_time
+
+        latencies, cpu_times = [], []
+        for solution in evaluated_solutions:
+            latency = solution.attributes.pop('evaluation_time', None)
+            solution_cpu_time = solution.attributes.pop('evaluation_cpu_time', None)
+            if latency is not None:
+                latencies.append(latency)
+                cpu_times.append(solution_cpu_time)
+
+        if len(latencies) < len(evaluated_solutions):
+            latencies = [wall_time / max(1, len(evaluated_solutions))] * len(evaluated_solutions)
+        else:
+            cpu_time = sum(cpu_times)
+
+        self._record(len(evaluated_solutions), wall_time, cpu_time, latencies)
+
+        return evaluated_solutions
+
+    def get_statistics(self) -> dict:
+        """ Return the figures recorded since the creation of the evaluator (or the last call to :meth:`reset`). """
+        return {
+            'evaluations': self.evaluations,
+            'batches': self.batches,
+            'wall_time': self.wall_time,
+            'evaluation_time': self.evaluation_time,
+            'cpu_time': self.cpu_time,
+            'last_batch_wall_time': self.last_batch_wall_time,
+            'last_batch_cpu_time': self.last_batch_cpu_time,
+            'evaluations_per_second': self.evaluations_per_second,
+            'idle_fraction': self.idle_fraction,
+            'latency_histogram': (self.latency_histogram.copy(), self.LATENCY_BINS)
+        }
+
+    @property
+    def evaluations_per_second(self) -> float:
+        return self.evaluations / self.wall_time if self.wall_time > 0 else 0.0
+
+    @property
+    def idle_fraction(self) -> float:
+        available_time = self.wall_time * self.number_of_workers
+        if available_time <= 0:
+            return 0.0
+
+        return min(1.0, max(0.0, 1.0 - self.evaluation_time / available_time))
+
+    def reset(self) -> None:
+        self.evaluations = 0
+        self.batches = 0
+        self.wall_time = self.evaluation_time = self.cpu_time = 0.0
+        self.last_batch_wall_time = self.last_batch_cpu_time = 0.0
+        self.latency_histogram[:] = 0
+
+    def _record(self, evaluations: int, wall_time: float, cpu_time: float, latencies: List[float]) -> None:
+        self.evaluations += evaluations
+        self.batches += 1
+        self.wall_time += wall_time
+        self.evaluation_time += sum(latencies)
+        self.cpu_time += cpu_time
+        self.last_batch_wall_time = wall_time
+        self.last_batch_cpu_time = cpu_time
+
+        clipped_latencies = numpy.clip(latencies, self.LATENCY_BINS[0], self.LATENCY_BINS[-1])
+        self.latency_histogram += numpy.histogram(clipped_latencies, self.LATENCY_BINS)[0]
+
+
+class ScreeningCriterionType(Enum):
+    RANK = 1
+    UNCERTAINTY = 2
+
+
+class SurrogateEvaluator(Evaluator[S]):
+    """ Pre-screening evaluator for expensive problems.
+
+    A surrogate model (by default, a :class:`KrigingSurrogate` over the bounds of the problem) is trained with all the
+    real evaluations. Once it has `minimum_samples` samples, it predicts the objectives and constraints of each list of
+    solutions and only the `number_of_real_evaluations` most promising ones are evaluated with the wrapped evaluator:
+
+    * RANK: feasible solutions first, then by non-dominated front of the predicted objectives and by uncertainty.
+    * UNCERTAINTY: solutions with the largest predicted standard deviation first.
+
+    The rest of the solutions get the predicted values and are marked with the attribute `surrogate` (their predicted
+    standard deviations are stored in `surrogate_uncertainty`), so the list keeps its length and order and algorithms
+    such as NSGAII, GDE3 or SMPSO can be used unmodified. Predicted solutions may survive the replacement, so the
+    algorithms evaluate with the problem, through :meth:`evaluate_surrogates`, the ones left in their final population
+    and result (which are not ranked again), so no returned solution has predicted values.
+
+    Example:
+
+    >>> algorithm = NSGAII(..., population_evaluator=SurrogateEvaluator(number_of_real_evaluations=10))
+    """
+
+    def __init__(self,
+                 evaluator: Evaluator[S] = None,
+                 number_of_real_evaluations: int = 10,
+                 criterion: ScreeningCriterionType = ScreeningCriterionType.RANK,
+                 minimum_samples: int = None,
+                 surrogate: Surrogate = None):
+        """
+        :param evaluator: Evaluator used for the real evaluations (by default, a :class:`SequentialEvaluator`).
+        :param number_of_real_evaluations: Number of solutions of each list evaluated with the problem.
+        :param criterion: Criterion used to choose the solutions evaluated with the problem.
+        :param minimum_samples: Number of real evaluations before pre-screening starts (by default,
+            2 * (number_of_variables + 1)).
+        :param surrogate: Surrogate model. If None, a :class:`KrigingSurrogate` is created.
+        """
+        self.evaluator = evaluator if evaluator is not None else SequentialEvaluator()
+        self.number_of_real_evaluations = number_of_real_evaluations
+        self.criterion = criterion
+        self.minimum_samples = minimum_samples
+        self.surrogate = surrogate
+
+        self.real_evaluations = 0
+        self.predictions = 0
+
+    def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
+        if self.surrogate is None:
+            self.surrogate = KrigingSurrogate(problem.lower_bound, problem.upper_bound)
+
+        minimum_samples = self.minimum_samples or 2 * (problem.number_of_variables + 1)
+        variables = numpy.array([solution.variables for solution in solution_list], dtype=float)
+
+        if self.surrogate.number_of_samples < minimum_samples or len(solution_list) <= self.number_of_real_evaluations:
+            selected = list(range(len(solution_list)))
+        else:
+            mean, std = self.surrogate.predict(variables)
+            selected = self._select(mean, std, problem.number_of_objectives)
+
+            unselected = numpy.ones(len(solution_list), dtype=bool)
+            unselected[selected] = False
+            for i in numpy.flatnonzero(unselected):
+                solution = solution_list[i]
+                solution.objectives = mean[i, :problem.number_of_objectives].tolist()
+                solution.constraints = mean[i, problem.number_of_objectives:].tolist()
+                solution.attributes['surrogate'] = True
+                solution.attributes['surrogate_uncertainty'] = std[i].tolist()
+
+            self.predictions += int(unselected.sum())
+
+        self._evaluate_with_problem([solution_list[i] for i in selected], problem)
+
+        return solution_list
+
+    def evaluate_surrogates(self, solution_list: List[S], problem: Problem) -> int:
+        """ Evaluate with the problem the solutions of the list that only have predicted values (e.g., those in the
+        final population of an algorithm), returning how many there were. """
+        predicted = [solution for solution in solution_list if solution.attributes.get('surrogate')]
+        if predicted:
+            self._evaluate_with_problem(predicted, problem)
+
+        return len(predicted)
+
+    def _evaluate_with_problem(self, solution_list: List[S], problem: Problem) -> None:
+        evaluated = self.evaluator.evaluate(solution_list, problem)
+        for solution, evaluated_solution in zip(solution_list, evaluated):
+            solution.objectives, solution.constraints = list(evaluated_solution.objectives), \
+                list(evaluated_solution.constraints)
+            solution.attributes.pop('surrogate', None)
+            solution.attributes.pop('surrogate_uncertainty', None)
+
+        self.real_evaluations += len(solution_list)
+        if solution_list:
+            variables = numpy.array([solution.variables for solution in solution_list], dtype=float)
+            self.surrogate.update(variables, [list(solution.objectives) + list(solution.constraints)
+                                              for solution in solution_list])
+
+    def _select(self, mean: numpy.ndarray, std: numpy.ndarray, number_of_objectives: int) -> List[int]:
+        maximum_std = std.max(axis=0)
+        maximum_std[maximum_std == 0] = 1.0
+        uncertainty = (std / maximum_std).sum(axis=1)
+
+        if self.criterion is ScreeningCriterionType.UNCERTAINTY:
+            order = numpy.argsort(-uncertainty, kind='stable')
+        else:
+            violation = numpy.clip(mean[:, number_of_objectives:], None, 0.0).sum(axis=1)
+            levels = non_dominated_levels(mean[:, :number_of_objectives])
+            order = numpy.lexsort((-uncertainty, levels, -violation))
+
+        return sorted(order[:self.number_of_real_evaluations].tolist())
 
 
 class SparkEvaluator(Evaluator[S]):
-    def __init__(self, processes: int = 8):
-        self.spark_conf = SparkConf().setAppName("jmetalpy").setMaster(f"local[{processes}]")
-        self.spark_context = SparkContext(conf=self.spark_conf)
+    """ Evaluator based on Apache Spark.
+
+    The problem is broadcast once (and again only if it changes) and the decision variables are shipped as compact
+    arrays; every partition is evaluated with a single call (using `evaluate_batch` if the problem supports it). An
+    existing `SparkContext` can be given; otherwise the active one is reused or a local one is created.
+    """
+
+    def __init__(self, processes: int = 8, spark_context: 'SparkContext' = None):
+        """
+        :param processes: Number of local processes, used if a new SparkContext has to be created.
+        :param spark_context: SparkContext to use.
+        """
+        if spark_context is None:
+            spark_conf = SparkConf().setAppName("jmetalpy").setMaster(f"local[{processes}]")
+            spark_context = SparkContext.getOrCreate(conf=spark_conf)
+
+        self.spark_context = spark_context
+        self.spark_conf = spark_context.getConf()
 
         logger = self.spark_context._jvm.org.apache.log4j
         logger.LogManager.getLogger("org").setLevel(logger.Level.WARN)
 
+        self._problem = None
+        self._broadcast_problem = None
+
     def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
-        solutions_to_evaluate = self.spark_context.parallelize(solution_list)
+        if problem is not self._problem or self.problem_has_changed(problem):
+            if self._broadcast_problem is not None:
+                self._broadcast_problem.unpersist()
+            self._broadcast_problem = self.spark_context.broadcast(problem)
+            self._problem = problem
 
-        return solutions_to_evaluate \
-            .map(lambda s: problem.evaluate(s)) \
+        variables = [solution.variables for solution in solution_list]
+        try:
+            variables = list(numpy.asarray(variables))
+        except ValueError:
+            pass
+
+        results = self.spark_context.parallelize(variables) \
+            .mapPartitions(functools.partial(_evaluate_partition, broadcast_problem=self._broadcast_problem)) \
             .collect()
 
+        for solution, (objectives, constraints) in zip(solution_list, results):
+            solution.objectives, solution.constraints = objectives, constraints
+
+        return solution_list
+
 
 def evaluate_solution(solution, problem):
     Evaluator[S].evaluate_solution(solution, problem)
     return solution
 
 
+def _timed_evaluation(solution, problem):
+    start = time.perf_counter()
+    Evaluator.evaluate_solution(solution, problem)
+
+    return solution, time.perf_counter() - start
+
+
+def _evaluate_shared_chunk(chunk, problem: Problem, input_name: str, output_name: str, input_shape, input_dtype: str):
+    start, stop = chunk
+    number_of_objectives = problem.number_of_objectives
+    output_shape = (input_shape[0], number_of_objectives + problem.number_of_constraints)
+
+    input_memory = SharedMemory(name=input_name)
+    output_memory = SharedMemory(name=output_name)
+    try:
+        variables = numpy.ndarray(input_shape, dtype=input_dtype, buffer=input_memory.buf)[start:stop]
+        output = numpy.ndarray(output_shape, buffer=output_memory.buf)[start:stop]
+
+        if supports_batch_evaluation(problem):
+            objectives, constraints = problem.evaluate_batch(variables)
+            output[:, :number_of_objectives] = objectives
+            output[:, number_of_objectives:] = constraints
+        else:
+            solution = problem.create_solution()
+            for i, row in enumerate(variables.tolist()):
+                solution.variables = row
+                problem.evaluate(solution)
+                output[i, :number_of_objectives] = solution.objectives
+                output[i, number_of_objectives:] = solution.constraints
+
+        del variables, output
+    finally:
+        input_memory.close()
+        output_memory.close()
+
+
+def _evaluate_variables(variables: list, problem: Problem):
+    """ Evaluate a list of decision variable vectors, returning the lists of objectives and of constraints. """
+    if supports_batch_evaluation(problem):
+        objectives, constraints = problem.evaluate_batch(numpy.asarray(variables))
+        return objectives.tolist(), constraints.tolist()
+
+    objectives, constraints = [], []
+    for solution_variables in variables:
+        solution = problem.create_solution()
+        solution.variables = solution_variables
+        problem.evaluate(solution)
+        objectives.append(list(solution.objectives))
+        constraints.append(list(solution.constraints))
+
+    return objectives, constraints
+
+
+def _evaluate_partition(rows: Iterator, broadcast_problem) -> Iterator:
+    variables = [row.tolist() if isinstance(row, numpy.ndarray) else row for row in rows]
+    if not variables:
+        return iter([])
+
+    objectives, constraints = _evaluate_variables(variables, broadcast_problem.value)
+
+    return zip(objectives, constraints)
+
+
+async def _evaluate_solution_async(solution, problem):
+    if hasattr(problem, 'evaluate_async'):
+        await problem.evaluate_async(solution)
+    else:
+        await asyncio.get_event_loop().run_in_executor(None, problem.evaluate, solution)
+
+
+def _freeze(variables):
+    """ Hashable (and exact) representation of the variables of a solution. """
+    if isinstance(variables, Sequence) and not isinstance(variables, str):
+        return tuple(_freeze(value) for value in variables)
+    elif isinstance(variables, numpy.ndarray):
+        return _freeze(variables.tolist())
+    elif isinstance(variables, numpy.generic):
+        return variables.item()
+    elif hasattr(variables, 'variables'):
+        return _freeze(variables.variables)
+
+    return variables
+
+
+def _digest(key) -> str:
+    return hashlib.sha1(repr(key).encode()).hexdigest()
+
+
+def _size_of(value) -> int:
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_size_of(item) for item in value)
+
+    return sys.getsizeof(value)
+
+
+_PENALIZED = object()
+
+
+class _Worker:
+    """ Worker process evaluating the solutions received through a pipe with a problem installed at startup. """
+
+    def __init__(self, problem: Problem):
+        self.connection = None
+        self.process = None
+        self.start(problem)
+
+    def start(self, problem: Problem) -> None:
+        self.connection, child_connection = Pipe()
+        self.process = Process(target=_evaluate_from_connection, args=(child_connection, problem), daemon=True)
+        self.process.start()
+        child_connection.close()
+
+    def restart(self, problem: Problem) -> None:
+        self.terminate()
+        self.start(problem)
+
+    def terminate(self) -> None:
+        self.process.terminate()
+        self.process.join()
+        self.connection.close()
+
+
+class _InstrumentedProblem(Problem):
+    """ Proxy to a problem storing the time and the CPU time of each evaluation in the attributes of the solution. """
+
+    def __init__(self, problem: Problem):
+        self.problem = problem
+
+    def __getattr__(self, name: str):
+        if name.startswith('__') or name == 'problem':
+            raise AttributeError(name)
+
+        return getattr(self.problem, name)
+
+    def create_solution(self):
+        return self.problem.create_solution()
+
+    def evaluate(self, solution):
+        start_cpu_time = _thread_time()
+        start = time.perf_counter()
+        self.problem.evaluate(solution)
+
+        solution.attributes['evaluation_time'] = time.perf_counter() - start
+        solution.attributes['evaluation_cpu_time'] = _thread_time() - start_cpu_time
+
+        return solution
+
+    def get_name(self) -> str:
+        return self.problem.get_name()
+
+
+class _InstrumentedBatchProblem(_InstrumentedProblem):
+
+    def evaluate_batch(self, variables: numpy.ndarray):
+        return self.problem.evaluate_batch(variables)
+
+
+class _InstrumentedDynamicProblem(_InstrumentedProblem, DynamicProblem):
+    """ Proxy to a dynamic problem, so the evaluators checking `isinstance(problem, DynamicProblem)` see its changes. """
+
+    def the_problem_has_changed(self) -> bool:
+        return self.problem.the_problem_has_changed()
+
+    def clear_changed(self) -> None:
+        self.problem.clear_changed()
+
+    def update(self, *args, **kwargs):
+        self.problem.update(*args, **kwargs)
+
+
+class _InstrumentedDynamicBatchProblem(_InstrumentedDynamicProblem, _InstrumentedBatchProblem):
+    pass
+
+
+def _instrument_problem(problem: Problem) -> _InstrumentedProblem:
+    if isinstance(problem, DynamicProblem):
+        if supports_batch_evaluation(problem):
+            return _InstrumentedDynamicBatchProblem(problem)
+        return _InstrumentedDynamicProblem(problem)
+
+    if supports_batch_evaluation(problem):
+        return _InstrumentedBatchProblem(problem)
+    return _InstrumentedProblem(problem)
+
+
+class _SimulatorProcess:
+    """ External process exchanging request and response lines through its standard input and output. """
+
+    def __init__(self, command: List[str]):
+        self.command = command
+        self.process = None
+        self.buffer = b''
+        self.outstanding = set()
+        self.last_activity = time.time()
+        self.start()
+
+    def start(self) -> None:
+        self.process = subprocess.Popen(self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=0)
+        self.buffer = b''
+        self.outstanding = set()
+        self.last_activity = time.time()
+
+    def restart(self) -> None:
+        self.terminate(wait=False)
+        self.start()
+
+    def send(self, index: int, variables: list) -> bool:
+        request = ' '.join([str(index)] + [repr(float(value)) for value in variables]) + '\n'
+        try:
+            self.process.stdin.write(request.encode())
+        except (BrokenPipeError, OSError):
+            return False
+
+        if not self.outstanding:
+            self.last_activity = time.time()
+        self.outstanding.add(index)
+        return True
+
+    def read_lines(self):
+        """ Return the complete lines received so far, or None if the process closed its output. """
+        chunk = os.read(self.process.stdout.fileno(), 65536)
+        if not chunk:
+            return None
+
+        self.last_activity = time.time()
+        *lines, self.buffer = (self.buffer + chunk).split(b'\n')
+        return [line for line in lines if line.strip()]
+
+    def terminate(self, wait: bool = True) -> None:
+        """ Close the pipes of the process and wait for it to exit, killing it if it does not (immediately if `wait`
+        is False, e.g., because it is hung). """
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+        try:
+            self.process.wait(timeout=1.0 if wait else 0.0)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+def _evaluate_from_connection(connection, problem: Problem) -> None:
+    while True:
+        try:
+            solution = connection.recv()
+        except EOFError:
+            break
+
+        try:
+            problem.evaluate(solution)
+            connection.send(('ok', (solution.objectives, solution.constraints)))
+        except Exception as exception:
+            connection.send(('error', repr(exception)))
+
+
+def fingerprint(problem: Problem) -> str:
+    """ Hash of the pickled state of a problem. """
+    return hashlib.sha1(pickle.dumps(problem)).hexdigest()
+
+
+_installed_problem = None
+
+
+def install_problem(problem: Problem) -> None:
+    """ Store the problem in the current (worker) process, e.g., as the initializer of a process pool, so the
+    solutions can be evaluated with :func:`evaluate_with_installed_problem` without shipping the problem each time. """
+    global _installed_problem
+    _installed_problem = problem
+
+
+def evaluate_with_installed_problem(solution):
+    """ Evaluate a solution with the problem stored by :func:`install_problem`, returning its objectives and
+    constraints. """
+    _installed_problem.evaluate(solution)
+
+    return solution.objectives, solution.constraints
+
+
+def supports_batch_evaluation(problem: Problem) -> bool:
+    """ Check whether a problem provides `evaluate_batch`. Subclasses that override `evaluate` without overriding
+    `evaluate_batch` (e.g., :class:`ZDT1Modified`) are evaluated one solution at a time. """
+    batch_owner = _find_owner(type(problem), 'evaluate_batch')
+    if batch_owner is None:
+        return False
+
+    return issubclass(batch_owner, _find_owner(type(problem), 'evaluate'))
+
+
+def _find_owner(cls: type, method_name: str):
+    for klass in cls.__mro__:
+        if method_name in vars(klass):
+            return klass
+
+    return None
+
+
 class DaskEvaluator(Evaluator[S]):
-    def __init__(self, scheduler='processes'):
+    """ Evaluator based on Dask.
+
+    By default, a `dask.delayed` task is built per solution and computed with the given `scheduler`. If a
+    `distributed.Client` is given, the problem is scattered to all the workers once (and again only if it changes)
+    and the variables of the solutions are submitted in batches of `batch_size` as futures, whose results are
+    gathered as they complete. This avoids rebuilding the task graph and reserializing the problem every generation.
+
+    Example:
+
+    >>> client = Client(LocalCluster(n_workers=8))
+    >>> evaluator = DaskEvaluator(client=client)
+    """
+
+    def __init__(self, scheduler='processes', client: 'Client' = None, batch_size: int = None):
+        """
+        :param scheduler: Dask scheduler used when no client is given.
+        :param client: Client of a Dask distributed cluster.
+        :param batch_size: Number of solutions per future. If None, each worker gets about four batches per call.
+        """
         self.scheduler = scheduler
+        self.client = client
+        self.batch_size = batch_size
+
+        self._problem = None
+        self._problem_future = None
 
     def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
+        if self.client is not None:
+            return self._evaluate_with_futures(solution_list, problem)
+
         with dask.config.set(scheduler=self.scheduler):
             return list(dask.compute(*[
                 dask.delayed(evaluate_solution)(solution=solution, problem=problem) for solution in solution_list
             ]))
+
+    def _evaluate_with_futures(self, solution_list: List[S], problem: Problem) -> List[S]:
+        if problem is not self._problem or self.problem_has_changed(problem):
+            self._problem_future = self.client.scatter(problem, broadcast=True, hash=False)
+            self._problem = problem
+
+        batch_size = self.batch_size
+        if batch_size is None:
+            number_of_workers = max(1, len(self.client.scheduler_info()['workers']))
+            batch_size = max(1, -(-len(solution_list) // (4 * number_of_workers)))
+
+        futures = {}
+        for start in range(0, len(solution_list), batch_size):
+            variables = [list(solution.variables) for solution in solution_list[start:start + batch_size]]
+            future = self.client.submit(_evaluate_variables, variables, self._problem_future, pure=False)
+            futures[future] = start
+
+        for future, (objectives, constraints) in as_completed(list(futures), with_results=True):
+            start = futures[future]
+            for offset, (solution_objectives, solution_constraints) in enumerate(zip(objectives, constraints)):
+                solution_list[start + offset].objectives = solution_objectives
+                solution_list[start + offset].constraints = solution_constraints
+
+        return solution_list
@@ -27,7 +27,8 @@ LOGGER = logging.getLogger('jmetal')
 class ProgressBarObserver(Observer):
 
     def __init__(self, max: int) -> None:
-        """ Show a smart progress meter with the number of evaluations and computing time.
+        """ Show a smart progress meter with the number of evaluations and computing time. If the algorithm uses an
+        :class:`InstrumentedEvaluator`, the evaluations per second and the idle fraction of the workers are also shown.
 
         :param max: Number of expected iterations.
         """
@@ -41,6 +42,11 @@ class ProgressBarObserver(Observer):
 
         evaluations = kwargs['EVALUATIONS']
 
+        statistics = kwargs.get('EVALUATOR_STATISTICS')
+        if statistics:
+            self.progress_bar.set_postfix({'evals/s': '{:.1f}'.format(statistics['evaluations_per_second']),
+                                           'idle': '{:.0%}'.format(statistics['idle_fraction'])}, refresh=False)
+
         self.progress_bar.update(evaluations - self.progress)
         self.progress = evaluations
 
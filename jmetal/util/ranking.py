@@ -1,6 +1,10 @@
+import bisect
 from abc import ABC, abstractmethod
 from typing import TypeVar, List
 
+import numpy
+
+from jmetal.core.population import objective_matrix, overall_constraint_violation_vector
 from jmetal.util.comparator import DominanceComparator, Comparator, SolutionAttributeComparator
 
 S = TypeVar('S')
@@ -35,10 +39,17 @@ class Ranking(List[S], ABC):
 
 
 class FastNonDominatedRanking(Ranking[List[S]]):
-    """ Class implementing the non-dominated ranking of NSGA-II proposed by Deb et al., see [Deb2002]_ """
+    """ Class implementing the non-dominated ranking of NSGA-II proposed by Deb et al., see [Deb2002]_
 
-    def __init__(self, comparator: Comparator = DominanceComparator()):
+    When the comparator is batched (e.g., :class:`DominanceComparator`), the dominance relation is computed with
+    :meth:`Comparator.compare_all`, `block_size` rows at a time to bound the memory of the intermediate arrays, and the
+    fronts are peeled with array operations. The resulting fronts, their order and the `dominance_ranking` attributes
+    are the same as the ones of the pairwise comparisons, which are still used for any other comparator.
+    """
+
+    def __init__(self, comparator: Comparator = DominanceComparator(), block_size: int = None):
         super(FastNonDominatedRanking, self).__init__(comparator)
+        self.block_size = block_size
 
     def compute_ranking(self, solutions: List[S], k: int = None):
         """ Compute ranking of solutions.
@@ -46,6 +57,24 @@ class FastNonDominatedRanking(Ranking[List[S]]):
         :param solutions: Solution list.
         :param k: Number of individuals.
         """
+        if self.comparator.batched and len(solutions) > 1:
+            front = self._compute_fronts_vectorized(solutions)
+        else:
+            front = self._compute_fronts(solutions)
+
+        self.ranked_sublists = [[solutions[index] for index in indices] for indices in front]
+
+        if k:
+            count = 0
+            for i, front in enumerate(self.ranked_sublists):
+                count += len(front)
+                if count >= k:
+                    self.ranked_sublists = self.ranked_sublists[:i + 1]
+                    break
+
+        return self.ranked_sublists
+
+    def _compute_fronts(self, solutions: List[S]) -> List[List[int]]:
         # number of solutions dominating solution ith
         dominating_ith = [0 for _ in range(len(solutions))]
 
@@ -83,33 +112,165 @@ class FastNonDominatedRanking(Ranking[List[S]]):
                             front[i].append(q)
                             solutions[q].attributes['dominance_ranking'] = i
 
-        self.ranked_sublists = [[]] * i
-        for j in range(i):
-            q = [0] * len(front[j])
-            for m in range(len(front[j])):
-                q[m] = solutions[front[j][m]]
-            self.ranked_sublists[j] = q
+        return front[:i]
 
-        if k:
-            count = 0
-            for i, front in enumerate(self.ranked_sublists):
-                count += len(front)
-                if count >= k:
-                    self.ranked_sublists = self.ranked_sublists[:i + 1]
-                    break
+    def _compute_fronts_vectorized(self, solutions: List[S]) -> List[List[int]]:
+        # As in the pairwise version, the relation of each pair is given by comparing the first solution with the second
+        comparison = self.comparator.compare_all(solutions, solutions, self.block_size)
+        upper = numpy.triu(numpy.ones(comparison.shape, dtype=bool), 1)
+        dominates = ((comparison == -1) & upper) | ((comparison == 1) & upper).T
+        self.number_of_comparisons += len(solutions) * (len(solutions) - 1) // 2
+
+        domination_count = dominates.sum(axis=0)
+        current = numpy.flatnonzero(domination_count == 0)
+
+        front = []
+        while current.size > 0:
+            for index in current:
+                solutions[index].attributes['dominance_ranking'] = len(front)
+            front.append(current.tolist())
+
+            dominated_by_current = dominates[current]
+            domination_count = domination_count - dominated_by_current.sum(axis=0)
+            candidates = numpy.flatnonzero(dominated_by_current.any(axis=0) & (domination_count == 0))
+
+            # Keep the order of the pairwise version: a solution enters the next front when its last dominator of the
+            # current front is processed, and the ties are broken by index
+            last_dominator = len(current) - 1 - numpy.argmax(dominated_by_current[::-1, candidates], axis=0)
+            current = candidates[numpy.lexsort((candidates, last_dominator))]
+
+        return front
+
+    @classmethod
+    def get_comparator(cls) -> Comparator:
+        return SolutionAttributeComparator('dominance_ranking')
+
+
+class IncrementalNonDominatedRanking(Ranking[List[S]]):
+    """ Non-dominated ranking supporting the insertion and the removal of single solutions, as in the efficient
+    non-domination level update (ENLU) approach of
+
+    * K. Li, K. Deb, Q. Zhang and Q. Zhang, "Efficient Nondomination Level Update Method for Steady-State Evolutionary
+      Multiobjective Optimization," in IEEE Transactions on Cybernetics, vol. 47, no. 9, pp. 2838-2849, Sept 2017.
+      doi: 10.1109/TCYB.2016.2621008
+
+    After an initial :meth:`compute_ranking`, :meth:`add` and :meth:`remove` move between consecutive fronts only the
+    solutions whose rank changes and update their `dominance_ranking`, which takes O(N) comparisons instead of the
+    O(N^2) of a new ranking. The ranking always holds all the solutions, so `k` is ignored.
+    """
+
+    def __init__(self, comparator: Comparator = DominanceComparator()):
+        super(IncrementalNonDominatedRanking, self).__init__(comparator)
+        self._snapshots = {}
+
+    def compute_ranking(self, solutions: List[S], k: int = None):
+        """ Compute ranking of solutions.
+
+        :param solutions: Solution list.
+        :param k: Ignored.
+        """
+        ranking = FastNonDominatedRanking(self.comparator)
+        self.ranked_sublists = [list(front) for front in ranking.compute_ranking(solutions)]
+        self.number_of_comparisons += ranking.number_of_comparisons
+        self._snapshots = {id(solution): self._snapshot(solution) for solution in solutions}
 
         return self.ranked_sublists
 
+    def is_ranking_of(self, solutions: List[S]) -> bool:
+        """ Return whether the ranking holds exactly the given solutions, with the same objective and constraint
+        values they had when they were ranked. """
+        return len(solutions) == len(self._snapshots) and \
+               all(self._snapshots.get(id(solution)) == self._snapshot(solution) for solution in solutions)
+
+    def add(self, solution: S) -> int:
+        """ Insert a solution in the ranking and return its rank.
+
+        The solution goes to the first front not dominating it; the members of that front it dominates go down to the
+        next front, pushing the members of that front they dominate, and so on.
+        """
+        low, high = 0, len(self.ranked_sublists)
+        while low < high:
+            middle = (low + high) // 2
+            if self._is_dominated_by_any(solution, self.ranked_sublists[middle]):
+                low = middle + 1
+            else:
+                high = middle
+
+        moved = [solution]
+        rank = low
+        while moved:
+            if rank == len(self.ranked_sublists):
+                self.ranked_sublists.append([])
+
+            front = self.ranked_sublists[rank]
+            dominated = [member for member in front if self._is_dominated_by_any(member, moved)]
+            front[:] = [member for member in front if not any(member is other for other in dominated)]
+            front.extend(moved)
+            for member in moved:
+                member.attributes['dominance_ranking'] = rank
+
+            moved = dominated
+            rank += 1
+
+        self._snapshots[id(solution)] = self._snapshot(solution)
+
+        return low
+
+    def remove(self, solution: S) -> None:
+        """ Remove a solution from the ranking.
+
+        The members of the next front dominated by the removed solution go up if no other member of its front
+        dominates them; then the members of the following front dominated by the promoted ones are checked, and so on.
+        """
+        rank = next(i for i, front in enumerate(self.ranked_sublists) if any(member is solution for member in front))
+        front = self.ranked_sublists[rank]
+        front[:] = [member for member in front if member is not solution]
+        del self._snapshots[id(solution)]
+
+        removed = [solution]
+        while removed and rank + 1 < len(self.ranked_sublists):
+            upper, lower = self.ranked_sublists[rank], self.ranked_sublists[rank + 1]
+            promoted = [member for member in lower
+                        if self._is_dominated_by_any(member, removed) and not self._is_dominated_by_any(member, upper)]
+
+            lower[:] = [member for member in lower if not any(member is other for other in promoted)]
+            upper.extend(promoted)
+            for member in promoted:
+                member.attributes['dominance_ranking'] = rank
+
+            removed = promoted
+            rank += 1
+
+        while self.ranked_sublists and not self.ranked_sublists[-1]:
+            self.ranked_sublists.pop()
+
+    def _is_dominated_by_any(self, solution: S, solutions: List[S]) -> bool:
+        for other in solutions:
+            self.number_of_comparisons += 1
+            if self.comparator.compare(other, solution) == -1:
+                return True
+
+        return False
+
+    @staticmethod
+    def _snapshot(solution: S) -> tuple:
+        return tuple(solution.objectives), tuple(solution.constraints)
+
     @classmethod
     def get_comparator(cls) -> Comparator:
         return SolutionAttributeComparator('dominance_ranking')
 
 
 class StrengthRanking(Ranking[List[S]]):
-    """ Class implementing a ranking scheme based on the strength ranking used in SPEA2. """
+    """ Class implementing a ranking scheme based on the strength ranking used in SPEA2.
 
-    def __init__(self, comparator: Comparator = DominanceComparator()):
+    When the comparator is batched (e.g., :class:`DominanceComparator`), the comparison matrix is computed once with
+    :meth:`Comparator.compare_all` and the strength and raw fitness values are obtained with matrix sums.
+    """
+
+    def __init__(self, comparator: Comparator = DominanceComparator(), block_size: int = None):
         super(StrengthRanking, self).__init__(comparator)
+        self.block_size = block_size
 
     def compute_ranking(self, solutions: List[S], k: int = None):
         """
@@ -118,6 +279,24 @@ class StrengthRanking(Ranking[List[S]]):
         :param solutions: Solution list.
         :param k: Number of individuals.
         """
+        if self.comparator.batched and len(solutions) > 1:
+            raw_fitness = self._compute_raw_fitness_vectorized(solutions)
+        else:
+            raw_fitness = self._compute_raw_fitness(solutions)
+
+        for i in range(len(solutions)):
+            solutions[i].attributes['strength_ranking'] = raw_fitness[i]
+
+        # Assign each solution to the sublist of its raw fitness value (only the values taken by some solution)
+        sublists = {}
+        for solution in solutions:
+            sublists.setdefault(solution.attributes['strength_ranking'], []).append(solution)
+
+        self.ranked_sublists = [sublists[value] for value in sorted(sublists)]
+
+        return self.ranked_sublists
+
+    def _compute_raw_fitness(self, solutions: List[S]) -> List[int]:
         strength: [int] = [0 for _ in range(len(solutions))]
         raw_fitness: [int] = [0 for _ in range(len(solutions))]
 
@@ -134,29 +313,354 @@ class StrengthRanking(Ranking[List[S]]):
                 if self.comparator.compare(solutions[i], solutions[j]) == 1:
                     raw_fitness[i] += strength[j]
 
-        max_fitness_value: int = 0
-        for i in range(len(solutions)):
-            solutions[i].attributes['strength_ranking'] = raw_fitness[i]
-            if raw_fitness[i] > max_fitness_value:
-                max_fitness_value = raw_fitness[i]
+        return raw_fitness
 
-        # Initialize the ranked sublists. In the worst case will be max_fitness_value + 1 different sublists
-        self.ranked_sublists = [[] for _ in range(max_fitness_value + 1)]
+    def _compute_raw_fitness_vectorized(self, solutions: List[S]) -> List[int]:
+        comparison = self.comparator.compare_all(solutions, solutions, self.block_size)
 
-        # Assign each solution to its corresponding front
-        for solution in solutions:
-            self.ranked_sublists[int(solution.attributes['strength_ranking'])].append(solution)
+        strength = (comparison < 0).sum(axis=1)
+        raw_fitness = (comparison == 1).astype(numpy.int64) @ strength
 
-        # Remove empty fronts
-        counter = 0
-        while counter < len(self.ranked_sublists):
-            if len(self.ranked_sublists[counter]) == 0:
-                del self.ranked_sublists[counter]
-            else:
-                counter += 1
+        return raw_fitness.tolist()
+
+    @classmethod
+    def get_comparator(cls) -> Comparator:
+        return SolutionAttributeComparator('strength_ranking')
+
+
+class _ObjectiveSortingRanking(Ranking[List[S]], ABC):
+    """ Base class of the non-dominated rankings working on the objective matrix with the constrained dominance of
+    :class:`DominanceComparator`.
+
+    The solutions are grouped by overall constraint violation (the feasible ones first), as every solution of a group
+    dominates all the solutions of the next ones, and the Pareto ranks inside each group are computed by
+    :meth:`_compute_pareto_ranks` on the lexicographically sorted, unique objective vectors. The fronts keep the order
+    of the solutions in the list.
+
+    If `k` is given, the sorts may stop refining the ranks of the solutions that will not belong to the returned
+    fronts: those solutions get the rank following the last returned front.
+    """
+
+    def __init__(self):
+        super(_ObjectiveSortingRanking, self).__init__(DominanceComparator())
+
+    def compute_ranking(self, solutions: List[S], k: int = None):
+        """ Compute ranking of solutions.
+
+        :param solutions: Solution list.
+        :param k: Number of individuals.
+        """
+        if len(solutions) == 0:
+            self.ranked_sublists = []
+            return self.ranked_sublists
+
+        objectives = objective_matrix(solutions)
+        violation = overall_constraint_violation_vector(solutions)
+
+        ranks = numpy.zeros(len(solutions), dtype=int)
+        number_of_fronts = 0
+        number_of_ranked_solutions = 0
+        for degree in numpy.unique(violation)[::-1]:
+            group = numpy.flatnonzero(violation == degree)
+
+            if k and number_of_ranked_solutions >= k:
+                ranks[group] = number_of_fronts
+                continue
+
+            unique_objectives, inverse = numpy.unique(objectives[group], axis=0, return_inverse=True)
+            counts = numpy.bincount(inverse.ravel(), minlength=len(unique_objectives))
+            remaining = k - number_of_ranked_solutions if k else None
+            group_ranks = self._compute_pareto_ranks(unique_objectives, counts, remaining)
+
+            ranks[group] = number_of_fronts + group_ranks[inverse.ravel()]
+            number_of_fronts = ranks[group].max() + 1
+            number_of_ranked_solutions += len(group)
+
+        fronts = [[] for _ in range(ranks.max() + 1)]
+        for index, rank in enumerate(ranks):
+            fronts[rank].append(index)
+
+        if k:
+            count = 0
+            for i, front in enumerate(fronts):
+                count += len(front)
+                if count >= k:
+                    fronts = fronts[:i + 1]
+                    numpy.minimum(ranks, i + 1, out=ranks)
+                    break
+
+        for solution, rank in zip(solutions, ranks):
+            solution.attributes['dominance_ranking'] = int(rank)
+
+        self.ranked_sublists = [[solutions[index] for index in front] for front in fronts]
 
         return self.ranked_sublists
 
+    @abstractmethod
+    def _compute_pareto_ranks(self, objectives: numpy.ndarray, counts: numpy.ndarray, k: int = None) -> numpy.ndarray:
+        """ Return the Pareto rank of every row of a lexicographically sorted matrix of unique objective vectors.
+
+        :param objectives: Objective matrix.
+        :param counts: Number of solutions sharing each objective vector.
+        :param k: Number of individuals.
+        """
+        pass
+
+    def _assign_to_fronts(self, objectives: numpy.ndarray, counts: numpy.ndarray, k: int, is_dominated_by_front,
+                          add_to_front) -> numpy.ndarray:
+        """ Assign the sorted objective vectors one by one to the first front not dominating them, which is found by
+        binary search (a vector cannot be dominated by the vectors coming after it). When `k` is given, the fronts
+        after the first ones holding `k` solutions are not searched anymore.
+
+        :param is_dominated_by_front: Function (front, vector) returning whether any vector of the front dominates it.
+        :param add_to_front: Function (front, vector) adding a vector to a front (the front is -1 for a new one).
+        """
+        ranks = numpy.zeros(len(objectives), dtype=int)
+        front_sizes = []
+
+        # fronts[:limit + 1] hold k solutions or more; prefix is the number of solutions in them
+        limit = len(objectives)
+        prefix = 0
+        number_of_solutions = 0
+
+        for index, vector in enumerate(objectives):
+            low, high = 0, min(len(front_sizes), limit + 1)
+            while low < high:
+                middle = (low + high) // 2
+                self.number_of_comparisons += 1
+                if is_dominated_by_front(middle, vector):
+                    low = middle + 1
+                else:
+                    high = middle
+
+            ranks[index] = low
+            if low > limit:
+                continue
+
+            if low == len(front_sizes):
+                front_sizes.append(0)
+                add_to_front(-1, vector)
+            else:
+                add_to_front(low, vector)
+            front_sizes[low] += counts[index]
+            number_of_solutions += counts[index]
+
+            if k:
+                if limit == len(objectives):
+                    if number_of_solutions >= k:
+                        limit, prefix = len(front_sizes) - 1, number_of_solutions
+                else:
+                    prefix += counts[index]
+
+                while 0 < limit < len(objectives) and prefix - front_sizes[limit] >= k:
+                    prefix -= front_sizes[limit]
+                    limit -= 1
+
+        return ranks
+
+
+class EfficientNonDominatedRanking(_ObjectiveSortingRanking[List[S]]):
+    """ Efficient Non-dominated Sort with binary search (ENS-BS) as described in
+
+    * X. Zhang, Y. Tian, R. Cheng and Y. Jin, "An Efficient Approach to Nondominated Sorting for Evolutionary
+      Multiobjective Optimization," in IEEE Transactions on Evolutionary Computation, vol. 19, no. 2, pp. 201-213,
+      Apr 2015. doi: 10.1109/TEVC.2014.2308305
+
+    The solutions are processed in lexicographic order of their objectives, so a solution can only be dominated by the
+    ones already assigned to a front; the front of each solution is found by binary search over the fronts, comparing
+    it with all the members of a front at once with NumPy. It needs O(MN log N) comparisons in the best case and
+    O(MN^2) in the worst one, and works for any number of objectives.
+    """
+
+    def _compute_pareto_ranks(self, objectives: numpy.ndarray, counts: numpy.ndarray, k: int = None) -> numpy.ndarray:
+        # All the previous vectors are lexicographically smaller: the first objective does not need to be compared and
+        # weak dominance on the rest implies dominance, as the vectors are unique
+        fronts = []
+        sizes = []
+
+        def is_dominated_by_front(front: int, vector: numpy.ndarray) -> bool:
+            members = fronts[front][:sizes[front]]
+            return bool(numpy.any(numpy.all(members <= vector[1:], axis=1)))
+
+        def add_to_front(front: int, vector: numpy.ndarray) -> None:
+            if front < 0:
+                fronts.append(numpy.empty((4, len(vector) - 1)))
+                sizes.append(0)
+            if sizes[front] == len(fronts[front]):
+                fronts[front] = numpy.concatenate((fronts[front], numpy.empty_like(fronts[front])))
+            fronts[front][sizes[front]] = vector[1:]
+            sizes[front] += 1
+
+        return self._assign_to_fronts(objectives, counts, k, is_dominated_by_front, add_to_front)
+
     @classmethod
     def get_comparator(cls) -> Comparator:
-        return SolutionAttributeComparator('strength_ranking')
+        return SolutionAttributeComparator('dominance_ranking')
+
+
+class DivideAndConquerRanking(_ObjectiveSortingRanking[List[S]]):
+    """ Divide-and-conquer non-dominated sorting of Jensen, generalized to equal objective values as described in
+
+    * F.-A. Fortin, S. Grenier and M. Parizeau, "Generalizing the improved run-time complexity algorithm for
+      non-dominated sorting," in Proceedings of GECCO 2013, pp. 615-622. doi: 10.1145/2463372.2463454
+
+    It runs in O(N log^(M-1) N) for M objectives.
+
+    The problems with two and three objectives are sorted with dedicated sweeps over the lexicographically sorted
+    solutions: each front keeps its last solution (two objectives) or the staircase of its non-dominated projections
+    on the last two objectives (three objectives), so testing whether a front dominates a solution takes O(1) or
+    O(log N) and the fronts are found by binary search, i.e., O(N log N) and O(N log N log F) for F fronts.
+    """
+
+    def __init__(self, brute_force_threshold: int = 32):
+        super(DivideAndConquerRanking, self).__init__()
+        self.brute_force_threshold = brute_force_threshold
+
+    def _compute_pareto_ranks(self, objectives: numpy.ndarray, counts: numpy.ndarray, k: int = None) -> numpy.ndarray:
+        number_of_objectives = objectives.shape[1]
+
+        if number_of_objectives == 1:
+            return numpy.arange(len(objectives))
+        elif number_of_objectives == 2:
+            return self._sweep_two_objectives(objectives, counts, k)
+        elif number_of_objectives == 3:
+            return self._sweep_three_objectives(objectives, counts, k)
+
+        # The lexicographic order replaces the first objective: i dominates j iff i < j and x_i <= x_j on the rest
+        ranks = numpy.zeros(len(objectives), dtype=int)
+        self._helper_a(objectives, ranks, numpy.arange(len(objectives)), number_of_objectives - 1)
+
+        return ranks
+
+    def _sweep_two_objectives(self, objectives: numpy.ndarray, counts: numpy.ndarray, k: int) -> numpy.ndarray:
+        # The last solution of a front has the lowest second objective of the front
+        last = []
+
+        def is_dominated_by_front(front: int, vector: numpy.ndarray) -> bool:
+            return last[front] <= vector[1]
+
+        def add_to_front(front: int, vector: numpy.ndarray) -> None:
+            if front < 0:
+                last.append(vector[1])
+            else:
+                last[front] = vector[1]
+
+        return self._assign_to_fronts(objectives, counts, k, is_dominated_by_front, add_to_front)
+
+    def _sweep_three_objectives(self, objectives: numpy.ndarray, counts: numpy.ndarray, k: int) -> numpy.ndarray:
+        # Staircase of every front: second objective increasing, third objective strictly decreasing
+        second = []
+        third = []
+
+        def is_dominated_by_front(front: int, vector: numpy.ndarray) -> bool:
+            position = bisect.bisect_right(second[front], vector[1])
+            return position > 0 and third[front][position - 1] <= vector[2]
+
+        def add_to_front(front: int, vector: numpy.ndarray) -> None:
+            if front < 0:
+                second.append([vector[1]])
+                third.append([vector[2]])
+                return
+
+            position = bisect.bisect_left(second[front], vector[1])
+            end = position
+            while end < len(second[front]) and third[front][end] >= vector[2]:
+                end += 1
+            second[front][position:end] = [vector[1]]
+            third[front][position:end] = [vector[2]]
+
+        return self._assign_to_fronts(objectives, counts, k, is_dominated_by_front, add_to_front)
+
+    def _helper_a(self, x: numpy.ndarray, ranks: numpy.ndarray, indices: numpy.ndarray, objective: int) -> None:
+        """ Rank the solutions of `indices` among themselves; they share the values of the objectives after
+        `objective`. """
+        if len(indices) < 2:
+            return
+        elif objective == 1:
+            self._sweep_a(x, ranks, indices)
+        elif len(indices) <= self.brute_force_threshold:
+            self._brute_force(x, ranks, indices, indices, objective)
+        else:
+            values = x[indices, objective]
+            pivot = numpy.partition(values, len(values) // 2)[len(values) // 2]
+            low, equal, high = indices[values < pivot], indices[values == pivot], indices[values > pivot]
+
+            self._helper_a(x, ranks, low, objective)
+            self._helper_b(x, ranks, low, equal, objective - 1)
+            self._helper_a(x, ranks, equal, objective - 1)
+            self._helper_b(x, ranks, numpy.union1d(low, equal), high, objective - 1)
+            self._helper_a(x, ranks, high, objective)
+
+    def _helper_b(self, x: numpy.ndarray, ranks: numpy.ndarray, low: numpy.ndarray, high: numpy.ndarray,
+                  objective: int) -> None:
+        """ Update the ranks of the solutions of `high` with the (final) ranks of the ones of `low`, which are not
+        worse in the objectives after `objective`. """
+        if len(low) == 0 or len(high) == 0:
+            return
+        elif objective == 1:
+            self._sweep_b(x, ranks, low, high)
+        elif len(low) * len(high) <= self.brute_force_threshold ** 2:
+            self._brute_force(x, ranks, low, high, objective)
+        else:
+            low_values, high_values = x[low, objective], x[high, objective]
+            if low_values.max() <= high_values.min():
+                self._helper_b(x, ranks, low, high, objective - 1)
+            elif low_values.min() <= high_values.max():
+                values = numpy.concatenate((low_values, high_values))
+                pivot = numpy.partition(values, len(values) // 2)[len(values) // 2]
+
+                self._helper_b(x, ranks, low[low_values < pivot], high[high_values < pivot], objective)
+                self._helper_b(x, ranks, low[low_values <= pivot], high[high_values >= pivot], objective - 1)
+                self._helper_b(x, ranks, low[low_values > pivot], high[high_values > pivot], objective)
+
+    def _brute_force(self, x: numpy.ndarray, ranks: numpy.ndarray, low: numpy.ndarray, high: numpy.ndarray,
+                     objective: int) -> None:
+        dominates = numpy.all(x[low, None, 1:objective + 1] <= x[None, high, 1:objective + 1], axis=2)
+        dominates &= low[:, None] < high[None, :]
+        self.number_of_comparisons += dominates.size
+
+        # The solutions are visited in order, so the ranks of their dominators in both lists are final
+        for column, index in enumerate(high):
+            dominators = low[dominates[:, column]]
+            if len(dominators) > 0:
+                ranks[index] = max(ranks[index], ranks[dominators].max() + 1)
+
+    def _sweep_a(self, x: numpy.ndarray, ranks: numpy.ndarray, indices: numpy.ndarray) -> None:
+        # Staircase of the visited solutions: second objective increasing, rank strictly increasing
+        values, best = [], []
+        for index in indices:
+            self._update_from_staircase(values, best, x[index, 1], ranks, index)
+            self._insert_in_staircase(values, best, x[index, 1], ranks[index])
+
+    def _sweep_b(self, x: numpy.ndarray, ranks: numpy.ndarray, low: numpy.ndarray, high: numpy.ndarray) -> None:
+        values, best = [], []
+        position = 0
+        for index in high:
+            while position < len(low) and low[position] < index:
+                self._insert_in_staircase(values, best, x[low[position], 1], ranks[low[position]])
+                position += 1
+            self._update_from_staircase(values, best, x[index, 1], ranks, index)
+
+    def _update_from_staircase(self, values: list, best: list, value: float, ranks: numpy.ndarray, index: int):
+        self.number_of_comparisons += 1
+        position = bisect.bisect_right(values, value)
+        if position > 0:
+            ranks[index] = max(ranks[index], best[position - 1] + 1)
+
+    @staticmethod
+    def _insert_in_staircase(values: list, best: list, value: float, rank: int):
+        position = bisect.bisect_right(values, value)
+        if position > 0 and best[position - 1] >= rank:
+            return
+
+        end = position
+        while end < len(values) and best[end] <= rank:
+            end += 1
+        if position > 0 and values[position - 1] == value:
+            position -= 1
+        values[position:end] = [value]
+        best[position:end] = [rank]
+
+    @classmethod
+    def get_comparator(cls) -> Comparator:
+        return SolutionAttributeComparator('dominance_ranking')
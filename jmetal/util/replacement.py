@@ -2,7 +2,7 @@ from enum import Enum
 from typing import TypeVar, List
 
 from jmetal.util.density_estimator import DensityEstimator
-from jmetal.util.ranking import Ranking
+from jmetal.util.ranking import Ranking, IncrementalNonDominatedRanking
 
 S = TypeVar('S')
 
@@ -23,12 +23,25 @@ class RankingAndDensityEstimatorReplacement():
     def replace(self, solution_list: List[S], offspring_list: List[S]) -> List[S]:
         join_population = solution_list + offspring_list
 
-        self.ranking.compute_ranking(join_population)
+        # In steady-state mode, an incremental ranking holding the current population only needs the offspring inserted
+        # and the discarded solution removed
+        steady_state = isinstance(self.ranking, IncrementalNonDominatedRanking) and len(offspring_list) == 1
+        if steady_state and self.ranking.is_ranking_of(solution_list):
+            self.ranking.add(offspring_list[0])
+        else:
+            self.ranking.compute_ranking(join_population)
+
         if self.removal_policy is RemovalPolicyType.SEQUENTIAL:
             result_list = self.sequential_truncation(0, len(solution_list))
         else:
             result_list = self.one_shot_truncation(0, len(solution_list))
 
+        if steady_state:
+            selected = set(id(solution) for solution in result_list)
+            for solution in join_population:
+                if id(solution) not in selected:
+                    self.ranking.remove(solution)
+
         return result_list
 
     def sequential_truncation(self, ranking_id: int, size_of_the_result_list: int) -> List[S]:
@@ -42,14 +55,8 @@ class RankingAndDensityEstimatorReplacement():
             result_list.extend(self.sequential_truncation(ranking_id + 1, size_of_the_result_list - len(
                 current_ranked_solutions)))
         else:
-            for solution in current_ranked_solutions:
-                result_list.append(solution)
-
-            while len(result_list) > size_of_the_result_list:
-                self.density_estimator.sort(result_list)
-
-                del result_list[-1]
-                self.density_estimator.compute_density_estimator(result_list)
+            result_list.extend(
+                self.density_estimator.truncate_sequentially(current_ranked_solutions, size_of_the_result_list))
 
         return result_list
 
@@ -64,10 +71,6 @@ class RankingAndDensityEstimatorReplacement():
             result_list.extend(self.one_shot_truncation(ranking_id + 1, size_of_the_result_list - len(
                 current_ranked_solutions)))
         else:
-            self.density_estimator.sort(current_ranked_solutions)
-            i = 0
-            while len(result_list) < size_of_the_result_list:
-                result_list.append(current_ranked_solutions[i])
-                i += 1
+            result_list.extend(self.density_estimator.truncate(current_ranked_solutions, size_of_the_result_list))
 
         return result_list
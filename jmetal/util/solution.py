@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import List
 
 from jmetal.core.solution import FloatSolution, Solution
-from jmetal.util.archive import NonDominatedSolutionsArchive, Archive
+from jmetal.util.archive import NDTreeArchive, Archive
 
 LOGGER = logging.getLogger('jmetal')
 
@@ -19,11 +19,12 @@ LOGGER = logging.getLogger('jmetal')
 
 
 def get_non_dominated_solutions(solutions: List[Solution]) -> List[Solution]:
-    archive: Archive = NonDominatedSolutionsArchive()
+    archive: Archive = NDTreeArchive()
 
     for solution in solutions:
         archive.add(solution)
 
+    # The archive is discarded, so its (otherwise read-only) list can be handed over
     return archive.solution_list
 
 
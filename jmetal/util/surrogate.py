@@ -0,0 +1,135 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+import numpy
+
+from jmetal.util.comparator import dominance_test_matrix
+
+"""
+.. module:: surrogate
+   :platform: Unix, Windows
+   :synopsis: Surrogate models approximating the objectives of expensive problems.
+"""
+
+
+class Surrogate(ABC):
+    """ Interface of the surrogate models: they are updated with real evaluations and predict the mean and the
+    standard deviation of the outputs of new points. """
+
+    @abstractmethod
+    def update(self, x: numpy.ndarray, y: numpy.ndarray) -> None:
+        pass
+
+    @abstractmethod
+    def predict(self, x: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        pass
+
+    @property
+    @abstractmethod
+    def number_of_samples(self) -> int:
+        pass
+
+
+class KrigingSurrogate(Surrogate):
+    """ Kriging (Gaussian process) model with a Gaussian RBF kernel implemented with NumPy.
+
+    The inputs are scaled to the unit hypercube with the given bounds and every output column is standardized. All the
+    samples received through :meth:`update` are kept (up to `maximum_samples`, discarding the oldest ones) and the
+    model is refitted once per update, choosing the length scale with the largest marginal likelihood from
+    `length_scales` (relative to the diagonal of the unit hypercube).
+    """
+
+    def __init__(self,
+                 lower_bound: List[float],
+                 upper_bound: List[float],
+                 length_scales: List[float] = (0.05, 0.1, 0.2, 0.5, 1.0),
+                 nugget: float = 1e-6,
+                 maximum_samples: int = 1000):
+        self.lower_bound = numpy.asarray(lower_bound, dtype=float)
+        self.scale = numpy.asarray(upper_bound, dtype=float) - self.lower_bound
+        self.scale[self.scale == 0] = 1.0
+        self.length_scales = length_scales
+        self.nugget = nugget
+        self.maximum_samples = maximum_samples
+
+        self.x = None
+        self.y = None
+        self.length_scale = None
+        self._mean = None
+        self._std = None
+        self._cholesky = None
+        self._alpha = None
+
+    @property
+    def number_of_samples(self) -> int:
+        return 0 if self.x is None else self.x.shape[0]
+
+    def update(self, x: numpy.ndarray, y: numpy.ndarray) -> None:
+        x = (numpy.asarray(x, dtype=float) - self.lower_bound) / self.scale
+        y = numpy.asarray(y, dtype=float)
+
+        if self.x is not None:
+            x, y = numpy.vstack((self.x, x)), numpy.vstack((self.y, y))
+
+        self.x, self.y = x[-self.maximum_samples:], y[-self.maximum_samples:]
+
+        self._fit()
+
+    def predict(self, x: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        x = (numpy.asarray(x, dtype=float) - self.lower_bound) / self.scale
+        cross_kernel = self._kernel(x, self.x, self.length_scale)
+
+        mean = cross_kernel @ self._alpha
+        v = numpy.linalg.solve(self._cholesky, cross_kernel.T)
+        variance = numpy.clip(1.0 - numpy.sum(v ** 2, axis=0), 0.0, None)
+
+        return self._mean + self._std * mean, self._std * numpy.sqrt(variance)[:, None]
+
+    def _fit(self) -> None:
+        self._mean = self.y.mean(axis=0)
+        self._std = self.y.std(axis=0)
+        self._std[self._std == 0] = 1.0
+        y = (self.y - self._mean) / self._std
+
+        diagonal = numpy.sqrt(self.x.shape[1])
+        best_likelihood = -numpy.inf
+        self._cholesky = None
+        for length_scale in self.length_scales:
+            length_scale *= diagonal
+            kernel = self._kernel(self.x, self.x, length_scale) + self.nugget * numpy.eye(self.x.shape[0])
+
+            try:
+                cholesky = numpy.linalg.cholesky(kernel)
+            except numpy.linalg.LinAlgError:
+                continue
+
+            alpha = numpy.linalg.solve(cholesky.T, numpy.linalg.solve(cholesky, y))
+            likelihood = -0.5 * numpy.sum(y * alpha) - y.shape[1] * numpy.sum(numpy.log(numpy.diag(cholesky)))
+
+            if likelihood > best_likelihood:
+                best_likelihood = likelihood
+                self.length_scale, self._cholesky, self._alpha = length_scale, cholesky, alpha
+
+        if self._cholesky is None:
+            raise numpy.linalg.LinAlgError('The kernel matrix is not positive definite; increase the nugget')
+
+    @staticmethod
+    def _kernel(a: numpy.ndarray, b: numpy.ndarray, length_scale: float) -> numpy.ndarray:
+        squared_distances = numpy.sum(a ** 2, axis=1)[:, None] + numpy.sum(b ** 2, axis=1)[None, :] - 2 * a @ b.T
+        return numpy.exp(-numpy.clip(squared_distances, 0.0, None) / (2 * length_scale ** 2))
+
+
+def non_dominated_levels(objectives: numpy.ndarray) -> numpy.ndarray:
+    """ Return the index of the non-dominated front (0 is the first one) of every row of an objective matrix. """
+    dominates = dominance_test_matrix(objectives, objectives) == -1
+
+    levels = numpy.full(objectives.shape[0], -1)
+    domination_count = dominates.sum(axis=0)
+    level = 0
+    while numpy.any(levels < 0):
+        front = (domination_count == 0) & (levels < 0)
+        levels[front] = level
+        domination_count = domination_count - dominates[front].sum(axis=0)
+        level += 1
+
+    return levels
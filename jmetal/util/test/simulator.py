@@ -0,0 +1,62 @@
+""" Stand-in for an external simulator speaking the line protocol of :class:`ExternalSimulatorEvaluator`.
+
+For every request `<id> <x1> ... <xn>` it answers `<id> <sum of x> <sum of x^2>` followed by
+`--number-of-constraints` constraints (`1 - x1`). It can also simulate a slow startup, crashes and hangs, and log its
+launches.
+"""
+import argparse
+import os
+import sys
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number-of-constraints', type=int, default=0)
+    parser.add_argument('--startup-delay', type=float, default=0.0)
+    parser.add_argument('--crash-after', type=int, default=0, help='Exit without answering the N+1-th request')
+    parser.add_argument('--crash-above', type=float, default=None, help='Exit when the first variable is greater')
+    parser.add_argument('--hang-above', type=float, default=None, help='Hang when the first variable is greater')
+    parser.add_argument('--hang-once', default=None, help='Only hang if this file does not exist (and create it)')
+    parser.add_argument('--launch-log', default=None, help='Append a line to this file at every launch')
+    arguments = parser.parse_args()
+
+    if arguments.launch_log:
+        with open(arguments.launch_log, 'a') as log:
+            log.write('{}\n'.format(os.getpid()))
+
+    time.sleep(arguments.startup_delay)
+
+    for number_of_requests, line in enumerate(sys.stdin):
+        if arguments.crash_after and number_of_requests == arguments.crash_after:
+            sys.exit(1)
+
+        index, *variables = line.split()
+        variables = [float(value) for value in variables]
+        if arguments.crash_above is not None and variables[0] > arguments.crash_above:
+            sys.exit(1)
+        if arguments.hang_above is not None and variables[0] > arguments.hang_above and _hangs(arguments.hang_once):
+            while True:
+                time.sleep(1.0)
+
+        values = [sum(variables), sum(value ** 2 for value in variables)]
+        values += [1.0 - variables[0]] * arguments.number_of_constraints
+
+        sys.stdout.write(' '.join([index] + [repr(value) for value in values]) + '\n')
+        sys.stdout.flush()
+
+
+def _hangs(marker: str) -> bool:
+    if marker is None:
+        return True
+
+    try:
+        open(marker, 'x').close()
+    except FileExistsError:
+        return False
+
+    return True
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,9 @@
+import random
 import unittest
 
 from jmetal.core.solution import Solution
-from jmetal.util.archive import NonDominatedSolutionsArchive, BoundedArchive, CrowdingDistanceArchive, Archive
+from jmetal.util.archive import NonDominatedSolutionsArchive, BoundedArchive, CrowdingDistanceArchive, Archive, \
+    NDTreeArchive
 
 
 class ArchiveTestCases(unittest.TestCase):
@@ -346,5 +348,71 @@ class CrowdingDistanceArchiveTestCases(unittest.TestCase):
         self.assertTrue(solution2.attributes["crowding_distance"] < float("inf"))
 
 
+class NDTreeArchiveTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.archive = NDTreeArchive(maximum_leaf_size=2)
+
+    def create_solution(self, objectives, constraints=()):
+        solution = Solution(1, len(objectives), len(constraints))
+        solution.objectives = list(objectives)
+        solution.constraints = list(constraints)
+        return solution
+
+    def test_should_constructor_create_an_empty_archive(self):
+        self.assertEqual(0, self.archive.size())
+        self.assertEqual([], self.archive.solution_list)
+
+    def test_should_add_remove_the_dominated_solutions(self):
+        solution1 = self.create_solution([2.0, 2.0])
+        solution2 = self.create_solution([0.0, 3.0])
+        solution3 = self.create_solution([1.0, 1.0])
+
+        self.assertTrue(self.archive.add(solution1))
+        self.assertTrue(self.archive.add(solution2))
+        self.assertTrue(self.archive.add(solution3))
+
+        self.assertEqual([solution2, solution3], self.archive.solution_list)
+
+    def test_should_add_reject_dominated_solutions_and_solutions_with_the_same_objectives(self):
+        self.archive.add(self.create_solution([1.0, 1.0]))
+
+        self.assertFalse(self.archive.add(self.create_solution([2.0, 1.0])))
+        self.assertFalse(self.archive.add(self.create_solution([1.0, 1.0])))
+        self.assertEqual(1, self.archive.size())
+
+    def test_should_add_compare_the_constraint_violation_degree_first(self):
+        infeasible_solution = self.create_solution([0.0, 0.0], [-1.0])
+        feasible_solution = self.create_solution([1.0, 1.0], [0.0])
+
+        self.assertTrue(self.archive.add(infeasible_solution))
+        self.assertTrue(self.archive.add(feasible_solution))
+        self.assertFalse(self.archive.add(self.create_solution([0.0, 0.0], [-0.5])))
+
+        self.assertEqual([feasible_solution], self.archive.solution_list)
+
+    def test_should_is_dominated_tell_whether_add_rejects_the_solution(self):
+        self.archive.add(self.create_solution([1.0, 2.0]))
+        self.archive.add(self.create_solution([2.0, 1.0]))
+
+        self.assertTrue(self.archive.is_dominated(self.create_solution([2.0, 2.0])))
+        self.assertTrue(self.archive.is_dominated(self.create_solution([1.0, 2.0])))
+        self.assertFalse(self.archive.is_dominated(self.create_solution([1.5, 1.5])))
+
+    def test_should_the_archive_be_equal_to_the_non_dominated_solutions_archive(self):
+        random.seed(1)
+        for number_of_objectives in (2, 3, 4):
+            archive = NDTreeArchive(maximum_leaf_size=3)
+            expected = NonDominatedSolutionsArchive()
+
+            for _ in range(300):
+                solution = self.create_solution([random.randint(0, 10) for _ in range(number_of_objectives)],
+                                                [random.choice([0.0, 0.0, -1.0])])
+
+                self.assertEqual(expected.add(solution), archive.add(solution))
+                self.assertEqual([id(solution) for solution in expected.solution_list],
+                                 [id(solution) for solution in archive.solution_list])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,10 +1,15 @@
+import random
+import time
 import unittest
+from functools import cmp_to_key
 
+import numpy
 from mockito import mock, when, verify, never
 
 from jmetal.core.solution import Solution
 from jmetal.util.comparator import DominanceComparator, SolutionAttributeComparator, \
-    RankingAndCrowdingDistanceComparator, Comparator, OverallConstraintViolationComparator, MultiComparator
+    RankingAndCrowdingDistanceComparator, Comparator, OverallConstraintViolationComparator, MultiComparator, \
+    EpsilonDominanceComparator, GDominanceComparator, dominance_test_matrix, sort_solutions, DominanceCache
 
 
 class OverallConstraintViolationComparatorTestCases(unittest.TestCase):
@@ -373,5 +378,235 @@ class MultiComparatorTestCases(unittest.TestCase):
         verify(mocked_comparator2, times=1).compare(solution1, solution2)
 
 
+
+class BatchedDominanceTestCases(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(1)
+        self.solutions = []
+        for _ in range(40):
+            solution = Solution(2, 3, 1)
+            solution.objectives = [random.randint(0, 4) * 0.25 for _ in range(3)]
+            solution.constraints = [random.choice([0, 0, -1, -2])]
+            if random.random() < 0.8:
+                solution.attributes['overall_constraint_violation'] = solution.constraints[0]
+            self.solutions.append(solution)
+
+    def assert_batched_comparison_is_equal_to_the_pairwise_one(self, comparator: Comparator):
+        self.assertTrue(comparator.batched)
+
+        result = comparator.compare_all(self.solutions, self.solutions[:25], block_size=7)
+
+        expected = [[comparator.compare(solution1, solution2) for solution2 in self.solutions[:25]]
+                    for solution1 in self.solutions]
+        self.assertEqual(expected, result.tolist())
+
+    def test_should_dominance_comparator_compare_all_be_equal_to_the_pairwise_comparison(self):
+        self.assert_batched_comparison_is_equal_to_the_pairwise_one(DominanceComparator())
+
+    def test_should_dominance_comparator_with_an_attribute_compare_all_be_equal_to_the_pairwise_comparison(self):
+        comparator = DominanceComparator(SolutionAttributeComparator('overall_constraint_violation', False))
+
+        self.assert_batched_comparison_is_equal_to_the_pairwise_one(comparator)
+
+    def test_should_epsilon_dominance_comparator_compare_all_be_equal_to_the_pairwise_comparison(self):
+        self.assert_batched_comparison_is_equal_to_the_pairwise_one(EpsilonDominanceComparator(0.3))
+
+    def test_should_comparators_not_supported_by_the_kernel_not_be_batched(self):
+        self.assertFalse(GDominanceComparator([0.5, 0.5, 0.5]).batched)
+        self.assertFalse(DominanceComparator(SolutionAttributeComparator('overall_constraint_violation')).batched)
+        self.assertFalse(SolutionAttributeComparator('key').batched)
+
+    def test_should_dominance_test_matrix_apply_the_violation_before_the_objectives(self):
+        objectives = numpy.array([[1.0, 1.0], [2.0, 2.0], [0.0, 3.0]])
+        violation = numpy.array([0.0, 0.0, -1.0])
+
+        result = dominance_test_matrix(objectives, objectives, violation, violation)
+
+        self.assertEqual([[0, -1, -1], [1, 0, -1], [1, 1, 0]], result.tolist())
+
+
+class SortSolutionsTestCases(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(1)
+        self.solutions = []
+        for i in range(50):
+            solution = Solution(1, 2)
+            solution.attributes['dominance_ranking'] = random.randint(0, 3)
+            solution.attributes['crowding_distance'] = random.choice([0.5, 1.0, 2.0, float('inf')])
+            self.solutions.append(solution)
+
+    def assert_sorted_as_with_compare(self, comparator: Comparator):
+        expected = sorted(self.solutions, key=cmp_to_key(comparator.compare))
+        sort_solutions(self.solutions, comparator)
+
+        self.assertEqual([id(solution) for solution in expected], [id(solution) for solution in self.solutions])
+
+    def test_should_attribute_comparators_be_key_based(self):
+        self.assertTrue(SolutionAttributeComparator('crowding_distance').key_based)
+        self.assertTrue(RankingAndCrowdingDistanceComparator().key_based)
+        self.assertFalse(DominanceComparator().key_based)
+        self.assertFalse(MultiComparator([SolutionAttributeComparator('a'), DominanceComparator()]).key_based)
+
+    def test_should_sort_key_of_a_multi_comparator_chain_the_keys_of_its_comparators(self):
+        comparator = MultiComparator([SolutionAttributeComparator('dominance_ranking'),
+                                      SolutionAttributeComparator('crowding_distance', lowest_is_best=False)])
+        solution = self.solutions[0]
+
+        self.assertEqual((solution.attributes['dominance_ranking'], -solution.attributes['crowding_distance']),
+                         comparator.sort_key(solution))
+
+    def test_should_sort_key_of_a_comparator_that_is_not_key_based_wrap_compare(self):
+        for solution in self.solutions:
+            solution.objectives = [random.random(), random.random()]
+
+        for comparator in [DominanceComparator(),
+                           MultiComparator([SolutionAttributeComparator('dominance_ranking'), DominanceComparator()])]:
+            expected = sorted(self.solutions, key=cmp_to_key(comparator.compare))
+
+            self.assertEqual([id(solution) for solution in expected],
+                             [id(solution) for solution in sorted(self.solutions, key=comparator.sort_key)])
+
+    def test_should_sort_solutions_be_equal_to_the_sort_with_compare(self):
+        self.assert_sorted_as_with_compare(SolutionAttributeComparator('crowding_distance', lowest_is_best=False))
+
+    def test_should_sort_solutions_with_a_chain_be_equal_to_the_sort_with_compare(self):
+        self.assert_sorted_as_with_compare(
+            MultiComparator([SolutionAttributeComparator('dominance_ranking'),
+                             SolutionAttributeComparator('crowding_distance', lowest_is_best=False)]))
+        self.assert_sorted_as_with_compare(RankingAndCrowdingDistanceComparator())
+
+    def test_should_sort_solutions_fall_back_to_compare_if_an_attribute_is_missing(self):
+        del self.solutions[3].attributes['crowding_distance']
+        del self.solutions[7].attributes['dominance_ranking']
+
+        self.assert_sorted_as_with_compare(RankingAndCrowdingDistanceComparator())
+
+    def test_should_sort_solutions_use_compare_if_the_comparator_is_not_key_based(self):
+        comparator = mock(Comparator)
+        when(comparator).compare(...).thenReturn(0)
+        when(comparator).key_based.thenReturn(False)
+
+        sort_solutions(self.solutions[:3], comparator)
+
+        verify(comparator, times=2).compare(...)
+
+
+class DominanceCacheTestCases(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(2)
+        self.solutions = []
+        for _ in range(20):
+            solution = Solution(2, 2)
+            solution.objectives = [random.randint(0, 5), random.randint(0, 5)]
+            self.solutions.append(solution)
+
+        self.comparator = DominanceComparator()
+        self.cache = DominanceCache(self.comparator)
+
+    def test_should_compare_return_the_result_of_the_wrapped_comparator(self):
+        for solution1 in self.solutions:
+            for solution2 in self.solutions:
+                self.assertEqual(self.comparator.compare(solution1, solution2), self.cache.compare(solution1, solution2))
+
+    def test_should_compare_count_the_repeated_comparisons_as_hits(self):
+        solution1, solution2 = self.solutions[:2]
+
+        self.cache.compare(solution1, solution2)
+        self.cache.compare(solution1, solution2)
+        self.cache.compare(solution2, solution1)
+
+        self.assertEqual(2, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+        self.assertEqual(2 / 3, self.cache.hit_rate)
+
+    def test_should_compare_not_reuse_the_reverse_order_if_the_comparator_is_not_antisymmetric(self):
+        cache = DominanceCache(EpsilonDominanceComparator(0.1))
+        self.assertFalse(cache.antisymmetric)
+
+        cache.compare(self.solutions[0], self.solutions[1])
+        cache.compare(self.solutions[1], self.solutions[0])
+
+        self.assertEqual(0, cache.hits)
+
+    def test_should_compare_reuse_the_matrix_of_compare_all(self):
+        matrix = self.cache.compare_all(self.solutions, self.solutions)
+
+        self.assertEqual(self.comparator.compare_all(self.solutions, self.solutions).tolist(), matrix.tolist())
+        self.assertEqual(self.comparator.compare(self.solutions[3], self.solutions[7]),
+                         self.cache.compare(self.solutions[3], self.solutions[7]))
+        self.assertEqual(400, self.cache.misses)
+        self.assertEqual(1, self.cache.hits)
+
+    def test_should_compare_all_reuse_the_block_of_the_last_call(self):
+        self.cache.compare_all(self.solutions[:10], self.solutions[:10])
+        matrix = self.cache.compare_all(self.solutions[5:], self.solutions[5:])
+
+        self.assertEqual(self.comparator.compare_all(self.solutions[5:], self.solutions[5:]).tolist(), matrix.tolist())
+        self.assertEqual(25, self.cache.hits)
+        self.assertEqual(100 + 225 - 25, self.cache.misses)
+
+    def test_should_update_keep_only_the_pairs_of_the_solutions_of_the_population(self):
+        self.cache.compare_all(self.solutions[:10], self.solutions[:10])
+        self.cache.compare(self.solutions[0], self.solutions[15])
+        self.cache.compare(self.solutions[1], self.solutions[15])
+
+        self.cache.update(SOLUTIONS=self.solutions[1:])
+        self.cache.compare(self.solutions[0], self.solutions[1])
+        self.cache.compare(self.solutions[0], self.solutions[15])
+        self.cache.compare(self.solutions[2], self.solutions[1])
+        self.cache.compare(self.solutions[1], self.solutions[15])
+
+        self.assertEqual(2, self.cache.hits)
+
+    def test_should_compare_not_reuse_the_results_of_a_solution_reevaluated_in_place(self):
+        solution1, solution2 = Solution(2, 2), Solution(2, 2)
+        solution1.objectives, solution2.objectives = [1, 1], [2, 2]
+        self.cache.compare_all([solution1, solution2], [solution1, solution2])
+        self.cache.compare(solution1, solution2)
+
+        solution1.objectives = [3, 3]
+        self.cache.update(SOLUTIONS=[solution1, solution2])
+
+        self.assertEqual(1, self.cache.compare(solution1, solution2))
+        self.assertEqual(-1, self.cache.compare(solution2, solution1))
+        self.assertEqual([[0, 1], [-1, 0]], self.cache.compare_all([solution1, solution2],
+                                                                   [solution1, solution2]).tolist())
+
+    def test_should_compare_empty_the_cache_when_it_is_full(self):
+        cache = DominanceCache(self.comparator, maximum_size=3)
+
+        for solution in self.solutions[1:6]:
+            cache.compare(self.solutions[0], solution)
+        cache.compare(self.solutions[0], self.solutions[5])
+        cache.compare(self.solutions[0], self.solutions[1])
+
+        self.assertLessEqual(len(cache._pairs), 3)
+        self.assertEqual(1, cache.hits)
+
+    def test_should_compare_answer_cached_pairs_faster_than_the_wrapped_comparator(self):
+        pairs = [(random.choice(self.solutions), random.choice(self.solutions)) for _ in range(20000)]
+
+        def elapsed_time(comparator: Comparator) -> float:
+            start = time.perf_counter()
+            for solution1, solution2 in pairs:
+                comparator.compare(solution1, solution2)
+            return time.perf_counter() - start
+
+        elapsed_time(self.cache)
+
+        self.assertLess(min(elapsed_time(self.cache) for _ in range(3)),
+                        min(elapsed_time(self.comparator) for _ in range(3)))
+
+    def test_should_clear_empty_the_cache(self):
+        self.cache.compare(self.solutions[0], self.solutions[1])
+        self.cache.clear()
+        self.cache.compare(self.solutions[0], self.solutions[1])
+
+        self.assertEqual(0, self.cache.hits)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,8 +1,11 @@
+import random
 import unittest
 from math import sqrt
 
+import numpy
+
 from jmetal.core.solution import Solution
-from jmetal.util.density_estimator import CrowdingDistance, KNearestNeighborDensityEstimator
+from jmetal.util.density_estimator import CrowdingDistance, KNearestNeighborDensityEstimator, DensityEstimator
 
 
 class CrowdingDistanceTestCases(unittest.TestCase):
@@ -87,6 +90,37 @@ class CrowdingDistanceTestCases(unittest.TestCase):
         self.assertEqual(float("inf"), value_from_solution2)
         self.assertGreater(value_from_solution3, value_from_solution4)
 
+    def test_should_compute_distances_return_the_crowding_distance_vector(self):
+        objectives = numpy.array([[0.0, 1.0], [1.0, 0.0], [0.5, 0.5], [0.75, 0.25]])
+
+        distances = self.crowding.compute_distances(objectives)
+
+        self.assertEqual([float('inf'), float('inf'), 1.5, 1.0], distances.tolist())
+
+    def test_should_compute_density_estimator_return_the_distances_assigned_to_the_solutions(self):
+        solution_list = []
+        for objectives in ([0.0, 1.0], [1.0, 0.0], [0.5, 0.5]):
+            solution = Solution(2, 2)
+            solution.objectives = objectives
+            solution_list.append(solution)
+
+        distances = self.crowding.compute_density_estimator(solution_list)
+
+        self.assertEqual([solution.attributes['crowding_distance'] for solution in solution_list], distances.tolist())
+
+    def test_should_truncate_keep_the_solutions_with_the_largest_distances_in_order(self):
+        solution_list = []
+        for distance in (1.0, float('inf'), 0.5, 2.0, 1.0, float('inf')):
+            solution = Solution(2, 2)
+            solution.attributes['crowding_distance'] = distance
+            solution_list.append(solution)
+
+        result = self.crowding.truncate(solution_list, 4)
+
+        self.assertEqual([solution_list[1], solution_list[5], solution_list[3], solution_list[0]], result)
+        self.assertEqual([], self.crowding.truncate(solution_list, 0))
+        self.assertEqual(6, len(self.crowding.truncate(solution_list, 10)))
+
 
 class KNearestNeighborDensityEstimatorTest(unittest.TestCase):
 
@@ -212,5 +246,65 @@ class KNearestNeighborDensityEstimatorTest(unittest.TestCase):
         self.assertEqual([0.1028341459863098, 4.9409270526888935], population[4].objectives)
 
 
+    def test_should_truncate_sequentially_remove_the_same_solutions_as_the_default_implementation(self):
+        random.seed(1)
+        for k in (1, 2):
+            population = []
+            for _ in range(60):
+                solution = Solution(2, 2)
+                solution.objectives = [random.random(), random.random()]
+                population.append(solution)
+
+            knn = KNearestNeighborDensityEstimator(k)
+            knn.compute_density_estimator(population)
+            expected = DensityEstimator.truncate_sequentially(knn, population, 20)
+            expected_densities = [solution.attributes['knn_density'] for solution in expected]
+
+            result = KNearestNeighborDensityEstimator(k).truncate_sequentially(population, 20)
+
+            self.assertEqual(expected, result)
+            for expected_density, solution in zip(expected_densities, result):
+                self.assertAlmostEqual(expected_density, solution.attributes['knn_density'])
+
+    def test_should_truncate_sequentially_return_the_list_if_it_is_not_larger_than_the_size(self):
+        population = [Solution(2, 2) for _ in range(3)]
+
+        self.assertEqual(population, self.knn.truncate_sequentially(population, 3))
+
+    def test_should_sort_keep_all_the_solutions_if_there_are_not_more_than_k(self):
+        larger_list = [Solution(2, 2) for _ in range(4)]
+        for i, solution in enumerate(larger_list):
+            solution.objectives = [i, 4 - i]
+        self.knn.compute_density_estimator(larger_list)
+        self.knn.sort(larger_list)
+
+        solution = Solution(2, 2)
+        solution.objectives = [1, 1]
+        solution_list = [solution]
+
+        self.knn.compute_density_estimator(solution_list)
+        self.knn.sort(solution_list)
+
+        self.assertEqual([solution], solution_list)
+        self.assertEqual([0.0], solution.attributes['distances_'])
+
+    def test_should_sort_not_use_the_distances_of_a_different_list(self):
+        larger_list = [Solution(2, 2) for _ in range(4)]
+        for i, solution in enumerate(larger_list):
+            solution.objectives = [i, 4 - i]
+        self.knn.compute_density_estimator(larger_list)
+
+        solution1 = Solution(2, 2)
+        solution1.objectives = [1, 5]
+        solution2 = Solution(2, 2)
+        solution2.objectives = [2, 4]
+        solution3 = Solution(2, 2)
+        solution3.objectives = [5, 1]
+        solution_list = [solution1, solution2, solution3]
+
+        self.knn.sort(solution_list)
+
+        self.assertEqual([solution3, solution1, solution2], solution_list)
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,41 @@
+import asyncio
+import copy
+import multiprocessing
+import os
+import pickle
+import sys
+import tempfile
+import time
 import unittest
+from multiprocessing import Pool
 
-from jmetal.core.problem import FloatProblem
-from jmetal.core.solution import FloatSolution
-from jmetal.util.evaluator import SequentialEvaluator, MapEvaluator
+import numpy
+
+try:
+    from distributed import Client, LocalCluster
+except ImportError:
+    Client = None
+
+try:
+    from pyspark import SparkConf, SparkContext
+except ImportError:
+    SparkContext = None
+
+from jmetal.algorithm.multiobjective.nsgaii import NSGAII
+from jmetal.core.observer import Observer
+from jmetal.core.population import Population
+from jmetal.core.problem import FloatProblem, DynamicProblem
+from jmetal.core.solution import FloatSolution, BinarySolution
+from jmetal.operator import SBXCrossover, PolynomialMutation
+from jmetal.problem.multiobjective.dtlz import DTLZ1
+from jmetal.problem.multiobjective.fda import FDA1
+from jmetal.problem.multiobjective.zdt import ZDT1, ZDT1Modified
+from jmetal.util.evaluator import SequentialEvaluator, MapEvaluator, MultiprocessEvaluator, SharedMemoryEvaluator, \
+    WorkerPoolEvaluator, AsyncEvaluator, CachingEvaluator, PersistentCachingEvaluator, AdaptiveChunkSize, \
+    StragglerTolerantEvaluator, FailurePolicyType, ExternalSimulatorEvaluator, DaskEvaluator, \
+    SparkEvaluator, InstrumentedEvaluator, SurrogateEvaluator, ScreeningCriterionType, \
+    supports_batch_evaluation, _evaluate_variables, _evaluate_partition
+from jmetal.util.termination_criterion import StoppingByEvaluations
 
 
 class MockedProblem(FloatProblem):
@@ -56,6 +89,53 @@ class SequentialEvaluatorTestCases(unittest.TestCase):
             self.assertEqual(2.3, problem_list[i].objectives[1])
 
 
+class MockedBatchProblem(MockedProblem):
+
+    def __init__(self):
+        super(MockedBatchProblem, self).__init__()
+        self.number_of_batch_calls = 0
+
+    def evaluate_batch(self, variables: numpy.ndarray):
+        self.number_of_batch_calls += 1
+        objectives = numpy.column_stack((variables.sum(axis=1), numpy.full(variables.shape[0], 2.3)))
+
+        return objectives, numpy.zeros((variables.shape[0], 0))
+
+
+class BatchEvaluationTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = SequentialEvaluator()
+        self.problem = MockedBatchProblem()
+
+    def test_should_supports_batch_evaluation_detect_the_batch_method(self):
+        self.assertTrue(supports_batch_evaluation(self.problem))
+        self.assertTrue(supports_batch_evaluation(ZDT1()))
+        self.assertFalse(supports_batch_evaluation(MockedProblem()))
+
+    def test_should_supports_batch_evaluation_ignore_the_batch_method_if_evaluate_is_overridden(self):
+        self.assertFalse(supports_batch_evaluation(ZDT1Modified()))
+
+    def test_should_sequential_evaluator_use_the_batch_method(self):
+        solution_list = [self.problem.create_solution() for _ in range(10)]
+
+        self.evaluator.evaluate(solution_list, self.problem)
+
+        self.assertEqual(1, self.problem.number_of_batch_calls)
+        for solution in solution_list:
+            self.assertAlmostEqual(sum(solution.variables), solution.objectives[0])
+            self.assertEqual(2.3, solution.objectives[1])
+
+    def test_should_sequential_evaluator_write_the_batch_results_into_a_population(self):
+        population = Population.from_solutions([self.problem.create_solution() for _ in range(10)])
+
+        self.evaluator.evaluate(population, self.problem)
+
+        self.assertEqual(1, self.problem.number_of_batch_calls)
+        self.assertEqual([2.3] * 10, population.objectives[:, 1].tolist())
+        self.assertEqual(2.3, population[4].objectives[1])
+
+
 class ParallelEvaluatorTestCases(unittest.TestCase):
 
     def setUp(self):
@@ -82,6 +162,964 @@ class ParallelEvaluatorTestCases(unittest.TestCase):
             self.assertEqual(1.2, problem_list[i].objectives[0])
             self.assertEqual(2.3, problem_list[i].objectives[1])
 
+    def test_should_evaluate_as_completed_yield_all_the_evaluated_solutions(self):
+        problem_list = [self.problem.create_solution() for _ in range(10)]
+
+        evaluated = list(self.evaluator.evaluate_as_completed(problem_list, self.problem))
+
+        self.assertEqual(10, len(evaluated))
+        for solution in problem_list:
+            self.assertIn(solution, evaluated)
+            self.assertEqual(1.2, solution.objectives[0])
+
+    def test_should_evaluate_measure_the_evaluation_latencies(self):
+        self.evaluator.evaluate([self.problem.create_solution() for _ in range(10)], self.problem)
+
+        self.assertIsNotNone(self.evaluator.adaptive_chunk_size.mean_latency)
+
+
+class MultiprocessEvaluatorTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = MultiprocessEvaluator(processes=2)
+        self.problem = MockedProblem()
+
+    def tearDown(self):
+        self.evaluator.pool.terminate()
+
+    def test_should_evaluate_a_list_of_problem_work_properly(self):
+        problem_list = [self.problem.create_solution() for _ in range(10)]
+
+        evaluated = self.evaluator.evaluate(problem_list, self.problem)
+
+        self.assertEqual(10, len(evaluated))
+        for i in range(10):
+            self.assertEqual(problem_list[i].variables, evaluated[i].variables)
+            self.assertEqual(1.2, evaluated[i].objectives[0])
+            self.assertEqual(2.3, evaluated[i].objectives[1])
+
+    def test_should_evaluate_as_completed_yield_all_the_evaluated_solutions(self):
+        problem_list = [self.problem.create_solution() for _ in range(10)]
+
+        evaluated = list(self.evaluator.evaluate_as_completed(problem_list, self.problem))
+
+        self.assertEqual(10, len(evaluated))
+        self.assertTrue(all(solution.objectives == [1.2, 2.3] for solution in evaluated))
+
+
+class AdaptiveChunkSizeTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.chunk_size = AdaptiveChunkSize(number_of_workers=4, target_time=0.01)
+
+    def test_should_get_use_the_default_pool_heuristic_without_measurements(self):
+        self.assertEqual(7, self.chunk_size.get(100))
+        self.assertEqual(1, self.chunk_size.get(3))
+
+    def test_should_get_return_large_chunks_for_cheap_evaluations(self):
+        self.chunk_size.update([1e-6] * 100)
+
+        self.assertEqual(25, self.chunk_size.get(100))
+
+    def test_should_get_return_chunks_lasting_the_target_time(self):
+        self.chunk_size.update([0.001] * 100)
+
+        self.assertEqual(10, self.chunk_size.get(100))
+
+    def test_should_get_return_one_for_heavy_tailed_evaluation_times(self):
+        self.chunk_size.update([0.001] * 98 + [1.0, 2.0])
+
+        self.assertEqual(1, self.chunk_size.get(100))
+
+
+@unittest.skipIf(sys.version_info < (3, 8), 'shared memory requires Python 3.8')
+class SharedMemoryEvaluatorTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = SharedMemoryEvaluator(processes=2)
+
+    def tearDown(self):
+        self.evaluator.pool.terminate()
+
+    def test_should_evaluate_a_list_of_problem_work_properly(self):
+        problem = MockedProblem()
+        problem_list = [problem.create_solution() for _ in range(10)]
+
+        result = self.evaluator.evaluate(problem_list, problem)
+
+        self.assertIs(problem_list, result)
+        for i in range(10):
+            self.assertEqual(1.2, problem_list[i].objectives[0])
+            self.assertEqual(2.3, problem_list[i].objectives[1])
+
+    def test_should_evaluate_use_the_batch_method_of_the_problem(self):
+        problem = ZDT1()
+        problem_list = [problem.create_solution() for _ in range(7)]
+
+        self.evaluator.evaluate(problem_list, problem)
+
+        for solution in problem_list:
+            expected = list(solution.objectives)
+            problem.evaluate(solution)
+            self.assertAlmostEqual(solution.objectives[0], expected[0])
+            self.assertAlmostEqual(solution.objectives[1], expected[1])
+
+    def test_should_evaluate_write_the_results_into_a_population(self):
+        problem = MockedProblem()
+        population = Population.from_solutions([problem.create_solution() for _ in range(5)])
+
+        self.evaluator.evaluate(population, problem)
+
+        self.assertEqual([[1.2, 2.3]] * 5, population.objectives.tolist())
+
+
+class WorkerPoolEvaluatorTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = WorkerPoolEvaluator(processes=2)
+        self.problem = MockedProblem()
+
+    def tearDown(self):
+        WorkerPoolEvaluator.shutdown()
+
+    def test_should_evaluate_a_list_of_problem_work_properly(self):
+        problem_list = [self.problem.create_solution() for _ in range(10)]
+
+        result = self.evaluator.evaluate(problem_list, self.problem)
+
+        self.assertIs(problem_list, result)
+        for i in range(10):
+            self.assertEqual(1.2, problem_list[i].objectives[0])
+            self.assertEqual(2.3, problem_list[i].objectives[1])
+
+    def test_should_the_pool_be_reused_by_other_evaluators_with_an_equal_problem(self):
+        self.evaluator.evaluate([self.problem.create_solution()], self.problem)
+        pool = self.evaluator._get_pool(self.problem)
+
+        WorkerPoolEvaluator(processes=2).evaluate([self.problem.create_solution()], MockedProblem())
+
+        self.assertEqual(1, len(WorkerPoolEvaluator._pools))
+        self.assertIs(pool, self.evaluator._get_pool(self.problem))
+
+    def test_should_the_pool_be_restarted_if_the_problem_changes(self):
+        self.evaluator.evaluate([self.problem.create_solution()], self.problem)
+        pool = self.evaluator._get_pool(self.problem)
+
+        other_problem = MockedProblem(number_of_variables=4)
+        solution = other_problem.create_solution()
+        self.evaluator.evaluate([solution], other_problem)
+
+        self.assertIsNot(pool, self.evaluator._get_pool(other_problem))
+        self.assertEqual(1, len(WorkerPoolEvaluator._pools))
+        self.assertEqual(1.2, solution.objectives[0])
+
+    def test_should_evaluators_with_the_same_processes_and_different_problems_use_their_own_pool(self):
+        other_evaluator = WorkerPoolEvaluator(processes=2)
+        other_problem = ZDT1()
+
+        for _ in range(2):
+            solution = self.problem.create_solution()
+            other_solution = other_problem.create_solution()
+            self.evaluator.evaluate([solution], self.problem)
+            other_evaluator.evaluate([other_solution], other_problem)
+
+            self.assertEqual([1.2, 2.3], solution.objectives)
+            self.assertEqual(other_solution.variables[0], other_solution.objectives[0])
+
+        self.assertEqual(2, len(WorkerPoolEvaluator._pools))
+
+    def test_should_a_shared_pool_be_kept_until_no_evaluator_uses_it(self):
+        other_evaluator = WorkerPoolEvaluator(processes=2)
+        self.evaluator.evaluate([self.problem.create_solution()], self.problem)
+        other_evaluator.evaluate([self.problem.create_solution()], self.problem)
+        pool = self.evaluator._get_pool(self.problem)
+
+        other_problem = MockedProblem(number_of_variables=4)
+        self.evaluator.evaluate([other_problem.create_solution()], other_problem)
+        solution = self.problem.create_solution()
+        other_evaluator.evaluate([solution], self.problem)
+
+        self.assertEqual([1.2, 2.3], solution.objectives)
+        self.assertIs(pool, other_evaluator._get_pool(self.problem))
+        self.assertEqual(2, len(WorkerPoolEvaluator._pools))
+
+        other_evaluator.evaluate([other_problem.create_solution()], other_problem)
+
+        self.assertEqual(1, len(WorkerPoolEvaluator._pools))
+        self.assertIs(self.evaluator._get_pool(other_problem), other_evaluator._get_pool(other_problem))
+
+
+class MockedAsyncProblem(MockedProblem):
+
+    def __init__(self):
+        super(MockedAsyncProblem, self).__init__()
+        self.running_evaluations = 0
+        self.max_running_evaluations = 0
+
+    async def evaluate_async(self, solution: FloatSolution):
+        self.running_evaluations += 1
+        self.max_running_evaluations = max(self.max_running_evaluations, self.running_evaluations)
+
+        await asyncio.sleep(0.001)
+        self.evaluate(solution)
+
+        self.running_evaluations -= 1
+
+
+class AsyncEvaluatorTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = AsyncEvaluator(max_concurrency=3)
+
+    def tearDown(self):
+        self.evaluator.close()
+
+    def test_should_evaluate_a_list_of_problem_work_properly(self):
+        problem = MockedAsyncProblem()
+        problem_list = [problem.create_solution() for _ in range(10)]
+
+        result = self.evaluator.evaluate(problem_list, problem)
+
+        self.assertIs(problem_list, result)
+        for i in range(10):
+            self.assertEqual(1.2, problem_list[i].objectives[0])
+            self.assertEqual(2.3, problem_list[i].objectives[1])
+
+    def test_should_evaluate_limit_the_number_of_concurrent_evaluations(self):
+        problem = MockedAsyncProblem()
+
+        self.evaluator.evaluate([problem.create_solution() for _ in range(20)], problem)
+
+        self.assertEqual(3, problem.max_running_evaluations)
+
+    def test_should_evaluate_work_with_problems_without_evaluate_async(self):
+        problem = MockedProblem()
+        problem_list = [problem.create_solution() for _ in range(5)]
+
+        self.evaluator.evaluate(problem_list, problem)
+
+        self.assertTrue(all(solution.objectives == [1.2, 2.3] for solution in problem_list))
+
+
+class MockedCountingProblem(MockedProblem):
+
+    def __init__(self):
+        super(MockedCountingProblem, self).__init__()
+        self.number_of_evaluations = 0
+
+    def evaluate(self, solution: FloatSolution):
+        self.number_of_evaluations += 1
+        solution.objectives[0] = sum(solution.variables)
+        solution.objectives[1] = 2.3
+
+        return solution
+
+
+class CachingEvaluatorTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = CachingEvaluator(SequentialEvaluator(), maximum_size=3)
+        self.problem = MockedCountingProblem()
+
+    def test_should_the_default_inner_evaluator_not_be_shared(self):
+        self.assertIsInstance(CachingEvaluator().evaluator, SequentialEvaluator)
+        self.assertIsNot(CachingEvaluator().evaluator, CachingEvaluator().evaluator)
+        self.assertIsNot(InstrumentedEvaluator().evaluator, InstrumentedEvaluator().evaluator)
+        self.assertIsNot(SurrogateEvaluator().evaluator, SurrogateEvaluator().evaluator)
+
+    def test_should_evaluate_not_call_the_problem_for_cached_solutions(self):
+        solution = self.problem.create_solution()
+        copied_solution = copy.deepcopy(solution)
+
+        self.evaluator.evaluate([solution], self.problem)
+        self.evaluator.evaluate([copied_solution], self.problem)
+
+        self.assertEqual(1, self.problem.number_of_evaluations)
+        self.assertEqual(solution.objectives, copied_solution.objectives)
+        self.assertEqual(1, self.evaluator.hits)
+        self.assertEqual(1, self.evaluator.misses)
+        self.assertEqual(0.5, self.evaluator.hit_rate)
+
+    def test_should_evaluate_evaluate_only_once_the_duplicates_of_a_list(self):
+        solution = self.problem.create_solution()
+        solution_list = [solution, copy.deepcopy(solution), copy.deepcopy(solution)]
+
+        result = self.evaluator.evaluate(solution_list, self.problem)
+
+        self.assertIs(solution_list, result)
+        self.assertEqual(1, self.problem.number_of_evaluations)
+        self.assertTrue(all(s.objectives == solution.objectives for s in solution_list))
+
+    def test_should_the_least_recently_used_entry_be_evicted(self):
+        solution_list = [self.problem.create_solution() for _ in range(4)]
+        for solution in solution_list[:3]:
+            self.evaluator.evaluate([solution], self.problem)
+
+        self.evaluator.evaluate([copy.deepcopy(solution_list[0])], self.problem)
+        self.evaluator.evaluate([solution_list[3]], self.problem)
+
+        self.assertEqual(3, len(self.evaluator.cache))
+        self.evaluator.evaluate([copy.deepcopy(solution_list[1])], self.problem)
+        self.assertEqual(5, self.problem.number_of_evaluations)
+
+    def test_should_the_cache_be_bounded_by_memory(self):
+        evaluator = CachingEvaluator(SequentialEvaluator(), maximum_memory=1)
+
+        evaluator.evaluate([self.problem.create_solution() for _ in range(5)], self.problem)
+
+        self.assertEqual(1, len(evaluator.cache))
+
+    def test_should_the_cache_be_cleared_if_the_problem_changes(self):
+        solution = self.problem.create_solution()
+        self.evaluator.evaluate([solution], self.problem)
+
+        other_problem = MockedCountingProblem()
+        self.evaluator.evaluate([copy.deepcopy(solution)], other_problem)
+
+        self.assertEqual(1, other_problem.number_of_evaluations)
+
+    def test_should_binary_variables_be_cached(self):
+        solution = BinarySolution(number_of_variables=1, number_of_objectives=2)
+        solution.variables[0] = [True, False, True]
+        problem = MockedCountingProblem()
+        problem.evaluate = lambda s: s
+
+        self.evaluator.evaluate([solution, copy.deepcopy(solution)], problem)
+
+        self.assertEqual(1, self.evaluator.misses)
+        self.assertEqual(1, self.evaluator.hits)
+
+
+def evaluate_with_persistent_cache(filename: str, solution: FloatSolution) -> int:
+    problem = MockedCountingProblem()
+    PersistentCachingEvaluator(SequentialEvaluator(), filename=filename).evaluate([solution], problem)
+
+    return problem.number_of_evaluations
+
+
+class PersistentCachingEvaluatorTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, 'cache.db')
+        self.problem = MockedCountingProblem()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_should_evaluations_be_reused_by_other_evaluators(self):
+        solution_list = [self.problem.create_solution() for _ in range(10)]
+        PersistentCachingEvaluator(SequentialEvaluator(), filename=self.filename).evaluate(solution_list, self.problem)
+
+        other_problem = MockedCountingProblem()
+        evaluator = PersistentCachingEvaluator(SequentialEvaluator(), filename=self.filename)
+        copied_list = copy.deepcopy(solution_list)
+        for solution in copied_list:
+            solution.objectives = [0.0, 0.0]
+        evaluator.evaluate(copied_list, other_problem)
+
+        self.assertEqual(0, other_problem.number_of_evaluations)
+        self.assertEqual(10, evaluator.hits)
+        for solution, copied_solution in zip(solution_list, copied_list):
+            self.assertEqual(solution.objectives, copied_solution.objectives)
+
+    def test_should_entries_be_separated_by_problem_name(self):
+        solution = self.problem.create_solution()
+        PersistentCachingEvaluator(SequentialEvaluator(), filename=self.filename).evaluate([solution], self.problem)
+
+        other_problem = MockedCountingProblem()
+        other_problem.get_name = lambda: 'Other'
+        PersistentCachingEvaluator(SequentialEvaluator(), filename=self.filename).evaluate(
+            [copy.deepcopy(solution)], other_problem)
+
+        self.assertEqual(1, other_problem.number_of_evaluations)
+
+    def test_should_entries_be_separated_by_the_dimensions_of_the_problem(self):
+        problem = DTLZ1(number_of_variables=7, number_of_objectives=2)
+        solution = problem.create_solution()
+        PersistentCachingEvaluator(SequentialEvaluator(), filename=self.filename).evaluate([solution], problem)
+
+        other_problem = DTLZ1(number_of_variables=7, number_of_objectives=3)
+        other_solution = other_problem.create_solution()
+        other_solution.variables = list(solution.variables)
+        evaluator = PersistentCachingEvaluator(SequentialEvaluator(), filename=self.filename)
+        evaluator.evaluate([other_solution], other_problem)
+
+        self.assertEqual(0, evaluator.hits)
+        self.assertEqual(3, len(other_solution.objectives))
+
+    def test_should_the_evaluations_of_a_dynamic_problem_not_be_reused_after_it_changes(self):
+        problem = FDA1(number_of_variables=3)
+        solution_list = [problem.create_solution() for _ in range(3)]
+        evaluator = PersistentCachingEvaluator(SequentialEvaluator(), filename=self.filename)
+        evaluator.evaluate(solution_list, problem)
+        objectives = [list(solution.objectives) for solution in solution_list]
+
+        problem.update(COUNTER=30)
+        other_list = copy.deepcopy(solution_list)
+        other_evaluator = PersistentCachingEvaluator(SequentialEvaluator(), filename=self.filename)
+        for current_evaluator in (evaluator, other_evaluator):
+            current_evaluator.evaluate(other_list, problem)
+
+            self.assertNotEqual(objectives, [solution.objectives for solution in other_list])
+        self.assertEqual(0, evaluator.hits)
+        self.assertEqual(3, other_evaluator.hits)
+
+    def test_should_the_evaluator_be_picklable(self):
+        evaluator = PersistentCachingEvaluator(SequentialEvaluator(), filename=self.filename)
+        evaluator.evaluate([self.problem.create_solution()], self.problem)
+
+        unpickled_evaluator = pickle.loads(pickle.dumps(evaluator))
+
+        self.assertIsNone(unpickled_evaluator._connection)
+
+    def test_should_several_processes_share_the_database(self):
+        solution = self.problem.create_solution()
+
+        with Pool(2) as pool:
+            first_evaluations = pool.apply(evaluate_with_persistent_cache, (self.filename, solution))
+            evaluations = pool.starmap(evaluate_with_persistent_cache, [(self.filename, solution)] * 4)
+
+        self.assertEqual(1, first_evaluations)
+        self.assertEqual([0, 0, 0, 0], evaluations)
+        self.assertEqual(0, evaluate_with_persistent_cache(self.filename, solution))
+
+
+class MockedStragglerProblem(MockedProblem):
+    """ Hangs when the first variable is greater than 4, until `release` is set. If `only_once` is True, only the
+    first of those evaluations hangs. A hung evaluation released by the safety timeout sets the second objective to
+    -1.
+
+    The flags are shared values without locks (polled by the workers), since the evaluator kills hung workers and a
+    killed process must not leave a lock or condition acquired. """
+
+    def __init__(self, only_once: bool = False):
+        super(MockedStragglerProblem, self).__init__()
+        self.only_once = only_once
+        self.released = multiprocessing.RawValue('b', 0)
+        self.hung = multiprocessing.RawValue('b', 0)
+
+    def release(self) -> None:
+        self.released.value = 1
+
+    def evaluate(self, solution: FloatSolution):
+        solution.objectives[1] = 2.3
+
+        if solution.variables[0] > 4.0:
+            hangs = not (self.only_once and self.hung.value)
+            self.hung.value = 1
+
+            if hangs and not self._wait_for_release(60):
+                solution.objectives[1] = -1.0
+        elif solution.variables[0] < -4.0:
+            raise ValueError('Simulation failed')
+
+        solution.objectives[0] = solution.variables[0]
+
+        return solution
+
+    def _wait_for_release(self, timeout: float) -> bool:
+        deadline = time.time() + timeout
+        while not self.released.value:
+            if time.time() > deadline:
+                return False
+            time.sleep(0.01)
+
+        return True
+
+
+class StragglerTolerantEvaluatorTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = MockedStragglerProblem()
+        self.solution_list = [self.problem.create_solution() for _ in range(6)]
+        for i, solution in enumerate(self.solution_list):
+            solution.variables[0] = i * 0.5
+
+    def tearDown(self):
+        self.problem.release()
+        self.evaluator.shutdown()
+
+    def test_should_evaluate_keep_the_order_of_the_solutions(self):
+        self.evaluator = StragglerTolerantEvaluator(processes=2)
+
+        result = self.evaluator.evaluate(self.solution_list, self.problem)
+
+        self.assertEqual([i * 0.5 for i in range(6)], [solution.objectives[0] for solution in result])
+
+    def test_should_timed_out_evaluations_be_penalized(self):
+        self.evaluator = StragglerTolerantEvaluator(processes=2, timeout=0.5, penalty=1e6)
+        self.solution_list[2].variables[0] = 4.5
+
+        result = self.evaluator.evaluate(self.solution_list, self.problem)
+
+        self.assertEqual(6, len(result))
+        self.assertEqual([1e6, 1e6], result[2].objectives)
+        self.assertTrue(result[2].attributes['evaluation_failed'])
+        self.assertEqual(1.5, result[3].objectives[0])
+
+    def test_should_failed_evaluations_be_marked_as_dropped(self):
+        self.evaluator = StragglerTolerantEvaluator(processes=2, timeout=0.5, penalty=1e6,
+                                                    failure_policy=FailurePolicyType.DROP)
+        self.solution_list[1].variables[0] = 4.5
+        self.solution_list[4].variables[0] = -4.5
+
+        result = self.evaluator.evaluate(self.solution_list, self.problem)
+
+        self.assertIs(self.solution_list, result)
+        self.assertEqual([0.0, 1e6, 1.0, 1.5, 1e6, 2.5], [solution.objectives[0] for solution in result])
+        self.assertEqual([1, 4], [index for index, solution in enumerate(result)
+                                  if solution.attributes.get('evaluation_dropped')])
+
+    def test_should_failed_evaluations_be_retried(self):
+        self.problem = MockedStragglerProblem(only_once=True)
+        self.evaluator = StragglerTolerantEvaluator(processes=2, timeout=0.5, speculation_factor=None,
+                                                    failure_policy=FailurePolicyType.RETRY)
+        self.solution_list[0].variables[0] = 4.5
+
+        result = self.evaluator.evaluate(self.solution_list, self.problem)
+
+        self.assertEqual(4.5, result[0].objectives[0])
+        self.assertNotIn('evaluation_failed', result[0].attributes)
+
+    def test_should_stragglers_be_speculatively_executed(self):
+        self.problem = MockedStragglerProblem(only_once=True)
+        self.evaluator = StragglerTolerantEvaluator(processes=2, speculation_factor=2.0)
+        self.solution_list[0].variables[0] = 4.5
+
+        result = self.evaluator.evaluate(self.solution_list, self.problem)
+
+        # The hung copy is still waiting for the release, so the result comes from the speculative one
+        self.assertEqual([4.5, 2.3], result[0].objectives)
+
+    def test_should_losing_copies_finish_without_restarting_their_worker(self):
+        self.problem = MockedStragglerProblem(only_once=True)
+        self.evaluator = StragglerTolerantEvaluator(processes=2, speculation_factor=2.0)
+        self.solution_list[0].variables[0] = 4.5
+
+        self.evaluator.evaluate(self.solution_list, self.problem)
+        processes = [worker.process.pid for worker in self.evaluator.workers]
+        self.problem.release()
+
+        other_list = [self.problem.create_solution() for _ in range(4)]
+        for i, solution in enumerate(other_list):
+            solution.variables[0] = -i * 0.5
+        result = self.evaluator.evaluate(other_list, self.problem)
+
+        self.assertEqual(processes, [worker.process.pid for worker in self.evaluator.workers])
+        self.assertEqual([0.0, -0.5, -1.0, -1.5], [solution.objectives[0] for solution in result])
+
+
+SIMULATOR = [sys.executable, os.path.join(os.path.dirname(__file__), 'simulator.py')]
+
+
+class ExternalSimulatorEvaluatorTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = MockedProblem()
+        self.solution_list = [self.problem.create_solution() for _ in range(20)]
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.evaluator.shutdown()
+        self.directory.cleanup()
+
+    def test_should_evaluate_use_the_simulator(self):
+        self.evaluator = ExternalSimulatorEvaluator(SIMULATOR, processes=2, pipeline_depth=3)
+
+        result = self.evaluator.evaluate(self.solution_list, self.problem)
+
+        self.assertIs(self.solution_list, result)
+        for solution in self.solution_list:
+            self.assertAlmostEqual(sum(solution.variables), solution.objectives[0])
+            self.assertAlmostEqual(sum(x ** 2 for x in solution.variables), solution.objectives[1])
+
+    def test_should_the_processes_be_reused(self):
+        launches = os.path.join(self.directory.name, 'launches')
+        self.evaluator = ExternalSimulatorEvaluator(SIMULATOR + ['--launch-log', launches], processes=2)
+
+        self.evaluator.evaluate(self.solution_list, self.problem)
+        pids = [worker.process.pid for worker in self.evaluator.workers]
+        self.evaluator.evaluate(self.solution_list, self.problem)
+
+        self.assertEqual(2, self._number_of_launches(launches))
+        self.assertEqual(pids, [worker.process.pid for worker in self.evaluator.workers])
+
+    def test_should_the_constraints_be_read(self):
+        self.problem.number_of_constraints = 1
+        self.evaluator = ExternalSimulatorEvaluator(SIMULATOR + ['--number-of-constraints', '1'], processes=1)
+
+        self.evaluator.evaluate(self.solution_list, self.problem)
+
+        for solution in self.solution_list:
+            self.assertAlmostEqual(1.0 - solution.variables[0], solution.constraints[0])
+
+    def test_should_crashed_processes_be_restarted(self):
+        self.evaluator = ExternalSimulatorEvaluator(SIMULATOR + ['--crash-after', '3'], processes=2, pipeline_depth=2)
+
+        self.evaluator.evaluate(self.solution_list, self.problem)
+
+        for solution in self.solution_list:
+            self.assertAlmostEqual(sum(solution.variables), solution.objectives[0])
+
+    def test_should_evaluate_raise_an_exception_if_a_solution_always_crashes_the_simulator(self):
+        self.evaluator = ExternalSimulatorEvaluator(SIMULATOR + ['--crash-above', '10.0'], processes=2, max_restarts=2)
+        self.solution_list[5].variables[0] = 20.0
+
+        with self.assertRaises(RuntimeError):
+            self.evaluator.evaluate(self.solution_list, self.problem)
+
+    def test_should_hung_processes_be_killed_and_restarted(self):
+        launches = os.path.join(self.directory.name, 'launches')
+        marker = os.path.join(self.directory.name, 'hung')
+        self.evaluator = ExternalSimulatorEvaluator(
+            SIMULATOR + ['--hang-above', '10.0', '--hang-once', marker, '--launch-log', launches],
+            processes=2, timeout=0.5)
+        self.solution_list[5].variables[0] = 20.0
+
+        self.evaluator.evaluate(self.solution_list, self.problem)
+        # Both processes answer requests of the second call, so the restarted one has logged its launch
+        self.evaluator.evaluate(self.solution_list, self.problem)
+
+        self.assertEqual(3, self._number_of_launches(launches))
+        for solution in self.solution_list:
+            self.assertAlmostEqual(sum(solution.variables), solution.objectives[0])
+
+    def test_should_evaluate_raise_an_exception_if_a_solution_always_hangs_the_simulator(self):
+        launches = os.path.join(self.directory.name, 'launches')
+        self.evaluator = ExternalSimulatorEvaluator(SIMULATOR + ['--hang-above', '10.0', '--launch-log', launches],
+                                                    processes=2, max_restarts=2, timeout=0.2)
+        self.solution_list[5].variables[0] = 20.0
+
+        with self.assertRaises(RuntimeError):
+            self.evaluator.evaluate(self.solution_list, self.problem)
+        self.assertEqual(4, self._number_of_launches(launches))
+
+    @staticmethod
+    def _number_of_launches(launches: str) -> int:
+        with open(launches) as log:
+            return len(log.readlines())
+
+
+class EvaluateVariablesTestCases(unittest.TestCase):
+
+    def test_should_evaluate_variables_return_the_objectives_and_constraints(self):
+        problem = MockedCountingProblem()
+
+        objectives, constraints = _evaluate_variables([[1.0, 2.0, 3.0], [0.0, 0.0, 1.0]], problem)
+
+        self.assertEqual([[6.0, 2.3], [1.0, 2.3]], objectives)
+        self.assertEqual([[], []], constraints)
+
+    def test_should_evaluate_variables_use_the_batch_evaluation(self):
+        problem = MockedBatchProblem()
+
+        objectives, _ = _evaluate_variables([[1.0, 2.0, 3.0]], problem)
+
+        self.assertEqual(1, problem.number_of_batch_calls)
+
+
+@unittest.skipIf(Client is None, 'distributed is not installed')
+class DaskEvaluatorTestCases(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = Client(LocalCluster(n_workers=2, threads_per_worker=1, processes=False))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+
+    def test_should_the_futures_mode_evaluate_the_solutions(self):
+        problem = MockedCountingProblem()
+        solution_list = [problem.create_solution() for _ in range(10)]
+        evaluator = DaskEvaluator(client=self.client, batch_size=3)
+
+        result = evaluator.evaluate(solution_list, problem)
+
+        self.assertIs(solution_list, result)
+        for solution in solution_list:
+            self.assertAlmostEqual(sum(solution.variables), solution.objectives[0])
+
+    def test_should_the_problem_be_scattered_only_once(self):
+        problem = MockedCountingProblem()
+        evaluator = DaskEvaluator(client=self.client)
+
+        evaluator.evaluate([problem.create_solution() for _ in range(5)], problem)
+        problem_future = evaluator._problem_future
+        evaluator.evaluate([problem.create_solution() for _ in range(5)], problem)
+
+        self.assertIs(problem_future, evaluator._problem_future)
+
+    def test_should_the_problem_be_scattered_again_if_it_is_replaced(self):
+        problem = MockedCountingProblem()
+        evaluator = DaskEvaluator(client=self.client, batch_size=4)
+
+        evaluator.evaluate([problem.create_solution() for _ in range(5)], problem)
+        problem_future = evaluator._problem_future
+        result = evaluator.evaluate([problem.create_solution() for _ in range(5)], MockedProblem())
+
+        self.assertIsNot(problem_future, evaluator._problem_future)
+        self.assertTrue(all(solution.objectives == [1.2, 2.3] for solution in result))
+
+
+class MockedBroadcast:
+
+    def __init__(self, value):
+        self.value = value
+
+
+class EvaluatePartitionTestCases(unittest.TestCase):
+
+    def test_should_evaluate_partition_evaluate_all_the_rows_with_one_batch_call(self):
+        problem = MockedBatchProblem()
+        rows = iter(numpy.array([[1.0, 2.0, 3.0], [0.0, 0.0, 1.0]]))
+
+        result = list(_evaluate_partition(rows, MockedBroadcast(problem)))
+
+        self.assertEqual([([6.0, 2.3], []), ([1.0, 2.3], [])], result)
+        self.assertEqual(1, problem.number_of_batch_calls)
+
+    def test_should_evaluate_partition_accept_empty_partitions(self):
+        self.assertEqual([], list(_evaluate_partition(iter([]), MockedBroadcast(MockedProblem()))))
+
+
+@unittest.skipIf(SparkContext is None, 'pyspark is not installed')
+class SparkEvaluatorTestCases(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.spark_context = SparkContext.getOrCreate(conf=SparkConf().setAppName('jmetalpy').setMaster('local[2]'))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.spark_context.stop()
+
+    def test_should_evaluate_the_solutions_in_place(self):
+        problem = MockedCountingProblem()
+        solution_list = [problem.create_solution() for _ in range(10)]
+        evaluator = SparkEvaluator(spark_context=self.spark_context)
+
+        result = evaluator.evaluate(solution_list, problem)
+
+        self.assertIs(solution_list, result)
+        for solution in solution_list:
+            self.assertAlmostEqual(sum(solution.variables), solution.objectives[0])
+
+    def test_should_batch_problems_be_evaluated_in_place(self):
+        problem = MockedBatchProblem()
+        solution_list = [problem.create_solution() for _ in range(10)]
+        evaluator = SparkEvaluator(spark_context=self.spark_context)
+
+        evaluator.evaluate(solution_list, problem)
+
+        for solution in solution_list:
+            self.assertAlmostEqual(sum(solution.variables), solution.objectives[0])
+            self.assertEqual(2.3, solution.objectives[1])
+
+    def test_should_the_problem_be_broadcast_only_once(self):
+        problem = MockedCountingProblem()
+        evaluator = SparkEvaluator(spark_context=self.spark_context)
+
+        evaluator.evaluate([problem.create_solution() for _ in range(5)], problem)
+        broadcast_problem = evaluator._broadcast_problem
+        evaluator.evaluate([problem.create_solution() for _ in range(5)], problem)
+
+        self.assertIs(broadcast_problem, evaluator._broadcast_problem)
+
+    def test_should_the_problem_be_broadcast_again_if_it_is_replaced(self):
+        problem = MockedCountingProblem()
+        evaluator = SparkEvaluator(spark_context=self.spark_context)
+
+        evaluator.evaluate([problem.create_solution() for _ in range(5)], problem)
+        broadcast_problem = evaluator._broadcast_problem
+        result = evaluator.evaluate([problem.create_solution() for _ in range(5)], MockedProblem())
+
+        self.assertIsNot(broadcast_problem, evaluator._broadcast_problem)
+        self.assertTrue(all(solution.objectives == [1.2, 2.3] for solution in result))
+
+    def test_should_the_spark_context_be_reused(self):
+        evaluator = SparkEvaluator(processes=2)
+
+        self.assertIs(self.spark_context, evaluator.spark_context)
+        self.assertIs(evaluator.spark_context, SparkEvaluator(processes=2).spark_context)
+
+
+class MockedSleepingProblem(MockedProblem):
+
+    def evaluate(self, solution: FloatSolution):
+        time.sleep(0.01)
+        return super(MockedSleepingProblem, self).evaluate(solution)
+
+
+class MockedObserver(Observer):
+
+    def __init__(self):
+        self.data = None
+
+    def update(self, *args, **kwargs):
+        self.data = kwargs
+
+
+class InstrumentedEvaluatorTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = MockedSleepingProblem()
+        self.solution_list = [self.problem.create_solution() for _ in range(10)]
+
+    def test_should_evaluate_record_the_latency_of_each_evaluation(self):
+        evaluator = InstrumentedEvaluator(SequentialEvaluator())
+
+        result = evaluator.evaluate(self.solution_list, self.problem)
+        statistics = evaluator.get_statistics()
+
+        self.assertIs(self.solution_list, result)
+        self.assertEqual(10, statistics['evaluations'])
+        self.assertEqual(1, statistics['batches'])
+        self.assertEqual(10, statistics['latency_histogram'][0].sum())
+        self.assertGreaterEqual(statistics['evaluation_time'], 0.1)
+        self.assertLess(statistics['cpu_time'], statistics['evaluation_time'])
+        self.assertAlmostEqual(1.0 - statistics['evaluation_time'] / statistics['wall_time'],
+                               statistics['idle_fraction'])
+        self.assertGreater(statistics['evaluations_per_second'], 0)
+        self.assertTrue(all(solution.objectives == [1.2, 2.3] for solution in result))
+        self.assertTrue(all('evaluation_time' not in solution.attributes for solution in result))
+
+    def test_should_the_latencies_be_measured_in_the_worker_processes(self):
+        evaluator = InstrumentedEvaluator(MultiprocessEvaluator(processes=2))
+
+        result = evaluator.evaluate(self.solution_list, self.problem)
+
+        self.assertEqual(2, evaluator.number_of_workers)
+        self.assertTrue(all(solution.objectives == [1.2, 2.3] for solution in result))
+        self.assertGreaterEqual(evaluator.evaluation_time, 0.1)
+        self.assertTrue(all('evaluation_time' not in solution.attributes for solution in result))
+
+    def test_should_the_latencies_be_approximated_if_the_evaluator_does_not_return_them(self):
+        problem = MockedBatchProblem()
+        evaluator = InstrumentedEvaluator(SequentialEvaluator())
+
+        evaluator.evaluate(self.solution_list, problem)
+
+        self.assertEqual(1, problem.number_of_batch_calls)
+        self.assertEqual(10, evaluator.latency_histogram.sum())
+        self.assertAlmostEqual(evaluator.wall_time, evaluator.evaluation_time)
+
+    def test_should_the_changes_of_a_dynamic_problem_reach_the_inner_evaluator(self):
+        problem = FDA1(number_of_variables=3)
+        solution_list = [problem.create_solution() for _ in range(5)]
+        evaluator = InstrumentedEvaluator(CachingEvaluator())
+
+        evaluator.evaluate(solution_list, problem)
+        objectives = [list(solution.objectives) for solution in solution_list]
+        problem.update(COUNTER=30)
+        evaluator.evaluate(solution_list, problem)
+
+        self.assertIsInstance(evaluator.evaluator._problem, DynamicProblem)
+        self.assertEqual(0, evaluator.evaluator.hits)
+        self.assertNotEqual(objectives, [solution.objectives for solution in solution_list])
+
+        problem.clear_changed()
+        evaluator.evaluate(solution_list, problem)
+
+        self.assertEqual(5, evaluator.evaluator.hits)
+
+    def test_should_the_statistics_be_published_through_the_algorithm_observable(self):
+        problem = MockedProblem()
+        algorithm = NSGAII(problem, 10, 10, mutation=PolynomialMutation(0.1), crossover=SBXCrossover(0.9),
+                           termination_criterion=StoppingByEvaluations(30),
+                           population_evaluator=InstrumentedEvaluator(SequentialEvaluator()))
+        observer = MockedObserver()
+        algorithm.observable.register(observer)
+
+        algorithm.run()
+
+        self.assertEqual(30, observer.data['EVALUATOR_STATISTICS']['evaluations'])
+
+
+class SurrogateEvaluatorTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = MockedCountingProblem()
+        self.evaluator = SurrogateEvaluator(number_of_real_evaluations=3, minimum_samples=10)
+
+    def test_should_all_the_solutions_be_evaluated_until_the_model_has_enough_samples(self):
+        solution_list = [self.problem.create_solution() for _ in range(10)]
+
+        result = self.evaluator.evaluate(solution_list, self.problem)
+
+        self.assertIs(solution_list, result)
+        self.assertEqual(10, self.problem.number_of_evaluations)
+        self.assertEqual(10, self.evaluator.surrogate.number_of_samples)
+
+    def test_should_only_the_selected_solutions_be_evaluated(self):
+        training_list = [self.problem.create_solution() for _ in range(10)]
+        self.evaluator.evaluate(training_list, self.problem)
+        solution_list = copy.deepcopy(training_list[:8])
+
+        self.evaluator.evaluate(solution_list, self.problem)
+
+        predicted = [solution for solution in solution_list if solution.attributes.get('surrogate')]
+        self.assertEqual(13, self.problem.number_of_evaluations)
+        self.assertEqual(5, len(predicted))
+        self.assertEqual(13, self.evaluator.surrogate.number_of_samples)
+        for solution in predicted:
+            self.assertAlmostEqual(sum(solution.variables), solution.objectives[0], delta=1e-2)
+
+    def test_should_the_best_predicted_solutions_be_selected(self):
+        self.evaluator.evaluate([self.problem.create_solution() for _ in range(10)], self.problem)
+        solution_list = [self.problem.create_solution() for _ in range(8)]
+        for i, solution in enumerate(solution_list):
+            solution.variables = [i - 4.0, 0.0, 0.0]
+
+        self.evaluator.evaluate(solution_list, self.problem)
+
+        self.assertEqual([False, False, False, True, True, True, True, True],
+                         [solution.attributes.get('surrogate', False) for solution in solution_list])
+
+    def test_should_the_most_uncertain_solutions_be_selected(self):
+        evaluator = SurrogateEvaluator(number_of_real_evaluations=1, minimum_samples=10,
+                                       criterion=ScreeningCriterionType.UNCERTAINTY)
+        training_list = [self.problem.create_solution() for _ in range(10)]
+        for i, solution in enumerate(training_list):
+            solution.variables = [-5.0 + i * 0.5, 0.0, 0.0]
+        evaluator.evaluate(training_list, self.problem)
+
+        solution_list = [copy.deepcopy(training_list[2]), copy.deepcopy(training_list[2])]
+        solution_list[1].variables = [5.0, 5.0, 5.0]
+        evaluator.evaluate(solution_list, self.problem)
+
+        self.assertTrue(solution_list[0].attributes['surrogate'])
+        self.assertNotIn('surrogate', solution_list[1].attributes)
+
+    def test_should_evaluate_surrogates_evaluate_only_the_predicted_solutions(self):
+        training_list = [self.problem.create_solution() for _ in range(10)]
+        self.evaluator.evaluate(training_list, self.problem)
+        solution_list = copy.deepcopy(training_list[:8])
+        self.evaluator.evaluate(solution_list, self.problem)
+
+        number_of_predicted = self.evaluator.evaluate_surrogates(solution_list, self.problem)
+
+        self.assertEqual(5, number_of_predicted)
+        self.assertEqual(18, self.problem.number_of_evaluations)
+        self.assertEqual(18, self.evaluator.real_evaluations)
+        self.assertEqual(18, self.evaluator.surrogate.number_of_samples)
+        for solution in solution_list:
+            self.assertNotIn('surrogate', solution.attributes)
+            self.assertNotIn('surrogate_uncertainty', solution.attributes)
+            self.assertEqual(sum(solution.variables), solution.objectives[0])
+
+    def test_should_the_result_of_an_algorithm_not_contain_predicted_solutions(self):
+        algorithm = NSGAII(self.problem, 10, 10, mutation=PolynomialMutation(0.1), crossover=SBXCrossover(0.9),
+                           termination_criterion=StoppingByEvaluations(60), population_evaluator=self.evaluator)
+
+        algorithm.run()
+
+        self.assertGreater(self.evaluator.predictions, 0)
+        for solution in algorithm.get_result():
+            self.assertNotIn('surrogate', solution.attributes)
+            self.assertEqual(sum(solution.variables), solution.objectives[0])
+
 
 if __name__ == "__main__":
     unittest.main()
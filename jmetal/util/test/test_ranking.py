@@ -1,7 +1,10 @@
+import random
 import unittest
 
 from jmetal.core.solution import Solution
-from jmetal.util.ranking import FastNonDominatedRanking, StrengthRanking, Ranking
+from jmetal.util.comparator import DominanceComparator
+from jmetal.util.ranking import FastNonDominatedRanking, StrengthRanking, Ranking, EfficientNonDominatedRanking, \
+    DivideAndConquerRanking, IncrementalNonDominatedRanking
 
 
 class FastNonDominatedRankingTestCases(unittest.TestCase):
@@ -160,6 +163,178 @@ class FastNonDominatedRankingTestCases(unittest.TestCase):
         self.assertEqual(solution2, ranking[1][0])
 
 
+class PairwiseDominanceComparator(DominanceComparator):
+    """ Same comparator, but not batched so that the rankings fall back to the pairwise comparisons. """
+
+    @property
+    def batched(self) -> bool:
+        return False
+
+
+def random_solutions(number_of_solutions: int, number_of_objectives: int, number_of_constraints: int = 0,
+                     values: int = 5):
+    solutions = []
+    for _ in range(number_of_solutions):
+        solution = Solution(2, number_of_objectives, number_of_constraints)
+        solution.objectives = [random.randint(0, values) for _ in range(number_of_objectives)]
+        solution.constraints = [random.choice([0, 0, -1, -2]) for _ in range(number_of_constraints)]
+        solutions.append(solution)
+
+    return solutions
+
+
+class VectorizedFastNonDominatedRankingTestCases(unittest.TestCase):
+
+    def assert_same_ranking(self, solutions, block_size=None, k=None):
+        expected = FastNonDominatedRanking(PairwiseDominanceComparator()).compute_ranking(solutions, k)
+        expected_ranks = [solution.attributes['dominance_ranking'] for solution in solutions]
+
+        ranking = FastNonDominatedRanking(block_size=block_size)
+        fronts = ranking.compute_ranking(solutions, k)
+
+        self.assertEqual([[id(s) for s in front] for front in expected], [[id(s) for s in front] for front in fronts])
+        self.assertEqual(expected_ranks, [solution.attributes['dominance_ranking'] for solution in solutions])
+        self.assertEqual(len(solutions) * (len(solutions) - 1) // 2, ranking.number_of_comparisons)
+
+    def test_should_vectorized_ranking_be_equal_to_the_pairwise_ranking(self):
+        random.seed(1)
+        for number_of_objectives in (2, 3, 5):
+            self.assert_same_ranking(random_solutions(150, number_of_objectives))
+
+    def test_should_vectorized_ranking_be_equal_to_the_pairwise_ranking_with_constraints(self):
+        random.seed(2)
+        self.assert_same_ranking(random_solutions(150, 3, number_of_constraints=2))
+
+    def test_should_vectorized_ranking_be_equal_to_the_pairwise_ranking_when_computed_in_blocks(self):
+        random.seed(3)
+        self.assert_same_ranking(random_solutions(101, 2, number_of_constraints=1), block_size=7)
+
+    def test_should_vectorized_ranking_be_equal_to_the_pairwise_ranking_when_k_is_given(self):
+        random.seed(4)
+        self.assert_same_ranking(random_solutions(100, 2), k=30)
+
+
+class ObjectiveSortingRankingTestCases(unittest.TestCase):
+
+    def assert_same_ranking(self, ranking, solutions, k=None):
+        expected = FastNonDominatedRanking().compute_ranking(solutions, k)
+        expected_ranks = [solution.attributes['dominance_ranking'] for solution in solutions]
+
+        fronts = ranking.compute_ranking(solutions, k)
+
+        self.assertEqual([sorted(map(id, front)) for front in expected], [sorted(map(id, front)) for front in fronts])
+        if k is None:
+            self.assertEqual(expected_ranks, [solution.attributes['dominance_ranking'] for solution in solutions])
+        else:
+            # The solutions out of the returned fronts are ranked right after them
+            self.assertEqual([min(rank, len(fronts)) for rank in expected_ranks],
+                             [solution.attributes['dominance_ranking'] for solution in solutions])
+
+    def test_should_rankings_return_an_empty_list_of_subfronts_if_the_solution_list_is_empty(self):
+        for ranking in (EfficientNonDominatedRanking(), DivideAndConquerRanking()):
+            self.assertEqual([], ranking.compute_ranking([]))
+
+    def test_should_rankings_be_equal_to_the_fast_non_dominated_ranking(self):
+        random.seed(5)
+        for number_of_objectives in (1, 2, 3, 4, 6):
+            for values in (3, 1000):
+                solutions = random_solutions(200, number_of_objectives, number_of_constraints=1, values=values)
+
+                self.assert_same_ranking(EfficientNonDominatedRanking(), solutions)
+                self.assert_same_ranking(DivideAndConquerRanking(), solutions)
+
+    def test_should_divide_and_conquer_ranking_be_equal_to_the_fast_non_dominated_ranking_in_every_branch(self):
+        random.seed(6)
+        for number_of_objectives in (4, 5):
+            solutions = random_solutions(150, number_of_objectives, values=4)
+
+            self.assert_same_ranking(DivideAndConquerRanking(brute_force_threshold=1), solutions)
+
+    def test_should_rankings_return_the_same_fronts_when_k_is_given(self):
+        random.seed(7)
+        for number_of_objectives in (2, 3, 5):
+            solutions = random_solutions(200, number_of_objectives, number_of_constraints=1, values=20)
+
+            for k in (1, 50, 199):
+                self.assert_same_ranking(EfficientNonDominatedRanking(), solutions, k)
+                self.assert_same_ranking(DivideAndConquerRanking(), solutions, k)
+
+
+class IncrementalNonDominatedRankingTestCases(unittest.TestCase):
+
+    def assert_same_ranking(self, ranking, solutions):
+        ranks = [solution.attributes['dominance_ranking'] for solution in solutions]
+
+        expected = FastNonDominatedRanking().compute_ranking(solutions)
+
+        self.assertEqual([sorted(map(id, front)) for front in expected],
+                         [sorted(map(id, front)) for front in ranking.ranked_sublists])
+        self.assertEqual([solution.attributes['dominance_ranking'] for solution in solutions], ranks)
+
+    def test_should_add_return_the_rank_of_the_new_solution(self):
+        ranking = IncrementalNonDominatedRanking()
+        solution1 = Solution(2, 2)
+        solution1.objectives = [2, 2]
+        solution2 = Solution(2, 2)
+        solution2.objectives = [3, 3]
+        solution3 = Solution(2, 2)
+        solution3.objectives = [1, 1]
+
+        self.assertEqual(0, ranking.add(solution1))
+        self.assertEqual(1, ranking.add(solution2))
+        self.assertEqual(0, ranking.add(solution3))
+
+        self.assertEqual(3, ranking.get_number_of_subfronts())
+        self.assertEqual(0, solution3.attributes['dominance_ranking'])
+        self.assertEqual(1, solution1.attributes['dominance_ranking'])
+        self.assertEqual(2, solution2.attributes['dominance_ranking'])
+
+    def test_should_remove_promote_the_dominated_solutions(self):
+        ranking = IncrementalNonDominatedRanking()
+        solution1 = Solution(2, 2)
+        solution1.objectives = [1, 1]
+        solution2 = Solution(2, 2)
+        solution2.objectives = [2, 2]
+        solution3 = Solution(2, 2)
+        solution3.objectives = [3, 3]
+        ranking.compute_ranking([solution1, solution2, solution3])
+
+        ranking.remove(solution1)
+
+        self.assertEqual(2, ranking.get_number_of_subfronts())
+        self.assertEqual(0, solution2.attributes['dominance_ranking'])
+        self.assertEqual(1, solution3.attributes['dominance_ranking'])
+
+    def test_should_insertions_and_removals_keep_the_ranking_equal_to_the_fast_non_dominated_ranking(self):
+        random.seed(8)
+        solutions = random_solutions(60, 3, number_of_constraints=1, values=6)
+        ranking = IncrementalNonDominatedRanking()
+        ranking.compute_ranking(solutions)
+
+        for _ in range(200):
+            if random.random() < 0.5 and len(solutions) > 1:
+                ranking.remove(solutions.pop(random.randrange(len(solutions))))
+            else:
+                solution = random_solutions(1, 3, number_of_constraints=1, values=6)[0]
+                ranking.add(solution)
+                solutions.append(solution)
+
+            self.assertTrue(ranking.is_ranking_of(solutions))
+            self.assert_same_ranking(ranking, solutions)
+
+    def test_should_is_ranking_of_detect_reevaluated_solutions(self):
+        solutions = random_solutions(10, 2)
+        ranking = IncrementalNonDominatedRanking()
+        ranking.compute_ranking(solutions)
+
+        self.assertTrue(ranking.is_ranking_of(solutions))
+        self.assertFalse(ranking.is_ranking_of(solutions[1:]))
+
+        solutions[0].objectives = [-1, -1]
+
+        self.assertFalse(ranking.is_ranking_of(solutions))
+
+
 class StrengthRankingTestCases(unittest.TestCase):
 
     def setUp(self):
@@ -236,5 +411,18 @@ class StrengthRankingTestCases(unittest.TestCase):
         self.assertEqual(0, solution5.attributes['strength_ranking'])
 
 
+    def test_should_vectorized_ranking_be_equal_to_the_pairwise_ranking(self):
+        random.seed(9)
+        for number_of_constraints in (0, 1):
+            solutions = random_solutions(120, 3, number_of_constraints=number_of_constraints, values=4)
+
+            expected = StrengthRanking(PairwiseDominanceComparator()).compute_ranking(solutions)
+            expected_ranks = [solution.attributes['strength_ranking'] for solution in solutions]
+
+            fronts = StrengthRanking(block_size=16).compute_ranking(solutions)
+
+            self.assertEqual([list(map(id, front)) for front in expected], [list(map(id, front)) for front in fronts])
+            self.assertEqual(expected_ranks, [solution.attributes['strength_ranking'] for solution in solutions])
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,9 @@
+import random
 import unittest
 
 from jmetal.core.solution import Solution
-from jmetal.util.density_estimator import KNearestNeighborDensityEstimator
-from jmetal.util.ranking import StrengthRanking, FastNonDominatedRanking
+from jmetal.util.density_estimator import KNearestNeighborDensityEstimator, CrowdingDistance
+from jmetal.util.ranking import StrengthRanking, FastNonDominatedRanking, IncrementalNonDominatedRanking
 from jmetal.util.replacement import RankingAndDensityEstimatorReplacement
 
 
@@ -169,6 +170,37 @@ class RankingAndDensityEstimatorReplacementTestCases(unittest.TestCase):
 
 
 
+    def test_should_steady_state_replacement_with_an_incremental_ranking_keep_the_ranking_of_the_population(self):
+        random.seed(1)
+
+        def new_solution():
+            solution = Solution(2, 2)
+            solution.objectives = [random.random(), random.random()]
+            return solution
+
+        ranking = IncrementalNonDominatedRanking()
+        replacement = RankingAndDensityEstimatorReplacement(ranking, CrowdingDistance())
+        solution_list = [new_solution() for _ in range(20)]
+
+        for _ in range(50):
+            offspring = new_solution()
+            join_population = solution_list + [offspring]
+
+            solution_list = replacement.replace(solution_list, [offspring])
+            discarded = [solution for solution in join_population if all(solution is not s for s in solution_list)]
+            ranks = [solution.attributes['dominance_ranking'] for solution in solution_list]
+            discarded_rank = discarded[0].attributes['dominance_ranking']
+
+            self.assertEqual(20, len(solution_list))
+            self.assertEqual(1, len(discarded))
+            self.assertTrue(ranking.is_ranking_of(solution_list))
+
+            expected_ranking = FastNonDominatedRanking()
+            expected_ranking.compute_ranking(join_population)
+            self.assertEqual(expected_ranking.get_number_of_subfronts() - 1, discarded_rank)
+
+            FastNonDominatedRanking().compute_ranking(solution_list)
+            self.assertEqual([solution.attributes['dominance_ranking'] for solution in solution_list], ranks)
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+import numpy
+
+from jmetal.util.surrogate import KrigingSurrogate, non_dominated_levels
+
+
+class KrigingSurrogateTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.surrogate = KrigingSurrogate([0.0, 0.0], [1.0, 1.0])
+        self.x = numpy.random.RandomState(1).rand(30, 2)
+        self.y = numpy.column_stack((self.x.sum(axis=1), numpy.sin(3 * self.x[:, 0])))
+
+    def test_should_the_model_interpolate_the_samples(self):
+        self.surrogate.update(self.x, self.y)
+
+        mean, std = self.surrogate.predict(self.x)
+
+        self.assertEqual(30, self.surrogate.number_of_samples)
+        self.assertTrue(numpy.allclose(self.y, mean, atol=1e-3))
+        self.assertTrue(numpy.all(std < 1e-2))
+
+    def test_should_the_model_be_updated_incrementally(self):
+        self.surrogate.update(self.x[:15], self.y[:15])
+        self.surrogate.update(self.x[15:], self.y[15:])
+
+        mean, _ = self.surrogate.predict([[0.5, 0.5]])
+
+        self.assertEqual(30, self.surrogate.number_of_samples)
+        self.assertAlmostEqual(1.0, mean[0, 0], delta=0.05)
+
+    def test_should_the_uncertainty_grow_far_from_the_samples(self):
+        self.surrogate.update(self.x[self.x[:, 0] < 0.5], self.y[self.x[:, 0] < 0.5])
+
+        _, std = self.surrogate.predict([[0.25, 0.5], [5.0, 5.0]])
+
+        self.assertLess(std[0, 0], std[1, 0])
+
+    def test_should_the_oldest_samples_be_discarded(self):
+        surrogate = KrigingSurrogate([0.0, 0.0], [1.0, 1.0], maximum_samples=10)
+
+        surrogate.update(self.x, self.y)
+
+        self.assertEqual(10, surrogate.number_of_samples)
+        self.assertTrue(numpy.allclose(self.x[-10:], surrogate.x))
+
+
+class NonDominatedLevelsTestCases(unittest.TestCase):
+
+    def test_should_non_dominated_levels_return_the_fronts(self):
+        objectives = numpy.array([[1.0, 4.0], [2.0, 2.0], [2.0, 5.0], [3.0, 3.0], [4.0, 1.0], [5.0, 5.0]])
+
+        self.assertEqual([0, 0, 1, 1, 0, 2], non_dominated_levels(objectives).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()